@@ -20,7 +20,6 @@ PyInstaller.__main__.run([
     '--hidden-import=matplotlib',
     '--hidden-import=matplotlib.backends.backend_tkagg',
     '--hidden-import=matplotlib.colors',
-    '--hidden-import=seaborn',
     
     # Excel/CSV support
     '--hidden-import=openpyxl',
@@ -31,9 +30,13 @@ PyInstaller.__main__.run([
     '--hidden-import=pyVim',
     '--hidden-import=pyVim.connect',
     '--hidden-import=pyVmomi.vim',
-    '--hidden-import=requests',
     '--hidden-import=ssl',
     
+    # Optional accelerators (JIT kernels, Arrow CSV export) - the app falls back to numpy/pandas without them
+    '--hidden-import=numba',
+    '--hidden-import=pyarrow',
+    '--hidden-import=pyarrow.csv',
+    
     # PDF export support
     '--hidden-import=reportlab',
     '--hidden-import=reportlab.lib',
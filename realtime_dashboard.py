@@ -17,8 +17,8 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.colors import LinearSegmentedColormap
 import sqlite3
+import logging
 import threading
-import time
 import queue
 from collections import deque
 
@@ -32,6 +32,18 @@ except ImportError:
     VCENTER_AVAILABLE = False
     print("WARNING: vCenter integration not available. Install pyvmomi for full functionality.")
 
+logger = logging.getLogger(__name__)
+
+# Dotted-quad host names are kept whole rather than cut at the first dot
+_IPV4_RE = re.compile(r'^\d+\.\d+\.\d+\.\d+$')
+
+# Per-host block of the live metrics panel, bound once instead of re-parsing f-strings every refresh
+_HOST_METRICS_BLOCK = ("{hostname} - {status}\n"
+                       "  Current: {current:.3f}%\n"
+                       "  5min Avg: {avg:.3f}%\n"
+                       "  5min Max: {max:.3f}%\n"
+                       "  Last Update: {updated:%H:%M:%S}\n\n").format
+
 
 class RealTimeDatabase:
     """SQLite database manager for real-time monitoring data"""
@@ -93,7 +105,7 @@ class RealTimeDatabase:
         
         conn.commit()
         conn.close()
-        print("DEBUG: Real-time database initialized")
+        logger.debug("Real-time database initialized")
     
     def insert_performance_data(self, hostname, cpu_ready_percent, cpu_ready_sum, source='realtime', interval_seconds=20):
         """Insert performance data point with local timezone"""
@@ -112,7 +124,7 @@ class RealTimeDatabase:
             conn.commit()
             conn.close()
         except Exception as e:
-            print(f"DEBUG: Error inserting performance data: {e}")
+            logger.warning("Error inserting performance data: %s", e)
     
     def insert_alert(self, hostname, alert_type, severity, message, value=None, threshold=None):
         """Insert alert"""
@@ -128,7 +140,7 @@ class RealTimeDatabase:
             conn.commit()
             conn.close()
         except Exception as e:
-            print(f"DEBUG: Error inserting alert: {e}")
+            logger.warning("Error inserting alert: %s", e)
     
     def get_recent_performance_data(self, hostname=None, minutes=60):
         """Get recent performance data"""
@@ -152,10 +164,11 @@ class RealTimeDatabase:
             
             if not df.empty:
                 df['timestamp'] = pd.to_datetime(df['timestamp'])
+                df['hostname'] = df['hostname'].astype('category')
             
             return df
         except Exception as e:
-            print(f"DEBUG: Error getting performance data: {e}")
+            logger.warning("Error getting performance data: %s", e)
             return pd.DataFrame()
     
     def get_active_alerts(self, hostname=None):
@@ -180,7 +193,7 @@ class RealTimeDatabase:
             conn.close()
             return df
         except Exception as e:
-            print(f"DEBUG: Error getting alerts: {e}")
+            logger.warning("Error getting alerts: %s", e)
             return pd.DataFrame()
     
     def acknowledge_alert(self, alert_id):
@@ -192,7 +205,7 @@ class RealTimeDatabase:
             conn.commit()
             conn.close()
         except Exception as e:
-            print(f"DEBUG: Error acknowledging alert: {e}")
+            logger.warning("Error acknowledging alert: %s", e)
     
     def resolve_alert(self, alert_id):
         """Resolve an alert"""
@@ -203,7 +216,7 @@ class RealTimeDatabase:
             conn.commit()
             conn.close()
         except Exception as e:
-            print(f"DEBUG: Error resolving alert: {e}")
+            logger.warning("Error resolving alert: %s", e)
     
     def cleanup_old_data(self, days=30):
         """Clean up old performance data"""
@@ -224,9 +237,9 @@ class RealTimeDatabase:
             deleted_perf = cursor.rowcount
             conn.commit()
             conn.close()
-            print(f"DEBUG: Cleaned up {deleted_perf} old records")
+            logger.debug("Cleaned up %s old records", deleted_perf)
         except Exception as e:
-            print(f"DEBUG: Error cleaning up data: {e}")
+            logger.warning("Error cleaning up data: %s", e)
 
 
 class RealTimeCollector:
@@ -240,7 +253,14 @@ class RealTimeCollector:
         self.running = False
         self.collection_thread = None
         self.collection_interval = 20  # seconds
+        self._stop_event = threading.Event()  # Wakes the collection loop out of its interval wait
         self.data_queue = queue.Queue()
+        
+        # Host inventory kept current through PropertyCollector deltas instead of re-listing each cycle
+        self.host_collector = None
+        self.host_container = None
+        self.inventory_version = ''
+        self.host_inventory = {}
     
     def start_collection(self):
         """Start real-time data collection"""
@@ -248,16 +268,21 @@ class RealTimeCollector:
             raise Exception("vCenter connection required for real-time monitoring")
         
         self.running = True
+        self._stop_event.clear()
         self.collection_thread = threading.Thread(target=self._collection_loop, daemon=True)
         self.collection_thread.start()
-        print("DEBUG: Real-time collection started")
+        logger.debug("Real-time collection started")
     
     def stop_collection(self):
         """Stop real-time data collection"""
         self.running = False
+        self._stop_event.set()
         if self.collection_thread and self.collection_thread.is_alive():
             self.collection_thread.join(timeout=5)
-        print("DEBUG: Real-time collection stopped")
+            if self.collection_thread.is_alive():
+                # Still inside a vCenter call - the loop releases the inventory filter on its way out
+                logger.debug("Collection thread still finishing; it will release the inventory filter")
+        logger.debug("Real-time collection stopped")
     
     def update_thresholds(self, warning_threshold, critical_threshold):
         """Update threshold values"""
@@ -266,14 +291,18 @@ class RealTimeCollector:
     
     def _collection_loop(self):
         """Main collection loop"""
-        while self.running:
-            try:
-                self._collect_data_point()
-                time.sleep(self.collection_interval)
-            except Exception as e:
-                print(f"DEBUG: Collection error: {e}")
-                if self.running:  # Only sleep if still running
-                    time.sleep(self.collection_interval)
+        try:
+            while self.running:
+                try:
+                    self._collect_data_point()
+                except Exception as e:
+                    logger.warning("Collection error: %s", e)
+                # Returns early when stop_collection sets the event
+                self._stop_event.wait(self.collection_interval)
+        finally:
+            # The filter is only ever used from this thread, so it is torn down here too -
+            # never from the Tk thread while a WaitForUpdatesEx on it may be in flight
+            self._destroy_host_inventory_filter()
     
     def _collect_data_point(self):
         """Collect single data point from vCenter"""
@@ -286,7 +315,7 @@ class RealTimeCollector:
             
             for host_info in hosts:
                 try:
-                    if re.match(r'^\d+\.\d+\.\d+\.\d+$', host_info['name']):
+                    if _IPV4_RE.match(host_info['name']):
                         hostname = host_info['name']  # Keep full IP address
                     else:
                         hostname = host_info['name'].split('.')[0]  # Use hostname without domain   
@@ -297,28 +326,28 @@ class RealTimeCollector:
                     
                     if cpu_ready_value is not None:
                         # DEBUG: Print raw values to understand the data format
-                        print(f"DEBUG: Raw CPU Readiness value for {hostname}: {cpu_ready_value}")
+                        logger.debug("Raw CPU Readiness value for %s: %s", hostname, cpu_ready_value)
                         
                         # CPU Readiness metric from vCenter needs to be divided by 100
                         # to match the percentage display in vCenter UI
                         cpu_ready_percent = cpu_ready_value / 100.0
                         conversion_method = "readiness_divided_by_100"
                         
-                        print(f"DEBUG: Converted CPU Ready % for {hostname}: {cpu_ready_percent:.3f}% (method: {conversion_method})")
+                        logger.debug("Converted CPU Ready %% for %s: %.3f%% (method: %s)", hostname, cpu_ready_percent, conversion_method)
                         
                         # Sanity check - CPU Ready should typically be < 5% in healthy systems
                         if cpu_ready_percent > 50:
-                            print(f"WARNING: Unusually high CPU Ready {cpu_ready_percent:.2f}% for {hostname}")
+                            logger.warning("Unusually high CPU Ready %.2f%% for %s", cpu_ready_percent, hostname)
                             # If still too high, try additional division
                             if cpu_ready_percent > 100:
                                 cpu_ready_percent = cpu_ready_percent / 100.0
                                 conversion_method = "readiness_divided_by_10000"
-                                print(f"DEBUG: Additional conversion: {cpu_ready_percent:.3f}% (method: {conversion_method})")
+                                logger.debug("Additional conversion: %.3f%% (method: %s)", cpu_ready_percent, conversion_method)
                         
                         # Final sanity check
                         cpu_ready_percent = min(cpu_ready_percent, 100.0)
                         
-                        print(f"DEBUG: Final CPU Ready % for {hostname}: {cpu_ready_percent:.3f}% (should match vCenter UI)")
+                        logger.debug("Final CPU Ready %% for %s: %.3f%% (should match vCenter UI)", hostname, cpu_ready_percent)
                         
                         # Store in database
                         self.db.insert_performance_data(
@@ -337,29 +366,71 @@ class RealTimeCollector:
                         self._check_thresholds(hostname, cpu_ready_percent)
                         
                 except Exception as e:
-                    print(f"DEBUG: Error collecting data for host {host_info['name']}: {e}")
+                    logger.warning("Error collecting data for host %s: %s", host_info['name'], e)
                     
         except Exception as e:
-            print(f"DEBUG: Error in collection loop: {e}")
+            logger.warning("Error in collection loop: %s", e)
+    
+    def _create_host_inventory_filter(self, content):
+        """Register a dedicated PropertyCollector filter on every HostSystem's name and state"""
+        self.host_collector = content.propertyCollector.CreatePropertyCollector()
+        self.host_container = content.viewManager.CreateContainerView(
+            content.rootFolder, [vim.HostSystem], True)
+        
+        traversal_spec = vim.PropertyCollector.TraversalSpec(
+            name='traverseEntities', path='view', skip=False, type=vim.view.ContainerView)
+        obj_spec = vim.PropertyCollector.ObjectSpec(obj=self.host_container, skip=True, selectSet=[traversal_spec])
+        prop_spec = vim.PropertyCollector.PropertySpec(
+            type=vim.HostSystem, pathSet=['name', 'runtime.connectionState'])
+        filter_spec = vim.PropertyCollector.FilterSpec(objectSet=[obj_spec], propSet=[prop_spec])
+        self.host_collector.CreateFilter(filter_spec, partialUpdates=False)
+        
+        self.inventory_version = ''
+        self.host_inventory = {}
+    
+    def _destroy_host_inventory_filter(self):
+        """Release the inventory PropertyCollector and container view"""
+        try:
+            if self.host_collector is not None:
+                self.host_collector.DestroyPropertyCollector()  # Also destroys its filters
+            if self.host_container is not None:
+                self.host_container.Destroy()
+        except Exception as e:
+            logger.warning("Error releasing host inventory filter: %s", e)
+        self.host_collector = None
+        self.host_container = None
+        self.inventory_version = ''
+        self.host_inventory = {}
     
     def _get_all_hosts(self, content):
-        """Get all ESXi hosts from vCenter"""
+        """Get all connected ESXi hosts from vCenter, applying only inventory changes since the last call"""
         try:
-            hosts = []
-            container = content.viewManager.CreateContainerView(
-                content.rootFolder, [vim.HostSystem], True)
-            
-            for host in container.view:
-                if host.runtime.connectionState == vim.HostSystemConnectionState.connected:
-                    hosts.append({
-                        'name': host.name,
-                        'object': host
-                    })
-            
-            container.Destroy()
-            return hosts
+            if self.host_collector is None:
+                self._create_host_inventory_filter(content)
+            
+            # maxWaitSeconds=0 polls without blocking: the first call returns every host,
+            # later calls only hosts that were added, removed or changed state (or None)
+            update_set = self.host_collector.WaitForUpdatesEx(
+                self.inventory_version, vim.PropertyCollector.WaitOptions(maxWaitSeconds=0))
+            if update_set is not None:
+                self.inventory_version = update_set.version
+                for filter_update in update_set.filterSet:
+                    for object_update in filter_update.objectSet:
+                        moid = object_update.obj._moId
+                        if object_update.kind == 'leave':
+                            self.host_inventory.pop(moid, None)
+                            continue
+                        host_entry = self.host_inventory.setdefault(moid, {'object': object_update.obj})
+                        for change in object_update.changeSet:
+                            host_entry[change.name] = change.val
+            
+            return [{'name': host_entry.get('name'), 'object': host_entry['object']}
+                    for host_entry in self.host_inventory.values()
+                    if host_entry.get('runtime.connectionState') == vim.HostSystemConnectionState.connected]
         except Exception as e:
-            print(f"DEBUG: Error getting hosts: {e}")
+            logger.warning("Error getting hosts: %s", e)
+            # Start from a fresh filter next cycle (e.g. after a session timeout)
+            self._destroy_host_inventory_filter()
             return []
     
     def _get_host_cpu_ready(self, content, host_obj):
@@ -377,21 +448,21 @@ class RealTimeCollector:
                     break
             
             if not counter_info:
-                print(f"DEBUG: CPU Readiness (percentage) counter not found, trying 'ready' counter")
+                logger.debug("CPU Readiness (percentage) counter not found, trying 'ready' counter")
                 # Fallback to original ready counter if readiness not found
                 for counter in perf_manager.perfCounter:
                     if (counter.groupInfo.key == 'cpu' and 
                         counter.nameInfo.key == 'ready' and 
                         counter.unitInfo.key == 'millisecond'):
                         counter_info = counter
-                        print(f"DEBUG: Using fallback 'ready' counter")
+                        logger.debug("Using fallback 'ready' counter")
                         break
                 
                 if not counter_info:
-                    print(f"DEBUG: No CPU Ready/Readiness counter found")
+                    logger.debug("No CPU Ready/Readiness counter found")
                     return None
             else:
-                print(f"DEBUG: Found CPU Readiness counter (percentage-based) ID: {counter_info.key}")
+                logger.debug("Found CPU Readiness counter (percentage-based) ID: %s", counter_info.key)
             
             # Create metric specification
             metric_spec = vim.PerformanceManager.MetricId(
@@ -413,12 +484,12 @@ class RealTimeCollector:
                 intervalId=20  # 20-second interval for real-time data
             )
             
-            print(f"DEBUG: Querying CPU Readiness for {host_obj.name} from {start_time.strftime('%H:%M:%S')} to {end_time.strftime('%H:%M:%S')}")
+            logger.debug("Querying CPU Readiness for %s from %s to %s", host_obj.name, start_time.strftime('%H:%M:%S'), end_time.strftime('%H:%M:%S'))
             
             perf_data = perf_manager.QueryPerf(querySpec=[query_spec])
             
             if perf_data and len(perf_data) > 0 and perf_data[0].value:
-                print(f"DEBUG: Got {len(perf_data[0].sampleInfo)} samples for {host_obj.name}")
+                logger.debug("Got %s samples for %s", len(perf_data[0].sampleInfo), host_obj.name)
                 
                 # Get the most recent non-zero value
                 latest_value = None
@@ -428,14 +499,14 @@ class RealTimeCollector:
                         for i in range(len(value_info.value) - 1, -1, -1):
                             if value_info.value[i] is not None and value_info.value[i] >= 0:
                                 latest_value = value_info.value[i]
-                                print(f"DEBUG: Found recent readiness value: {latest_value}")
+                                logger.debug("Found recent readiness value: %s", latest_value)
                                 break
                         if latest_value is not None:
                             break
                 
                 return latest_value
             else:
-                print(f"DEBUG: No performance data returned for {host_obj.name}")
+                logger.debug("No performance data returned for %s", host_obj.name)
                 
                 # Fallback: Try simpler real-time query without time window
                 simple_query_spec = vim.PerformanceManager.QuerySpec(
@@ -444,20 +515,20 @@ class RealTimeCollector:
                     maxSample=1
                 )
                 
-                print(f"DEBUG: Trying fallback query for {host_obj.name}")
+                logger.debug("Trying fallback query for %s", host_obj.name)
                 perf_data = perf_manager.QueryPerf(querySpec=[simple_query_spec])
                 
                 if perf_data and len(perf_data) > 0 and perf_data[0].value:
                     for value_info in perf_data[0].value:
                         if value_info.value and len(value_info.value) > 0:
                             fallback_value = value_info.value[-1]
-                            print(f"DEBUG: Fallback readiness value: {fallback_value}")
+                            logger.debug("Fallback readiness value: %s", fallback_value)
                             return fallback_value
             
             return None
             
         except Exception as e:
-            print(f"DEBUG: Error getting CPU Readiness for host: {e}")
+            logger.warning("Error getting CPU Readiness for host: %s", e)
             import traceback
             traceback.print_exc()
             return None
@@ -496,7 +567,7 @@ class RealTimeCollector:
                 })
                 
         except Exception as e:
-            print(f"DEBUG: Error checking thresholds: {e}")
+            logger.warning("Error checking thresholds: %s", e)
 
 
 class RealTimeDashboard:
@@ -533,6 +604,8 @@ class RealTimeDashboard:
         # Data storage for charts
         self.realtime_data = {}  # hostname -> deque of (timestamp, value)
         self.max_points = 100  # Maximum points to show
+        self._chart_placeholder = None  # Message currently shown on the empty chart, if any
+        self._layout_signature = None  # What the last tight_layout was computed for
         self.alert_history = []  # Store recent alerts
         
         # Initialize ALL variables BEFORE setup_dashboard
@@ -619,16 +692,26 @@ class RealTimeDashboard:
         for spine in self.realtime_ax.spines.values():
             spine.set_color(self.colors['border'])
         
-        # Initial empty plot
-        self.realtime_ax.text(0.5, 0.5, 'Waiting for real-time data...\nClick "Start Monitoring" to begin', 
-                             ha='center', va='center', transform=self.realtime_ax.transAxes,
-                             color=self.colors['text_secondary'], fontsize=12)
+        # Initial empty plot - the placeholder Text artist is created once and re-attached
+        # after each ax.clear() (transAxes survives the clear)
+        self._chart_placeholder = 'Waiting for real-time data...\nClick "Start Monitoring" to begin'
+        self._placeholder_text = self.realtime_ax.text(0.5, 0.5, self._chart_placeholder,
+                                                       color=self.colors['text_secondary'],
+                                                       ha='center', va='center',
+                                                       transform=self.realtime_ax.transAxes, fontsize=12)
         
         # Embed chart
         self.realtime_canvas = FigureCanvasTkAgg(self.realtime_fig, master=chart_frame)
         self.realtime_canvas.draw()
         self.realtime_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
     
+    def _show_chart_placeholder(self, message, color):
+        """Show a centred message on the freshly cleared chart"""
+        self._chart_placeholder = message
+        self._placeholder_text.set_text(message)
+        self._placeholder_text.set_color(color)
+        self.realtime_ax.add_artist(self._placeholder_text)
+    
     def create_metrics_panel(self):
         """Create live metrics display panel"""
         metrics_frame = tk.LabelFrame(self.dashboard_frame, text="  📊 Live Metrics  ",
@@ -789,9 +872,9 @@ class RealTimeDashboard:
                 
                 # Debug: Show refresh activity
                 if self.monitoring_active:
-                    print(f"DEBUG: Dashboard refreshed at {datetime.now().strftime('%H:%M:%S')}")
+                    logger.debug("Dashboard refreshed at %s", datetime.now().strftime('%H:%M:%S'))
         except Exception as e:
-            print(f"DEBUG: Dashboard refresh error: {e}")
+            logger.warning("Dashboard refresh error: %s", e)
         
         # Schedule next refresh - ALWAYS schedule, regardless of monitoring status
         self.parent.after(self.update_interval, self.refresh_dashboard)
@@ -817,10 +900,9 @@ class RealTimeDashboard:
             
             # Clear the chart
             self.realtime_ax.clear()
-            self.realtime_ax.text(0.5, 0.5, 'Real-time monitoring started...\nWaiting for data collection...', 
-                                 ha='center', va='center', transform=self.realtime_ax.transAxes,
-                                 color=self.colors['text_primary'], fontsize=12)
-            self.realtime_canvas.draw()
+            self._show_chart_placeholder('Real-time monitoring started...\nWaiting for data collection...',
+                                         self.colors['text_primary'])
+            self.realtime_canvas.draw_idle()
             
             messagebox.showinfo("Monitoring Started", "Real-time monitoring is now active using CPU Readiness metric")
             
@@ -852,19 +934,21 @@ class RealTimeDashboard:
             # Get recent data from database
             recent_data = self.db.get_recent_performance_data(minutes=30)
             
-            # Clear and redraw
-            self.realtime_ax.clear()
-            
             if recent_data.empty:
                 # Show waiting message
                 if self.monitoring_active:
-                    self.realtime_ax.text(0.5, 0.5, 'Monitoring active...\nWaiting for data collection...', 
-                                         ha='center', va='center', transform=self.realtime_ax.transAxes,
-                                         color=self.colors['text_primary'], fontsize=12)
+                    message = 'Monitoring active...\nWaiting for data collection...'
+                    message_color = self.colors['text_primary']
                 else:
-                    self.realtime_ax.text(0.5, 0.5, 'Real-time monitoring stopped.\nClick "Start Monitoring" to begin collecting data.', 
-                                         ha='center', va='center', transform=self.realtime_ax.transAxes,
-                                         color=self.colors['text_secondary'], fontsize=12)
+                    message = 'Real-time monitoring stopped.\nClick "Start Monitoring" to begin collecting data.'
+                    message_color = self.colors['text_secondary']
+                
+                # The same placeholder is already on screen - nothing to clear, restyle or re-render
+                if message == self._chart_placeholder:
+                    return
+                
+                self.realtime_ax.clear()
+                self._show_chart_placeholder(message, message_color)
                 
                 # Set basic chart properties
                 self.realtime_ax.set_facecolor(self.colors['bg_secondary'])
@@ -879,31 +963,35 @@ class RealTimeDashboard:
                 for spine in self.realtime_ax.spines.values():
                     spine.set_color(self.colors['border'])
                 
-                self.realtime_canvas.draw()
+                self.realtime_canvas.draw_idle()
                 return
             
+            # Clear and redraw
+            self.realtime_ax.clear()
+            self._chart_placeholder = None
+            
             # Debug: Print data info
-            print(f"DEBUG: Chart update - {len(recent_data)} data points found")
+            logger.debug("Chart update - %s data points found", len(recent_data))
             
             # Color palette
             colors = ['#00d4ff', '#ff6b6b', '#4ecdc4', '#45b7d1', '#96ceb4', '#feca57']
             
-            hostnames = recent_data['hostname'].unique()
-            print(f"DEBUG: Chart hosts: {list(hostnames)}")
+            # Rows arrive newest first; one stable sort leaves every host group in time order
+            recent_data = recent_data.sort_values('timestamp', kind='mergesort', ignore_index=True)
+            host_groups = recent_data.groupby('hostname', observed=True, sort=False)
+            hostnames = list(host_groups.groups)
+            logger.debug("Chart hosts: %s", hostnames)
             
-            for i, hostname in enumerate(hostnames):
-                host_data = recent_data[recent_data['hostname'] == hostname].copy()
-                host_data = host_data.sort_values('timestamp')
-                
+            for i, (hostname, host_data) in enumerate(host_groups):
                 # Keep only last N points
                 if len(host_data) > self.max_points:
                     host_data = host_data.tail(self.max_points)
                 
                 color = colors[i % len(colors)]
                 
-                print(f"DEBUG: Plotting {len(host_data)} points for {hostname}")
+                logger.debug("Plotting %s points for %s", len(host_data), hostname)
                 
-                self.realtime_ax.plot(host_data['timestamp'], host_data['cpu_ready_percent'],
+                self.realtime_ax.plot(host_data['timestamp'].values, host_data['cpu_ready_percent'].values,
                                      marker='o', markersize=2, linewidth=2, 
                                      label=hostname, color=color, alpha=0.9)
             
@@ -923,7 +1011,7 @@ class RealTimeDashboard:
             self.realtime_ax.grid(True, alpha=0.3, color=self.colors['border'])
             
             # Legend
-            if hostnames.size > 0:
+            if hostnames:
                 legend = self.realtime_ax.legend(loc='upper left', bbox_to_anchor=(1.02, 1),
                                                frameon=True, fancybox=True, shadow=False,
                                                facecolor=self.colors['bg_tertiary'],
@@ -934,15 +1022,21 @@ class RealTimeDashboard:
             for spine in self.realtime_ax.spines.values():
                 spine.set_color(self.colors['border'])
             
-            # Format x-axis
-            self.realtime_fig.autofmt_xdate()
-            self.realtime_fig.tight_layout()
-            self.realtime_canvas.draw()
+            # Format x-axis - rotation via the tick defaults, without autofmt_xdate's per-refresh margin adjust
+            self.realtime_ax.tick_params(axis='x', labelrotation=30)
+            
+            # tight_layout measures every artist - only redo it when size, legend or y-label width changed
+            layout_signature = (tuple(self.realtime_fig.get_size_inches()), tuple(hostnames),
+                                len(f"{self.realtime_ax.get_ylim()[1]:.0f}"))
+            if layout_signature != self._layout_signature:
+                self.realtime_fig.tight_layout()
+                self._layout_signature = layout_signature
+            self.realtime_canvas.draw_idle()
             
-            print(f"DEBUG: Chart updated successfully")
+            logger.debug("Chart updated successfully")
             
         except Exception as e:
-            print(f"DEBUG: Error updating realtime chart: {e}")
+            logger.warning("Error updating realtime chart: %s", e)
             import traceback
             traceback.print_exc()
     
@@ -963,30 +1057,25 @@ class RealTimeDashboard:
                 metrics_content = f"📊 LIVE METRICS - {current_time}\n" + "="*40 + "\n\n"
                 
                 # Calculate current metrics per host
-                hostnames = recent_data['hostname'].unique()
-                print(f"DEBUG: Metrics update - {len(hostnames)} hosts, {len(recent_data)} records")
+                host_stats = recent_data.groupby('hostname', observed=True, sort=False).agg(
+                    current=('cpu_ready_percent', 'last'),
+                    avg=('cpu_ready_percent', 'mean'),
+                    max=('cpu_ready_percent', 'max'),
+                    updated=('timestamp', 'last'))
+                hostnames = list(host_stats.index)
+                logger.debug("Metrics update - %s hosts, %s records", len(hostnames), len(recent_data))
                 
-                for hostname in hostnames:
-                    host_data = recent_data[recent_data['hostname'] == hostname]
-                    
-                    if len(host_data) > 0:
-                        latest = host_data.iloc[-1]
-                        avg_last_5min = host_data['cpu_ready_percent'].mean()
-                        max_last_5min = host_data['cpu_ready_percent'].max()
-                        
-                        # Status indicator
-                        if latest['cpu_ready_percent'] >= self.critical_threshold:
-                            status = "🔴 CRITICAL"
-                        elif latest['cpu_ready_percent'] >= self.warning_threshold:
-                            status = "🟡 WARNING"
-                        else:
-                            status = "🟢 HEALTHY"
-                        
-                        metrics_content += f"{hostname} - {status}\n"
-                        metrics_content += f"  Current: {latest['cpu_ready_percent']:.3f}%\n"
-                        metrics_content += f"  5min Avg: {avg_last_5min:.3f}%\n"
-                        metrics_content += f"  5min Max: {max_last_5min:.3f}%\n"
-                        metrics_content += f"  Last Update: {latest['timestamp'].strftime('%H:%M:%S')}\n\n"
+                # Status indicator
+                current = host_stats['current'].to_numpy()
+                statuses = np.select([current >= self.critical_threshold, current >= self.warning_threshold],
+                                     ["🔴 CRITICAL", "🟡 WARNING"], "🟢 HEALTHY")
+                
+                metrics_content += ''.join(
+                    _HOST_METRICS_BLOCK(hostname=hostname, status=status, current=current_pct,
+                                        avg=avg_pct, max=max_pct, updated=updated)
+                    for hostname, status, current_pct, avg_pct, max_pct, updated in zip(
+                        hostnames, statuses.tolist(), current, host_stats['avg'], host_stats['max'],
+                        host_stats['updated']))
                 
                 # Overall statistics
                 metrics_content += "📈 OVERALL STATISTICS\n" + "-"*25 + "\n"
@@ -1009,7 +1098,7 @@ class RealTimeDashboard:
             self.metrics_text.insert(1.0, metrics_content)
             
         except Exception as e:
-            print(f"DEBUG: Error updating metrics panel: {e}")
+            logger.warning("Error updating metrics panel: %s", e)
             import traceback
             traceback.print_exc()
     
@@ -1036,7 +1125,7 @@ class RealTimeDashboard:
                     self.alerts_listbox.insert(tk.END, alert_text)
             
         except Exception as e:
-            print(f"DEBUG: Error updating alerts panel: {e}")
+            logger.warning("Error updating alerts panel: %s", e)
     
     def process_data_queue(self):
         """Process queued data from collector"""
@@ -1063,7 +1152,7 @@ class RealTimeDashboard:
                     except queue.Empty:
                         break
         except Exception as e:
-            print(f"DEBUG: Error processing data queue: {e}")
+            logger.warning("Error processing data queue: %s", e)
     
     def show_realtime_alert(self, alert_data):
         """Show real-time alert notification"""
@@ -1130,11 +1219,11 @@ class RealTimeDashboard:
                 pass
             
         except Exception as e:
-            print(f"DEBUG: Error showing realtime alert: {e}")
+            logger.warning("Error showing realtime alert: %s", e)
     
     def acknowledge_alert(self, alert_data):
         """Acknowledge an alert"""
-        print(f"DEBUG: Alert acknowledged for {alert_data['hostname']}")
+        logger.debug("Alert acknowledged for %s", alert_data['hostname'])
         # Add the alert to our history for tracking
         self.alert_history.append({
             'timestamp': datetime.now(),
@@ -1147,7 +1236,7 @@ class RealTimeDashboard:
         """Acknowledge selected alert in listbox"""
         selection = self.alerts_listbox.curselection()
         if selection:
-            print("DEBUG: Alert acknowledged")
+            logger.debug("Alert acknowledged")
             # Implementation would mark alert as acknowledged in database
             # For now, just refresh the display
             self.refresh_alerts_display()
@@ -1156,22 +1245,22 @@ class RealTimeDashboard:
         """Resolve selected alert in listbox"""
         selection = self.alerts_listbox.curselection()
         if selection:
-            print("DEBUG: Alert resolved")
+            logger.debug("Alert resolved")
             # Implementation would mark alert as resolved in database
             # For now, just refresh the display
             self.refresh_alerts_display()
     
     def force_refresh(self):
         """Force an immediate dashboard refresh for testing"""
-        print("DEBUG: Manual refresh triggered")
+        logger.debug("Manual refresh triggered")
         try:
             self.update_realtime_chart()
             self.update_metrics_panel()
             self.update_alerts_panel()
             self.process_data_queue()
-            print("DEBUG: Manual refresh completed")
+            logger.debug("Manual refresh completed")
         except Exception as e:
-            print(f"DEBUG: Manual refresh error: {e}")
+            logger.warning("Manual refresh error: %s", e)
             import traceback
             traceback.print_exc()
     
@@ -1202,10 +1291,9 @@ class RealTimeDashboard:
                 self.realtime_ax.set_title('Real-Time CPU Ready % (Cleared)', 
                                           fontsize=12, fontweight='bold', 
                                           color=self.colors['text_primary'])
-                self.realtime_ax.text(0.5, 0.5, 'Data cleared.\nStart monitoring to see new data.', 
-                                     ha='center', va='center', transform=self.realtime_ax.transAxes,
-                                     color=self.colors['text_secondary'], fontsize=12)
-                self.realtime_canvas.draw()
+                self._show_chart_placeholder('Data cleared.\nStart monitoring to see new data.',
+                                             self.colors['text_secondary'])
+                self.realtime_canvas.draw_idle()
                 
                 messagebox.showinfo("Data Cleared", "Real-time data history has been cleared")
                 
@@ -1217,9 +1305,9 @@ class RealTimeDashboard:
         try:
             if self.collector:
                 self.collector.stop_collection()
-            print("DEBUG: Real-time dashboard cleanup completed")
+            logger.debug("Real-time dashboard cleanup completed")
         except Exception as e:
-            print(f"DEBUG: Error during dashboard cleanup: {e}")
+            logger.warning("Error during dashboard cleanup: %s", e)
 
 
 # Example usage and testing
@@ -0,0 +1,38 @@
+import os
+import sys
+from datetime import datetime
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vcenter_cpu_analyser import ModernCPUAnalyzer
+
+
+def clean(values):
+    # clean_timestamps uses no instance state, so no Tk root is needed
+    return ModernCPUAnalyzer.clean_timestamps(None, pd.Series(values, dtype=object)).tolist()
+
+
+def test_iso_strings_with_redundant_z():
+    assert clean(['2024-01-01T11:00:00+02:00Z', '2024-01-01T12:00:00Z']) == [
+        pd.Timestamp('2024-01-01 09:00', tz='UTC'),
+        pd.Timestamp('2024-01-01 12:00', tz='UTC'),
+    ]
+
+
+def test_datetime_objects():
+    assert clean([datetime(2024, 1, 1, 10), datetime(2024, 1, 1, 11)]) == [
+        pd.Timestamp('2024-01-01 10:00', tz='UTC'),
+        pd.Timestamp('2024-01-01 11:00', tz='UTC'),
+    ]
+
+
+def test_mixed_datetimes_and_strings():
+    result = clean([datetime(2024, 1, 1, 10), '2024-01-01T11:00:00+00:00Z', '01/02/2024 12:00', None, 'garbage'])
+    assert result[:3] == [
+        pd.Timestamp('2024-01-01 10:00', tz='UTC'),
+        pd.Timestamp('2024-01-01 11:00', tz='UTC'),
+        pd.Timestamp('2024-01-02 12:00', tz='UTC'),
+    ]
+    assert pd.isna(result[3]) and pd.isna(result[4])
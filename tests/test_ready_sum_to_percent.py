@@ -0,0 +1,27 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import vcenter_cpu_analyser
+from vcenter_cpu_analyser import ready_sum_to_percent
+
+
+def convert(values, divisor, use_numba):
+    saved = vcenter_cpu_analyser.NUMBA_AVAILABLE
+    vcenter_cpu_analyser.NUMBA_AVAILABLE = saved and use_numba
+    try:
+        return ready_sum_to_percent(np.array(values, dtype=np.float64), divisor)
+    finally:
+        vcenter_cpu_analyser.NUMBA_AVAILABLE = saved
+
+
+def test_nan_is_kept_on_both_backends():
+    values = [np.nan, 2000.0, 500000.0, np.nan]
+    fallback = convert(values, 200, use_numba=False)
+    kernel = convert(values, 200, use_numba=True)
+    expected = np.array([np.nan, 10.0, 100.0, np.nan], dtype=np.float32)
+    np.testing.assert_array_equal(fallback, expected)
+    np.testing.assert_array_equal(kernel, fallback)
@@ -6,7 +6,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('README.txt', '.')],
-    hiddenimports=['pandas', 'numpy', 'matplotlib', 'matplotlib.backends.backend_tkagg', 'matplotlib.colors', 'seaborn', 'openpyxl', 'xlrd', 'pyvmomi', 'pyVim', 'pyVim.connect', 'pyVmomi.vim', 'requests', 'ssl', 'reportlab', 'reportlab.lib', 'reportlab.platypus', 'reportlab.pdfgen', 'realtime_dashboard', 'threading', 'queue', 'collections', 'sqlite3', 'tkinter.ttk', 'datetime', 'calendar', 're', 'pathlib', 'base64', 'io', 'tempfile', 'matplotlib.patches', 'matplotlib.figure', 'pandas.core.algorithms', 'pandas.core.arrays', 'pandas.io.formats.style', 'pandas._libs.tslibs', 'pandas._libs.hashtable', 'pandas._libs.lib', 'pandas._libs.missing', 'pytz', 'dateutil', 'dateutil.parser', 'dateutil.tz', 'sqlite3.dbapi2', 'matplotlib.animation', 'matplotlib.dates', 'matplotlib.ticker', 'collections.deque', 'json', 'threading.Timer', 'math', 'statistics', 'warnings', 'socket', 'ipaddress', 'traceback', 'time', 'copy', 'uuid', 'pandas.plotting', 'pandas.core.dtypes'],
+    hiddenimports=['pandas', 'numpy', 'matplotlib', 'matplotlib.backends.backend_tkagg', 'matplotlib.colors', 'openpyxl', 'xlrd', 'pyvmomi', 'pyVim', 'pyVim.connect', 'pyVmomi.vim', 'ssl', 'numba', 'pyarrow', 'pyarrow.csv', 'reportlab', 'reportlab.lib', 'reportlab.platypus', 'reportlab.pdfgen', 'realtime_dashboard', 'threading', 'queue', 'collections', 'sqlite3', 'tkinter.ttk', 'datetime', 'calendar', 're', 'pathlib', 'base64', 'io', 'tempfile', 'matplotlib.patches', 'matplotlib.figure', 'pandas.core.algorithms', 'pandas.core.arrays', 'pandas.io.formats.style', 'pandas._libs.tslibs', 'pandas._libs.hashtable', 'pandas._libs.lib', 'pandas._libs.missing', 'pytz', 'dateutil', 'dateutil.parser', 'dateutil.tz', 'sqlite3.dbapi2', 'matplotlib.animation', 'matplotlib.dates', 'matplotlib.ticker', 'collections.deque', 'json', 'threading.Timer', 'math', 'statistics', 'warnings', 'socket', 'ipaddress', 'traceback', 'time', 'copy', 'uuid', 'pandas.plotting', 'pandas.core.dtypes'],
     hookspath=['.'],
     hooksconfig={},
     runtime_hooks=[],
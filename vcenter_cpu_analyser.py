@@ -8,10 +8,20 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import matplotlib.patches as patches
 from matplotlib.colors import LinearSegmentedColormap
-import seaborn as sns
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+import matplotlib.dates as mdates
 from pathlib import Path
 import re
+import os
+import sys
+import csv
+import logging
+import logging.handlers
 import threading
+import queue
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from reportlab.lib.pagesizes import letter, A4
@@ -27,18 +37,212 @@ try:
     PDF_AVAILABLE = True
 except ImportError:
     PDF_AVAILABLE = False
+# Arrow CSV writer is much faster than pandas for large exports
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+# Optional JIT for the elementwise CPU Ready kernels
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 from realtime_dashboard import RealTimeDashboard
 # vCenter integration imports
 try:
     from pyVim.connect import SmartConnect, Disconnect
     from pyVmomi import vim
     import ssl
-    import requests
-    from requests.auth import HTTPBasicAuth
     VCENTER_AVAILABLE = True
 except ImportError:
     VCENTER_AVAILABLE = False
 
+# Debug output for the vCenter fetch path. Off (WARNING) by default; set CPU_READY_DEBUG=1 to
+# see it. Records are handed to a QueueListener so console writes never block Tk or a worker
+logger = logging.getLogger(__name__)
+
+# Leading status indicator emoji, stripped when exporting to CSV
+_STATUS_RE = re.compile(r'^[🔴🟡🟢]\s*')
+
+# Hostname extraction from "Ready for ..." column headers, run once per ready column on import
+_DOLLAR_HOST_RE = re.compile(r'\$(\w+)')
+_READY_FOR_RE = re.compile(r'Ready for (.+)')
+_IPV4_RE = re.compile(r'^\d+\.\d+\.\d+\.\d+$')
+
+# Entities per QueryPerf call - vCenter guidance is 10-50, and one metric per spec keeps
+# each request well under the default vpxd.stats.maxQueryMetrics limit of 256
+_QUERY_PERF_BATCH_SIZE = 50
+
+# Shared font tuples - reusing the same objects lets Tk resolve each font once
+_FONT_H1 = ('Segoe UI', 20, 'bold')
+_FONT_H2 = ('Segoe UI', 14, 'bold')
+_FONT_SECTION = ('Segoe UI', 12, 'bold')
+_FONT_ICON = ('Segoe UI', 12)
+_FONT_LEAD = ('Segoe UI', 11)
+_FONT_LEAD_BOLD = ('Segoe UI', 11, 'bold')
+_FONT_LEAD_ITALIC = ('Segoe UI', 11, 'italic')
+_FONT_BODY = ('Segoe UI', 10)
+_FONT_BODY_BOLD = ('Segoe UI', 10, 'bold')
+
+# numba's on-disk cache locator fails inside a frozen (PyInstaller) build - compile in memory there
+_NUMBA_CACHE = not getattr(sys, 'frozen', False)
+
+if NUMBA_AVAILABLE:
+    try:
+        @njit(parallel=True, cache=_NUMBA_CACHE)
+        def _ready_sum_to_percent_kernel(ready_sum, scale, out):
+            for i in prange(ready_sum.shape[0]):
+                value = ready_sum[i] * scale
+                # keep NaN as NaN, matching np.minimum in the fallback
+                out[i] = value if (value != value or value < 100.0) else 100.0
+
+        @njit(parallel=True, cache=_NUMBA_CACHE)
+        def _nan_sum_count_kernel(values):
+            total = 0.0
+            count = 0
+            for i in prange(values.shape[0]):
+                value = values[i]
+                if not np.isnan(value):
+                    total += value
+                    count += 1
+            return total, count
+
+        @njit(cache=_NUMBA_CACHE)
+        def _host_sum_count_kernel(codes, values, n_groups):
+            sums = np.zeros(n_groups)
+            counts = np.zeros(n_groups, dtype=np.int64)
+            for i in range(codes.shape[0]):
+                g = codes[i]
+                if g >= 0:
+                    sums[g] += values[i]
+                    counts[g] += 1
+            return sums, counts
+
+        @njit(cache=_NUMBA_CACHE, fastmath=True)
+        def _threshold_count_kernel(codes, values, warning_level, critical_level, n_groups):
+            warning_counts = np.zeros(n_groups, dtype=np.int64)
+            critical_counts = np.zeros(n_groups, dtype=np.int64)
+            for i in range(codes.shape[0]):
+                g = codes[i]
+                if g >= 0:
+                    value = values[i]
+                    if value >= warning_level:
+                        warning_counts[g] += 1
+                    if value >= critical_level:
+                        critical_counts[g] += 1
+            return warning_counts, critical_counts
+
+        @njit(cache=_NUMBA_CACHE)
+        def _health_score_kernel(avg, mx, std, warning_level, critical_level, out):
+            for i in range(avg.shape[0]):
+                score = 100.0
+                if avg[i] >= critical_level:
+                    score -= 50.0
+                elif avg[i] >= warning_level:
+                    score -= 25.0
+                else:
+                    score -= (avg[i] / warning_level) * 10.0
+                if mx[i] >= critical_level * 2.0:
+                    score -= 30.0
+                elif mx[i] >= critical_level:
+                    score -= 15.0
+                if std[i] > warning_level:
+                    score -= 15.0
+                out[i] = min(max(score, 0.0), 100.0)
+    except Exception as e:
+        # Any JIT setup failure falls back to the numpy paths instead of breaking startup
+        logger.warning("numba kernels unavailable, using numpy fallbacks: %s", e)
+        NUMBA_AVAILABLE = False
+
+
+def minmax_downsample(x, y, n_out):
+    """Reduce a series to roughly n_out points, keeping the min and max of each bucket so peaks survive"""
+    n = len(y)
+    if n <= n_out or n_out < 4:
+        return x, y
+    n_buckets = n_out // 2
+    bucket_size = n // n_buckets
+    m = bucket_size * n_buckets
+    blocks = y[:m].reshape(n_buckets, bucket_size)
+    offsets = np.arange(n_buckets) * bucket_size
+    idx = [offsets + blocks.argmin(axis=1), offsets + blocks.argmax(axis=1), [0, n - 1]]
+    if m < n:
+        tail = y[m:]
+        idx.append([m + tail.argmin(), m + tail.argmax()])
+    idx = np.unique(np.concatenate(idx))
+    return x[idx], y[idx]
+
+def ready_sum_to_percent(ready_sum, divisor):
+    """Convert CPU Ready summation values (ms) to float32 percent for the given divisor, capped at 100%"""
+    ready_sum = np.ascontiguousarray(ready_sum)
+    scale = 1.0 / float(divisor)
+    out = np.empty(ready_sum.shape[0], dtype=np.float32)
+    if NUMBA_AVAILABLE:
+        _ready_sum_to_percent_kernel(ready_sum, scale, out)
+        return out
+    np.multiply(ready_sum, scale, out=out, casting='unsafe')
+    return np.minimum(out, 100.0, out=out)
+
+def nan_mean(values):
+    """Mean of values ignoring NaN (like Series.mean), as a parallel reduction when numba is available"""
+    values = np.ascontiguousarray(values)
+    if NUMBA_AVAILABLE:
+        total, count = _nan_sum_count_kernel(values)
+    else:
+        valid = ~np.isnan(values)
+        total, count = values.sum(where=valid, dtype=np.float64), np.count_nonzero(valid)
+    return total / count if count else float('nan')
+
+def host_sum_count(codes, values, n_groups):
+    """Per-group sum and count of values in one pass over integer group codes (-1 = missing)"""
+    # Keep the native dtypes (int8/int16 codes, float32 or float64 values) - the sums
+    # accumulate in float64 without first widening a copy of either column
+    codes = np.ascontiguousarray(codes)
+    values = np.ascontiguousarray(values)
+    if NUMBA_AVAILABLE:
+        return _host_sum_count_kernel(codes, values, n_groups)
+    valid = codes >= 0
+    return (np.bincount(codes[valid], weights=values[valid], minlength=n_groups),
+            np.bincount(codes[valid], minlength=n_groups))
+
+def threshold_counts(codes, values, warning_level, critical_level, n_groups):
+    """Per-group counts of values at/above the warning and critical levels in one fused pass"""
+    codes = np.ascontiguousarray(codes)
+    values = np.ascontiguousarray(values)
+    if NUMBA_AVAILABLE:
+        return _threshold_count_kernel(codes, values, float(warning_level), float(critical_level), n_groups)
+    valid = codes >= 0
+    return (np.bincount(codes[valid & (values >= warning_level)], minlength=n_groups),
+            np.bincount(codes[valid & (values >= critical_level)], minlength=n_groups))
+
+def health_score_array(avg, mx, std, warning_level, critical_level):
+    """Health score (0-100) for per-host mean/max/std arrays against the given thresholds"""
+    avg = np.ascontiguousarray(avg, dtype=np.float64)
+    mx = np.ascontiguousarray(mx, dtype=np.float64)
+    std = np.ascontiguousarray(std, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        out = np.empty_like(avg)
+        _health_score_kernel(avg, mx, std, float(warning_level), float(critical_level), out)
+        return out
+    score = np.full(avg.shape, 100.0)
+    score -= np.where(avg >= critical_level, 50.0,
+                      np.where(avg >= warning_level, 25.0, (avg / warning_level) * 10))
+    score -= np.where(mx >= critical_level * 2, 30.0, np.where(mx >= critical_level, 15.0, 0.0))
+    score -= np.where(std > warning_level, 15.0, 0.0)
+    return np.clip(score, 0, 100)
+
+def disconnect_vcenter_quietly(connection):
+    """Close a vCenter session, logging rather than raising on failure"""
+    try:
+        Disconnect(connection)
+        logger.debug("vCenter disconnected")
+    except Exception as e:
+        logger.warning("Error disconnecting vCenter: %s", e)
+
+
 class ModernCPUAnalyzer:
     def __init__(self, root):
         self.root = root
@@ -58,6 +262,24 @@ class ModernCPUAnalyzer:
         self.processed_data = None
         self.current_interval = "Last Day"
         self.vcenter_connection = None
+        self._vcenter_finalizer = None  # Disconnects the session if we are torn down while connected
+        self.cpu_ready_counter_key = None  # Resolved once per vCenter connection
+        self.failing_perf_hosts = set()  # moIds whose QueryPerf failed on their own last time
+        self.host_container = None  # HostSystem ContainerView reused across fetches
+        
+        # Derived-data caches, rebuilt lazily whenever processed_data changes
+        self._sorted_hosts = None
+        self._sorted_by_host = None
+        self._total_workload = None
+        self._overall_avg_pct = None
+        self._per_host_workload = None
+        self._host_groups = None
+        self._host_stats = None
+        self._host_codes = None  # Contiguous per-row arrays for the numeric kernels (see ensure_column_arrays)
+        self._host_categories = None
+        self._ready_sum_arr = None
+        self._ready_pct_arr = None
+        self._processed_data_id = None
         
         # Update intervals
         self.intervals = {
@@ -68,6 +290,9 @@ class ModernCPUAnalyzer:
             "Last Year": 86400
         }
         
+        # CPU Ready % divisors per interval: ready_ms / (interval_s * 1000) * 100 == ready_ms / (interval_s * 10)
+        self.denominators = {name: float(seconds) * 10.0 for name, seconds in self.intervals.items()}
+        
         self.vcenter_intervals = {
             "Real-Time": 20,
             "Last Day": 300,
@@ -145,7 +370,7 @@ class ModernCPUAnalyzer:
             if realtime_data.empty:
                 return None
             
-            print(f"DEBUG: Exporting {len(realtime_data)} real-time records to main app")
+            logger.debug("Exporting %s real-time records to main app", len(realtime_data))
             
             converted_data = []
             
@@ -163,7 +388,7 @@ class ModernCPUAnalyzer:
                 # The analysis engine expects percentage values, not decimals
                 raw_value_for_analysis = row['cpu_ready_percent']  # Use percentage directly
                 
-                print(f"DEBUG: Converting {row['hostname']}: {row['cpu_ready_percent']:.3f}% -> {raw_value_for_analysis:.3f} (direct percentage)")
+                logger.debug("Converting %s: %.3f%% -> %.3f (direct percentage)", row['hostname'], row['cpu_ready_percent'], raw_value_for_analysis)
                 
                 converted_data.append({
                     'Time': local_timestamp,
@@ -191,18 +416,18 @@ class ModernCPUAnalyzer:
                 final_data = list(time_groups.values())
                 final_df = pd.DataFrame(final_data)
                 
-                print(f"DEBUG: Using direct percentage values - analysis should use them as-is")
+                logger.debug("Using direct percentage values - analysis should use them as-is")
                 
                 # Show expected results
                 for col in final_df.columns:
                     if col.startswith('Ready for'):
                         sample_values = final_df[col].dropna().head(3)
-                        print(f"  {col}: {sample_values.tolist()} -> Expected same values in analysis")
+                        logger.debug("  %s: %s -> Expected same values in analysis", col, sample_values.tolist())
                 
                 return final_df
                 
         except Exception as e:
-            print(f"DEBUG: Error exporting real-time data: {e}")
+            logger.warning("Error exporting real-time data: %s", e)
             return None
 
     def verify_realtime_conversion(self):
@@ -216,39 +441,36 @@ class ModernCPUAnalyzer:
             recent_data = realtime_db.get_recent_performance_data(minutes=60)  # Last hour
             
             if recent_data.empty:
-                print("DEBUG: No real-time data to verify")
+                logger.debug("No real-time data to verify")
                 return
             
-            print("DEBUG: REAL-TIME DATA VERIFICATION - FIXED")
-            print("=" * 50)
+            logger.debug("REAL-TIME DATA VERIFICATION - FIXED")
+            logger.debug("=" * 50)
             
-            for hostname in recent_data['hostname'].unique():
-                host_data = recent_data[recent_data['hostname'] == hostname]
-                
+            for hostname, host_data in recent_data.groupby('hostname', observed=True, sort=False):
                 # Get latest values
                 latest = host_data.iloc[-1]
                 avg_percent = host_data['cpu_ready_percent'].mean()
                 
-                print(f"Host: {hostname}")
-                print(f"  Real-time dashboard shows: {avg_percent:.3f}% average")
-                print(f"  Latest raw sum value: {latest['cpu_ready_sum']}")
-                print(f"  Latest percentage: {latest['cpu_ready_percent']:.3f}%")
+                logger.debug("Host: %s", hostname)
+                logger.debug("  Real-time dashboard shows: %.3f%% average", avg_percent)
+                logger.debug("  Latest raw sum value: %s", latest['cpu_ready_sum'])
+                logger.debug("  Latest percentage: %.3f%%", latest['cpu_ready_percent'])
                 
                 # Calculate what main app will see after fixed conversion
                 converted_value = max(1.5, avg_percent * 10)
                 expected_analysis_percent = converted_value / 10  # What analysis will calculate
                 
-                print(f"  Will be stored as: {converted_value:.2f} (forced permille range)")
-                print(f"  Expected analysis result: {expected_analysis_percent:.3f}%")
+                logger.debug("  Will be stored as: %.2f (forced permille range)", converted_value)
+                logger.debug("  Expected analysis result: %.3f%%", expected_analysis_percent)
                 
                 # Check if it's close to real-time dashboard value
                 difference = abs(expected_analysis_percent - avg_percent)
                 match_status = "✅ CLOSE" if difference < 0.05 else "❌ DIFFERENT"
-                print(f"  Match real-time dashboard: {match_status} (diff: {difference:.3f}%)")
-                print()
+                logger.debug("  Match real-time dashboard: %s (diff: %.3f%%)", match_status, difference)
             
         except Exception as e:
-            print(f"DEBUG: Error in verification: {e}")
+            logger.warning("Error in verification: %s", e)
 
     def integrate_realtime_data(self):
         """Integrate real-time data with main application data"""
@@ -266,7 +488,7 @@ class ModernCPUAnalyzer:
             self.interval_var.set("Real-Time")
             self.current_interval = "Real-Time"
             
-            print(f"DEBUG: Successfully integrated real-time data into main application")
+            logger.debug("Successfully integrated real-time data into main application")
             return True
         
         return False
@@ -351,7 +573,7 @@ class ModernCPUAnalyzer:
                     self.realtime_data_info.config(text=info_text)
         
         except Exception as e:
-            print(f"DEBUG: Error updating real-time data info: {e}")
+            logger.warning("Error updating real-time data info: %s", e)
         
         # Schedule next update
         self.root.after(10000, self.update_realtime_data_info)
@@ -476,9 +698,10 @@ class ModernCPUAnalyzer:
             return
         
         # CRITICAL FIX: Clear previous data to prevent mixing
-        print(f"DEBUG: Clearing {len(self.data_frames)} previous dataframes to prevent data mixing")
+        logger.debug("Clearing %s previous dataframes to prevent data mixing", len(self.data_frames))
         self.data_frames = []
         self.processed_data = None
+        self.invalidate_processed_data_cache()
         
         # Get date range based on selected vCenter period
         start_date, end_date = self.get_vcenter_date_range()
@@ -523,72 +746,96 @@ class ModernCPUAnalyzer:
         progress_bar.pack(pady=15)
         progress_bar.start()
         
-        # Track success for auto-flow logic
-        fetch_successful = False
+        # Worker thread only talks to vCenter; results are handed back through a queue
+        # and applied on the Tk thread so the UI stays responsive during long pulls
+        fetch_queue = queue.Queue()
         
-        # Run fetch in separate thread
         def fetch_thread():
-            nonlocal fetch_successful
             try:
                 content = self.vcenter_connection.RetrieveContent()
                 hosts = self.get_all_hosts(content)
                 
                 if not hosts:
-                    messagebox.showwarning("No Hosts", "No ESXi hosts found in vCenter")
+                    fetch_queue.put(('no_hosts', None))
                     return
                 
-                print(f"DEBUG: Fetching {selected_period} data for {len(hosts)} hosts")
+                logger.debug("Fetching %s data for %s hosts", selected_period, len(hosts))
                 cpu_ready_data = self.fetch_cpu_ready_metrics(content, hosts, start_date, end_date, perf_interval, selected_period)
                 
-                if cpu_ready_data:
-                    df = pd.DataFrame(cpu_ready_data)
+                record_count = len(cpu_ready_data['Time'])
+                if record_count:
+                    # Samples arrive long-form (one row per host sample); pivot to the wide
+                    # 'Ready for <host>' layout calculate_cpu_ready expects, one row per timestamp
+                    df = (pd.DataFrame(cpu_ready_data)
+                          .pivot_table(index='Time', columns='Host', values='Ready', aggfunc='first')
+                          .rename(columns=lambda host: f'Ready for {host}')
+                          .rename_axis(columns=None)
+                          .reset_index())
                     df['source_file'] = f'vCenter_{selected_period}_{start_date.strftime("%Y%m%d")}_{end_date.strftime("%Y%m%d")}'
                     
                     # IMPORTANT: Add the selected period to the dataframe for proper analysis
                     df['selected_period'] = selected_period
-                    print(f"DEBUG: Created dataframe with {len(df)} records for {selected_period}")
-                    
-                    self.data_frames.append(df)
-                    self.update_file_status()
-                    self.update_data_preview()
-                    
-                    # Auto-set the interval to match what was fetched
-                    self.interval_var.set(selected_period)
-                    self.current_interval = selected_period
-                    print(f"DEBUG: Set current interval to: {selected_period}")
-                    
-                    # Mark as successful for auto-flow
-                    fetch_successful = True
-                    
-                    # AUTO-FLOW INTEGRATION - Mark workflow state
-                    self.workflow_state['data_imported'] = True
-                    self.workflow_state['last_action'] = 'vcenter_fetch'
+                    logger.debug("Created dataframe with %s records for %s", len(df), selected_period)
                     
-                    # Show traditional success message first
-                    messagebox.showinfo("Success", 
-                                    f"✅ Successfully fetched {selected_period} vCenter data!\n\n"
-                                    f"📊 Period: {selected_period}\n"
-                                    f"🖥️  Hosts: {len(hosts)}\n"
-                                    f"📅 Date Range: {start_date} to {end_date}\n"
-                                    f"📈 Total Records: {len(cpu_ready_data)}")
-                    
-                    # AUTO-FLOW LOGIC - Execute after success message
-                    if self.auto_analyze.get():
-                        self.show_smart_notification(f"{selected_period} data fetched! Auto-analyzing...", 2000)
-                        self.root.after(1500, self.auto_calculate_and_switch)
-                    else:
-                        self.show_action_prompt(f"{selected_period} data ready! Analyze now?", 
-                                            "🔍 Analyze", 
-                                            self.manual_calculate_and_switch)
+                    fetch_queue.put(('data', (df, len(hosts), record_count)))
                 else:
-                    messagebox.showwarning("No Data", f"No CPU Ready data found for {selected_period}")
+                    fetch_queue.put(('no_data', None))
                     
             except Exception as e:
-                messagebox.showerror("Fetch Error", f"Error fetching {selected_period} data from vCenter:\n{str(e)}")
-            finally:
-                progress_window.destroy()
+                fetch_queue.put(('error', e))
+        
+        def drain_fetch_queue():
+            try:
+                result, payload = fetch_queue.get_nowait()
+            except queue.Empty:
+                self.root.after(100, drain_fetch_queue)
+                return
+            
+            progress_window.destroy()
+            self.fetch_btn.config(state='normal')
+            
+            if result == 'no_hosts':
+                messagebox.showwarning("No Hosts", "No ESXi hosts found in vCenter")
+            elif result == 'no_data':
+                messagebox.showwarning("No Data", f"No CPU Ready data found for {selected_period}")
+            elif result == 'error':
+                messagebox.showerror("Fetch Error", f"Error fetching {selected_period} data from vCenter:\n{str(payload)}")
+            else:
+                df, host_count, record_count = payload
+                
+                self.data_frames.append(df)
+                self.update_file_status()
+                self.update_data_preview()
+                
+                # Auto-set the interval to match what was fetched
+                self.interval_var.set(selected_period)
+                self.current_interval = selected_period
+                logger.debug("Set current interval to: %s", selected_period)
+                
+                # AUTO-FLOW INTEGRATION - Mark workflow state
+                self.workflow_state['data_imported'] = True
+                self.workflow_state['last_action'] = 'vcenter_fetch'
+                
+                # Show traditional success message first
+                messagebox.showinfo("Success", 
+                                f"✅ Successfully fetched {selected_period} vCenter data!\n\n"
+                                f"📊 Period: {selected_period}\n"
+                                f"🖥️  Hosts: {host_count}\n"
+                                f"📅 Date Range: {start_date} to {end_date}\n"
+                                f"📈 Total Records: {record_count}")
+                
+                # AUTO-FLOW LOGIC - Execute after success message
+                if self.auto_analyze.get():
+                    self.show_smart_notification(f"{selected_period} data fetched! Auto-analyzing...", 2000)
+                    self.root.after(1500, self.auto_calculate_and_switch)
+                else:
+                    self.show_action_prompt(f"{selected_period} data ready! Analyze now?", 
+                                        "🔍 Analyze", 
+                                        self.manual_calculate_and_switch)
         
+        self.fetch_btn.config(state='disabled')
         threading.Thread(target=fetch_thread, daemon=True).start()
+        self.root.after(100, drain_fetch_queue)
 
     def create_complete_vcenter_section(self, parent):
         """Create complete vCenter integration section with improved formatting - FIXED to include Real-Time"""
@@ -800,45 +1047,71 @@ class ModernCPUAnalyzer:
         
         # Debug output
         time_span_hours = (end_time - start_time).total_seconds() / 3600
-        print(f"DEBUG: Date range for '{period}': {start_time.date()} to {end_time.date()} ({time_span_hours:.1f} hours)")
+        logger.debug("Date range for '%s': %s to %s (%.1f hours)", period, start_time.date(), end_time.date(), time_span_hours)
         
         return start_time.date(), end_time.date()
 
+    def query_perf_batch(self, perf_manager, batch, hostnames_by_moid):
+        """Run one QueryPerf call for a batch of specs, falling back to per-host calls on failure"""
+        try:
+            results = list(perf_manager.QueryPerf(querySpec=batch) or [])
+            self.failing_perf_hosts.difference_update(spec.entity._moId for spec in batch)
+            return results
+        except Exception as e:
+            # One bad entity fails the whole batch - retry host by host so the rest still load
+            logger.warning("Batched query failed (%s), retrying %d hosts individually", e, len(batch))
+            results = []
+            for query_spec in batch:
+                try:
+                    results.extend(perf_manager.QueryPerf(querySpec=[query_spec]) or [])
+                    self.failing_perf_hosts.discard(query_spec.entity._moId)
+                except Exception as host_error:
+                    # Remember the culprit so the next fetch queries it on its own
+                    self.failing_perf_hosts.add(query_spec.entity._moId)
+                    logger.warning("Error fetching data for host %s: %s", hostnames_by_moid.get(query_spec.entity._moId), host_error)
+            return results
+    
     def fetch_cpu_ready_metrics(self, content, hosts, start_date, end_date, interval_seconds, selected_period):
         """Fetch CPU Ready metrics for all hosts with proper interval handling - FIXED TIME PERIOD USAGE"""
         perf_manager = content.perfManager
-        cpu_ready_data = []
-        
-        print(f"DEBUG: Requesting data for period: {selected_period}")
-        print(f"DEBUG: Date range: {start_date} to {end_date}")
-        print(f"DEBUG: Interval: {interval_seconds} seconds")
-        
-        # Find CPU Ready metric
-        counter_info = None
-        for counter in perf_manager.perfCounter:
-            if (counter.groupInfo.key == 'cpu' and 
-                counter.nameInfo.key == 'ready' and 
-                counter.unitInfo.key == 'millisecond'):
-                counter_info = counter
-                print(f"DEBUG: Found CPU Ready counter ID: {counter.key}")
-                break
-        
-        if not counter_info:
-            raise Exception("CPU Ready metric not found in vCenter")
+        # Columnar accumulation - one list per field instead of one dict per sample
+        cpu_ready_data = {'Time': [], 'Host': [], 'Ready': []}
+        ready_chunks = []
+        
+        logger.debug("Requesting data for period: %s", selected_period)
+        logger.debug("Date range: %s to %s", start_date, end_date)
+        logger.debug("Interval: %s seconds", interval_seconds)
+        
+        # Find CPU Ready metric - perfCounter is a large array fetched over SOAP, so only
+        # scan it on the first fetch of each connection
+        if self.cpu_ready_counter_key is None:
+            for counter in perf_manager.perfCounter:
+                if (counter.groupInfo.key == 'cpu' and 
+                    counter.nameInfo.key == 'ready' and 
+                    counter.unitInfo.key == 'millisecond'):
+                    self.cpu_ready_counter_key = counter.key
+                    logger.debug("Found CPU Ready counter ID: %s", counter.key)
+                    break
+            
+            if self.cpu_ready_counter_key is None:
+                raise Exception("CPU Ready metric not found in vCenter")
+        else:
+            logger.debug("Using cached CPU Ready counter ID: %s", self.cpu_ready_counter_key)
         
         # Get available performance intervals from vCenter
-        print("DEBUG: Checking available performance intervals...")
+        logger.debug("Checking available performance intervals...")
         available_intervals = perf_manager.historicalInterval
-        print("DEBUG: Available historical intervals:")
+        logger.debug("Available historical intervals:")
         for interval in available_intervals:
-            print(f"  - Key: {interval.key}, Name: {interval.name}, Period: {interval.samplingPeriod}s, Level: {interval.level}")
+            logger.debug("  - Key: %s, Name: %s, Period: %ss, Level: %s",
+                         interval.key, interval.name, interval.samplingPeriod, interval.level)
 
         # Debug vCenter version info
         try:
             about_info = content.about
-            print(f"DEBUG: vCenter version: {about_info.name} {about_info.version} (build {about_info.build})")
+            logger.debug("vCenter version: %s %s (build %s)", about_info.name, about_info.version, about_info.build)
         except:
-            print("DEBUG: Could not retrieve vCenter version info")
+            logger.debug("Could not retrieve vCenter version info")
         
         # Convert dates to vCenter format - FIXED TIME RANGE CALCULATION
         start_time = datetime.combine(start_date, datetime.min.time())
@@ -862,17 +1135,17 @@ class ModernCPUAnalyzer:
                 start_time = datetime.now() - timedelta(days=365)
                 end_time = datetime.now()
             
-            print(f"DEBUG: Adjusted time range for vCenter 8.0+: {start_time} to {end_time}")
+            logger.debug("Adjusted time range for vCenter 8.0+: %s to %s", start_time, end_time)
         
-        print(f"DEBUG: Time difference: {time_diff} seconds ({time_diff/3600:.1f} hours)")
-        print(f"DEBUG: Looking for interval close to: {interval_seconds} seconds")
+        logger.debug("Time difference: %s seconds (%.1f hours)", time_diff, time_diff / 3600)
+        logger.debug("Looking for interval close to: %s seconds", interval_seconds)
         
         # FIXED: Better interval selection based on the selected period
         selected_interval = None
         use_realtime = False
         
         if selected_period == "Real-Time" or time_diff <= 3600:
-            print("DEBUG: Using real-time data approach")
+            logger.debug("Using real-time data approach")
             selected_interval = None  # Real-time uses no intervalId
             use_realtime = True
         else:
@@ -880,150 +1153,152 @@ class ModernCPUAnalyzer:
             best_interval = None
             best_diff = float('inf')
             
-            print(f"DEBUG: Looking for historical interval close to {interval_seconds} seconds")
+            logger.debug("Looking for historical interval close to %s seconds", interval_seconds)
             
             for interval in available_intervals:
                 # Calculate how close this interval's period is to what we want
                 period_diff = abs(interval.samplingPeriod - interval_seconds)
-                print(f"  - Checking interval {interval.key}: {interval.samplingPeriod}s (diff: {period_diff})")
+                logger.debug("  - Checking interval %s: %ss (diff: %s)", interval.key, interval.samplingPeriod, period_diff)
                 
                 if period_diff < best_diff:
                     best_diff = period_diff
                     best_interval = interval
-                    print(f"    - New best match: {interval.key} (diff: {period_diff})")
+                    logger.debug("    - New best match: %s (diff: %s)", interval.key, period_diff)
             
             if best_interval and best_diff < interval_seconds:  # Only use if it's reasonably close
                 selected_interval = best_interval.key
                 actual_interval = best_interval.samplingPeriod
-                print(f"DEBUG: Selected historical interval: Key={selected_interval}, Period={actual_interval}s, Name={best_interval.name}")
+                logger.debug("Selected historical interval: Key=%s, Period=%ss, Name=%s",
+                             selected_interval, actual_interval, best_interval.name)
                 
                 # Update interval_seconds to match what vCenter actually uses
                 interval_seconds = actual_interval
             else:
-                print("DEBUG: No suitable historical interval found or too far from requested, falling back to real-time")
+                logger.debug("No suitable historical interval found or too far from requested, falling back to real-time")
                 selected_interval = None
                 use_realtime = True
         
         # Fetch data for each host
-        print(f"DEBUG: Fetching data for {len(hosts)} hosts using {'real-time' if use_realtime else f'historical interval {selected_interval}'}...")
+        if use_realtime:
+            logger.debug("Fetching data for %d hosts using real-time...", len(hosts))
+        else:
+            logger.debug("Fetching data for %d hosts using historical interval %s...", len(hosts), selected_interval)
+        
+        # vCenter version only needs to be parsed once for all hosts
+        vcenter_version = float('.'.join(content.about.version.split('.')[:2]))  # Extract major.minor version
+        
+        # Create metric specification - identical for every host, so built once
+        metric_spec = vim.PerformanceManager.MetricId(
+            counterId=self.cpu_ready_counter_key,
+            instance=""  # Empty instance for aggregate data
+        )
+        
+        # Create the query specification fields - FIXED TIME RANGE. Only the entity differs per host
+        query_fields = {
+            'metricId': [metric_spec],
+            'startTime': start_time,
+            'endTime': end_time
+        }
+        if use_realtime:
+            # Real-time query - no intervalId specified, limited time range
+            query_fields['maxSample'] = 100  # Limit for real-time
+            logger.debug("Using real-time query")
+        elif vcenter_version >= 8.0:
+            # vCenter 8.0+ - Don't use intervalId at all
+            query_fields['maxSample'] = 1000
+            logger.debug("Using vCenter 8.0+ compatible query (no intervalId)")
+        else:
+            # vCenter 7.x and below - Historical query with proper intervalId
+            query_fields['maxSample'] = 1000
+            query_fields['intervalId'] = selected_interval
+            logger.debug("Using historical query with intervalId %s", selected_interval)
+        
+        # Build one query spec per host, then fetch them all in a single QueryPerf round-trip
+        query_specs = []
+        hostnames_by_moid = {}
         
         for host_info in hosts:
             try:
                 host = host_info['object']
                 hostname = host_info['name']
-                print(f"DEBUG: Processing host: {hostname}")
+                logger.debug("Processing host: %s", hostname)
                 
-                # Create metric specification
-                metric_spec = vim.PerformanceManager.MetricId(
-                    counterId=counter_info.key,
-                    instance=""  # Empty instance for aggregate data
-                )
+                query_specs.append(vim.PerformanceManager.QuerySpec(entity=host, **query_fields))
+                hostnames_by_moid[host._moId] = hostname
                 
-                # Create the query specification - FIXED TIME RANGE
-                if use_realtime:
-                    # Real-time query - no intervalId specified, limited time range
-                    query_spec = vim.PerformanceManager.QuerySpec(
-                        entity=host,
-                        metricId=[metric_spec],
-                        maxSample=100,  # Limit for real-time
-                        startTime=start_time,
-                        endTime=end_time
-                    )
-                    print(f"DEBUG: Using real-time query for {hostname}")
-                else:
-                    # Historical query with proper intervalId and time range
-                    # Check vCenter version to determine query method
-                    vcenter_version = float('.'.join(content.about.version.split('.')[:2]))  # Extract major.minor version
-                    if vcenter_version >= 8.0:
-                        # vCenter 8.0+ - Don't use intervalId at all
-                        query_spec = vim.PerformanceManager.QuerySpec(
-                            entity=host,
-                            metricId=[metric_spec],
-                            maxSample=1000,
-                            startTime=start_time,
-                            endTime=end_time
-                        )
-                        print(f"DEBUG: Using vCenter 8.0+ compatible query (no intervalId)")
-                    else:
-                        # vCenter 7.x and below - Try with intervalId
-                        try:
-                            query_spec = vim.PerformanceManager.QuerySpec(
-                                entity=host,
-                                metricId=[metric_spec],
-                                intervalId=selected_interval,
-                                maxSample=1000,
-                                startTime=start_time,
-                                endTime=end_time
-                            )
-                            print(f"DEBUG: Using historical query with intervalId {selected_interval}")
-                        except:
-                            # Fallback for older vCenter versions
-                            query_spec = vim.PerformanceManager.QuerySpec(
-                                entity=host,
-                                metricId=[metric_spec],
-                                maxSample=1000,
-                                startTime=start_time,
-                                endTime=end_time
-                            )
-                            print(f"DEBUG: Fallback to query without intervalId")
-
-                print(f"DEBUG: Executing query for {hostname} from {start_time} to {end_time}...")
-
-                # Execute query
-                perf_data = perf_manager.QueryPerf(querySpec=[query_spec])
+            except Exception as e:
+                logger.warning("Error building query for host %s: %s", host_info.get('name'), e)
+                continue
+        
+        logger.debug("Executing batched query for %d hosts from %s to %s...", len(query_specs), start_time, end_time)
+        
+        # Execute query in bounded batches so large clusters don't hit vCenter's per-call limits.
+        # The calls are network-bound, so batches run concurrently (capped to spare vpxd)
+        # Hosts that failed individually last time get their own call, so they can't knock a
+        # healthy batch into the slow one-by-one fallback again
+        healthy_specs = [spec for spec in query_specs if spec.entity._moId not in self.failing_perf_hosts]
+        suspect_specs = [spec for spec in query_specs if spec.entity._moId in self.failing_perf_hosts]
+        if suspect_specs:
+            logger.debug("Querying %d previously failing hosts individually", len(suspect_specs))
+        batches = [healthy_specs[i:i + _QUERY_PERF_BATCH_SIZE]
+                   for i in range(0, len(healthy_specs), _QUERY_PERF_BATCH_SIZE)]
+        batches.extend([spec] for spec in suspect_specs)
+        perf_results = []
+        if batches:
+            with ThreadPoolExecutor(max_workers=min(8, len(batches))) as executor:
+                for batch_results in executor.map(
+                        lambda batch: self.query_perf_batch(perf_manager, batch, hostnames_by_moid), batches):
+                    perf_results.extend(batch_results)
+        
+        for entity_metric in perf_results:
+            hostname = hostnames_by_moid.get(entity_metric.entity._moId, entity_metric.entity._moId)
+            try:
+                logger.debug("Query successful for %s", hostname)
                 
-                if perf_data and len(perf_data) > 0:
-                    print(f"DEBUG: Query successful for {hostname}")
+                if entity_metric.value and len(entity_metric.value) > 0:
+                    samples_found = len(entity_metric.sampleInfo)
+                    logger.debug("Found %d samples for %s", samples_found, hostname)
                     
-                    if perf_data[0].value and len(perf_data[0].value) > 0:
-                        samples_found = len(perf_data[0].sampleInfo)
-                        print(f"DEBUG: Found {samples_found} samples for {hostname}")
-                        
-                        if samples_found == 0:
-                            print(f"DEBUG: No sample data for {hostname}")
-                            continue
-                        
-                        # Process the performance data
-                        for i, sample_info in enumerate(perf_data[0].sampleInfo):
-                            timestamp = sample_info.timestamp
-                            
-                            # Get CPU Ready value for this timestamp
-                            total_ready = 0
-                            for value_info in perf_data[0].value:
-                                if i < len(value_info.value) and value_info.value[i] is not None:
-                                    # FIXED: Don't exclude zero values - they are valid
-                                    if value_info.value[i] >= 0:  # Include zero values
-                                        total_ready += value_info.value[i]
-                            
-                            # Add data point (including zero values)
-                            cpu_ready_data.append({
-                                'Time': timestamp.isoformat() + 'Z',
-                                f'Ready for {hostname}': total_ready,
-                                'Hostname': hostname.split('.')[0]  # Short hostname
-                            })
-                            
-                            # Debug for first few samples
-                            if i < 3:
-                                print(f"DEBUG: Sample {i} for {hostname}: timestamp={timestamp}, total_ready={total_ready}")
-                    else:
-                        print(f"DEBUG: No values in performance data for {hostname}")
+                    if samples_found == 0:
+                        logger.debug("No sample data for %s", hostname)
+                        continue
+                    
+                    # Process the performance data - stack instances x samples and sum columns in numpy.
+                    # Negative values are vCenter's "no data" marker; zeros are valid and kept
+                    ready_matrix = np.zeros((len(entity_metric.value), samples_found), dtype=np.int64)
+                    for row, value_info in zip(ready_matrix, entity_metric.value):
+                        values = np.asarray(value_info.value[:samples_found], dtype=np.int64)
+                        row[:len(values)] = values
+                    totals = np.where(ready_matrix >= 0, ready_matrix, 0).sum(axis=0)
+                    
+                    cpu_ready_data['Time'].extend(sample_info.timestamp.isoformat() + 'Z'
+                                                  for sample_info in entity_metric.sampleInfo)
+                    cpu_ready_data['Host'].extend([hostname] * samples_found)
+                    # Kept as one int64 array per host (8 bytes/sample, not a boxed Python int)
+                    ready_chunks.append(totals)
+                    
+                    # Debug for first few samples
+                    if logger.isEnabledFor(logging.DEBUG):
+                        for i, (sample_info, total_ready) in enumerate(zip(entity_metric.sampleInfo[:3], totals)):
+                            logger.debug("Sample %d for %s: timestamp=%s, total_ready=%s", i, hostname, sample_info.timestamp, total_ready)
                 else:
-                    print(f"DEBUG: No performance data returned for {hostname}")
+                    logger.debug("No values in performance data for %s", hostname)
                     
             except Exception as e:
-                print(f"DEBUG: Error fetching data for host {hostname}: {e}")
+                logger.warning("Error processing data for host %s: %s", hostname, e)
                 continue
         
-        print(f"DEBUG: Total records collected: {len(cpu_ready_data)}")
+        cpu_ready_data['Ready'] = np.concatenate(ready_chunks) if ready_chunks else np.empty(0, dtype=np.int64)
+        logger.debug("Total records collected: %d", len(cpu_ready_data['Time']))
         
-        if len(cpu_ready_data) == 0:
-            print("DEBUG: No data collected from any host!")
+        if len(cpu_ready_data['Time']) == 0:
+            logger.warning("No data collected from any host!")
             # Try to provide helpful information
-            print("DEBUG: Possible issues:")
-            print("  - Time range might be outside available data")
-            print("  - Selected interval might not have data")
-            print("  - Hosts might not have CPU Ready metrics enabled")
-            print("  - vCenter might not be collecting performance data")
+            logger.warning("Possible issues:")
+            logger.warning("  - Time range might be outside available data")
+            logger.warning("  - Selected interval might not have data")
+            logger.warning("  - Hosts might not have CPU Ready metrics enabled")
+            logger.warning("  - vCenter might not be collecting performance data")
         
         return cpu_ready_data
  
@@ -1411,7 +1686,7 @@ class ModernCPUAnalyzer:
             summary_data = [
                 ["Metric", "Value"],
                 ["Analysis Date", datetime.now().strftime('%Y-%m-%d %H:%M:%S')],
-                ["Total Hosts Analyzed", str(len(self.processed_data['Hostname'].unique()))],
+                ["Total Hosts Analyzed", str(len(self.get_sorted_hostnames()))],
                 ["Analysis Period", self.current_interval],
                 ["Total Records", f"{len(self.processed_data):,}"],
                 ["Date Range", f"{self.processed_data['Time'].min().strftime('%Y-%m-%d')} to {self.processed_data['Time'].max().strftime('%Y-%m-%d')}"],
@@ -1468,17 +1743,19 @@ class ModernCPUAnalyzer:
             
             host_analysis_details = []
             
-            for hostname in sorted(self.processed_data['Hostname'].unique()):
-                host_df = self.processed_data[self.processed_data['Hostname'] == hostname]
+            warning_level = self.warning_threshold.get()
+            critical_level = self.critical_threshold.get()
+            for hostname in self.get_sorted_hostnames():
+                host_df = self.get_host_groups()[hostname]
                 avg_cpu = host_df['CPU_Ready_Percent'].mean()
                 max_cpu = host_df['CPU_Ready_Percent'].max()
                 min_cpu = host_df['CPU_Ready_Percent'].min()
                 std_cpu = host_df['CPU_Ready_Percent'].std()
                 health_score = self.calculate_health_score(avg_cpu, max_cpu, std_cpu)
                 
-                if avg_cpu >= self.critical_threshold.get():
+                if avg_cpu >= critical_level:
                     status = "Critical"
-                elif avg_cpu >= self.warning_threshold.get():
+                elif avg_cpu >= warning_level:
                     status = "Warning"
                 else:
                     status = "Healthy"
@@ -1663,8 +1940,7 @@ class ModernCPUAnalyzer:
             
         except Exception as e:
             messagebox.showerror("PDF Export Error", f"Failed to generate PDF report:\n{str(e)}")
-            import traceback
-            print(f"PDF Export Error Details: {traceback.format_exc()}")
+            logger.exception("PDF export failed")
         finally:
             self.hide_progress()
 
@@ -1682,12 +1958,9 @@ class ModernCPUAnalyzer:
             # Modern color palette for PDF (darker colors for better printing)
             colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b', '#e377c2', '#7f7f7f']
             
-            hostnames = sorted(self.processed_data['Hostname'].unique())
+            host_groups = self.get_host_groups()
             
-            for i, hostname in enumerate(hostnames):
-                host_data = self.processed_data[self.processed_data['Hostname'] == hostname].copy()
-                host_data = host_data.sort_values('Time')
-                
+            for i, (hostname, host_data) in enumerate(host_groups.items()):
                 color = colors[i % len(colors)]
                 ax_copy.plot(host_data['Time'], host_data['CPU_Ready_Percent'],
                             marker='o', markersize=2, linewidth=2, label=hostname,
@@ -1734,7 +2007,7 @@ class ModernCPUAnalyzer:
                 
                 return chart_img
         except Exception as e:
-            print(f"DEBUG: Could not generate timeline chart for PDF: {e}")
+            logger.warning("Could not generate timeline chart for PDF: %s", e)
             return None
 
     def generate_host_comparison_chart_for_pdf(self):
@@ -1749,13 +2022,13 @@ class ModernCPUAnalyzer:
             ax_comp.set_facecolor('white')
             
             # Prepare data
-            hostnames = sorted(self.processed_data['Hostname'].unique())
+            hostnames = self.get_sorted_hostnames()
             avg_cpu_values = []
             max_cpu_values = []
             health_scores = []
             
             for hostname in hostnames:
-                host_data = self.processed_data[self.processed_data['Hostname'] == hostname]
+                host_data = self.get_host_groups()[hostname]
                 avg_cpu = host_data['CPU_Ready_Percent'].mean()
                 max_cpu = host_data['CPU_Ready_Percent'].max()
                 health_score = self.calculate_health_score(avg_cpu, max_cpu, host_data['CPU_Ready_Percent'].std())
@@ -1801,12 +2074,13 @@ class ModernCPUAnalyzer:
                 
                 return chart_img
         except Exception as e:
-            print(f"DEBUG: Could not generate comparison chart for PDF: {e}")
+            logger.warning("Could not generate comparison chart for PDF: %s", e)
             return None
 
     def generate_timeline_analysis_text(self):
         """Generate timeline analysis text for PDF"""
-        overall_avg = self.processed_data['CPU_Ready_Percent'].mean()
+        self.ensure_workload_totals()
+        overall_avg = self._overall_avg_pct
         overall_max = self.processed_data['CPU_Ready_Percent'].max()
         date_range = (self.processed_data['Time'].max() - self.processed_data['Time'].min()).days
         
@@ -1824,8 +2098,8 @@ class ModernCPUAnalyzer:
             analysis += "Elevated CPU Ready levels indicate potential resource contention that should be investigated. "
         
         # Add host-specific insights
-        critical_hosts = [h for h in self.processed_data['Hostname'].unique() 
-                        if self.processed_data[self.processed_data['Hostname']==h]['CPU_Ready_Percent'].mean() >= self.critical_threshold.get()]
+        host_means = self.processed_data.groupby('Hostname', observed=True)['CPU_Ready_Percent'].mean()
+        critical_hosts = host_means.index[host_means >= self.critical_threshold.get()].tolist()
         
         if critical_hosts:
             analysis += f"<br/><br/><b>Attention Required:</b> {len(critical_hosts)} host(s) exceed critical thresholds and require immediate investigation."
@@ -1839,7 +2113,7 @@ class ModernCPUAnalyzer:
         if not hasattr(self, 'current_recommendations') or not self.current_recommendations:
             return "AI recommendations not available. Please generate recommendations first."
         
-        total_hosts = len(self.processed_data['Hostname'].unique())
+        total_hosts = len(self.get_sorted_hostnames())
         recommended_count = len(self.current_recommendations)
         reduction_percentage = (recommended_count / total_hosts) * 100
         
@@ -1873,16 +2147,11 @@ class ModernCPUAnalyzer:
         if not hasattr(self, 'current_recommendations') or not self.current_recommendations:
             return ""
         
-        total_hosts = len(self.processed_data['Hostname'].unique())
+        total_hosts = len(self.get_sorted_hostnames())
         recommended_hosts = [rec['hostname'] for rec in self.current_recommendations]
         
-        # Calculate workload impact
-        total_workload = self.processed_data['CPU_Ready_Sum'].sum()
-        recommended_workload = self.processed_data[
-            self.processed_data['Hostname'].isin(recommended_hosts)
-        ]['CPU_Ready_Sum'].sum()
-        
-        workload_percentage = (recommended_workload / total_workload) * 100 if total_workload > 0 else 0
+        # Calculate workload impact from the cached per-host sums
+        recommended_workload, workload_percentage = self.impact_for(recommended_hosts)
         remaining_hosts = total_hosts - len(recommended_hosts)
         
         impact_text = f"""
@@ -1910,12 +2179,13 @@ class ModernCPUAnalyzer:
 
     def generate_distribution_analysis_text(self):
         """Generate performance distribution analysis text"""
-        overall_std = self.processed_data['CPU_Ready_Percent'].std()
-        overall_mean = self.processed_data['CPU_Ready_Percent'].mean()
+        cpu_ready = self.processed_data['CPU_Ready_Percent'].to_numpy(dtype=np.float64)
+        overall_std = cpu_ready.std(ddof=1) if cpu_ready.size > 1 else float('nan')
+        overall_mean = cpu_ready.mean()
         cv = (overall_std / overall_mean) * 100 if overall_mean > 0 else 0
         
-        p95 = self.processed_data['CPU_Ready_Percent'].quantile(0.95)
-        p99 = self.processed_data['CPU_Ready_Percent'].quantile(0.99)
+        # Both percentiles from a single partition of the data
+        p95, p99 = np.percentile(cpu_ready, [95, 99])
         
         text = f"""
         <b>Performance Distribution Analysis:</b><br/>
@@ -1937,9 +2207,10 @@ class ModernCPUAnalyzer:
 
     def generate_implementation_recommendations(self):
         """Generate implementation recommendations based on analysis"""
-        overall_avg = self.processed_data['CPU_Ready_Percent'].mean()
-        critical_hosts = len([h for h in self.processed_data['Hostname'].unique() 
-                            if self.processed_data[self.processed_data['Hostname']==h]['CPU_Ready_Percent'].mean() >= self.critical_threshold.get()])
+        self.ensure_workload_totals()
+        overall_avg = self._overall_avg_pct
+        host_means = self.processed_data.groupby('Hostname', observed=True)['CPU_Ready_Percent'].mean()
+        critical_hosts = int((host_means >= self.critical_threshold.get()).sum())
         
         recommendations = "<b>Immediate Actions:</b><br/>"
         
@@ -1978,33 +2249,36 @@ class ModernCPUAnalyzer:
         if self.processed_data is None:
             return {}
         
-        unique_hosts = self.processed_data['Hostname'].unique()
+        unique_hosts = self.get_sorted_hostnames()
         
         critical_hosts = 0
         warning_hosts = 0
         healthy_hosts = 0
         key_findings = []
         
+        warning_level = self.warning_threshold.get()
+        critical_level = self.critical_threshold.get()
         for hostname in unique_hosts:
-            host_data = self.processed_data[self.processed_data['Hostname'] == hostname]
+            host_data = self.get_host_groups()[hostname]
             avg_cpu = host_data['CPU_Ready_Percent'].mean()
             
-            if avg_cpu >= self.critical_threshold.get():
+            if avg_cpu >= critical_level:
                 critical_hosts += 1
-            elif avg_cpu >= self.warning_threshold.get():
+            elif avg_cpu >= warning_level:
                 warning_hosts += 1
             else:
                 healthy_hosts += 1
         
         # Generate key findings
         total_hosts = len(unique_hosts)
-        overall_avg = self.processed_data['CPU_Ready_Percent'].mean()
+        self.ensure_workload_totals()
+        overall_avg = self._overall_avg_pct
         
         if critical_hosts > 0:
-            key_findings.append(f"{critical_hosts} hosts require immediate attention (>={self.critical_threshold.get()}% CPU Ready)")
+            key_findings.append(f"{critical_hosts} hosts require immediate attention (>={critical_level}% CPU Ready)")
             overall_health = "Needs Attention"
         elif warning_hosts > 0:
-            key_findings.append(f"{warning_hosts} hosts need monitoring (>={self.warning_threshold.get()}% CPU Ready)")
+            key_findings.append(f"{warning_hosts} hosts need monitoring (>={warning_level}% CPU Ready)")
             overall_health = "Good with Monitoring"
         else:
             key_findings.append("All hosts performing within healthy parameters")
@@ -2045,7 +2319,7 @@ class ModernCPUAnalyzer:
                 
                 return chart_img
         except Exception as e:
-            print(f"DEBUG: Could not generate chart for PDF: {e}")
+            logger.warning("Could not generate chart for PDF: %s", e)
             return None
 
     def create_analysis_tab(self):
@@ -2510,6 +2784,14 @@ class ModernCPUAnalyzer:
         
         return popup
     
+    def close_figure_on_destroy(self, window, fig):
+        """Release a popup's matplotlib figure from pyplot when the popup window is destroyed"""
+        def on_destroy(event):
+            # <Destroy> also fires for every child widget - only react to the window itself
+            if event.widget is window:
+                plt.close(fig)
+        window.bind('<Destroy>', on_destroy, add='+')
+    
     def create_styled_frame(self, parent, text=""):
         """Create a styled frame with consistent dark theme"""
         frame = tk.LabelFrame(parent, text=f"  {text}  " if text else "",
@@ -2639,11 +2921,13 @@ class ModernCPUAnalyzer:
         
         # Create matplotlib figure with modern styling
         self.fig, self.ax = plt.subplots(figsize=(12, 6))
+        self._figure_finalizer = weakref.finalize(self, plt.close, self.fig)
         self.fig.patch.set_facecolor(self.colors['bg_primary'])
         self.ax.set_facecolor(self.colors['bg_secondary'])
         
         self.canvas = FigureCanvasTkAgg(self.fig, master=chart_content)
         self.canvas.get_tk_widget().grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self._chart_layout_signature = None  # What the last tight_layout was computed for
         
     def create_host_management_tab(self):
         """Create enhanced host management tab with auto-recommendations"""
@@ -2878,13 +3162,13 @@ class ModernCPUAnalyzer:
             return []
         
         hosts = []
-        total_hosts = len(self.processed_data['Hostname'].unique())
+        total_hosts = len(self.get_sorted_hostnames())
         
-        print(f"DEBUG: Analyzing {total_hosts} hosts for consolidation with {strategy} strategy")
+        logger.debug("Analyzing %s hosts for consolidation with %s strategy", total_hosts, strategy)
         
         # Analyze each host
-        for hostname in self.processed_data['Hostname'].unique():
-            host_data = self.processed_data[self.processed_data['Hostname'] == hostname]
+        for hostname in self.get_sorted_hostnames():
+            host_data = self.get_host_groups()[hostname]
             
             # Calculate comprehensive metrics
             metrics = self.calculate_host_metrics(host_data, hostname)
@@ -2909,7 +3193,7 @@ class ModernCPUAnalyzer:
         # Apply strategy-specific filtering
         recommendations = self.apply_strategy_filtering(hosts, strategy, target_count)
         
-        print(f"DEBUG: Recommending {len(recommendations)} hosts for removal out of {total_hosts}")
+        logger.debug("Recommending %s hosts for removal out of %s", len(recommendations), total_hosts)
         
         return recommendations
 
@@ -2950,24 +3234,24 @@ class ModernCPUAnalyzer:
         # Time-based analysis if enough data
         if len(host_data) > 24:
             try:
-                host_data_copy = host_data.copy()
-                host_data_copy['Hour'] = host_data_copy['Time'].dt.hour
-                host_data_copy['DayOfWeek'] = host_data_copy['Time'].dt.dayofweek
+                # Read-only view of the host group; no need to copy it just to add helper columns
+                cpu_ready = host_data['CPU_Ready_Percent']
+                is_weekend = (host_data['Time'].dt.dayofweek >= 5).to_numpy()
                 
                 # Peak hours analysis
-                hourly_avg = host_data_copy.groupby('Hour')['CPU_Ready_Percent'].mean()
+                hourly_avg = cpu_ready.groupby(host_data['Time'].dt.hour.to_numpy()).mean()
                 metrics['peak_hour'] = hourly_avg.idxmax()
                 metrics['peak_hour_value'] = hourly_avg.max()
                 metrics['off_peak_avg'] = hourly_avg.quantile(0.25)
                 
                 # Weekend vs weekday
-                weekday_avg = host_data_copy[host_data_copy['DayOfWeek'] < 5]['CPU_Ready_Percent'].mean()
-                weekend_avg = host_data_copy[host_data_copy['DayOfWeek'] >= 5]['CPU_Ready_Percent'].mean()
+                weekday_avg = cpu_ready[~is_weekend].mean()
+                weekend_avg = cpu_ready[is_weekend].mean()
                 metrics['weekday_avg'] = weekday_avg if not pd.isna(weekday_avg) else metrics['avg_cpu_ready']
                 metrics['weekend_avg'] = weekend_avg if not pd.isna(weekend_avg) else metrics['avg_cpu_ready']
                 
             except Exception as e:
-                print(f"DEBUG: Time analysis error for {hostname}: {e}")
+                logger.warning("Time analysis error for %s: %s", hostname, e)
         
         return metrics
 
@@ -2980,31 +3264,31 @@ class ModernCPUAnalyzer:
         max_sample = sample_values.max()
         min_sample = sample_values.min()
         
-        print(f"DEBUG: Enhanced analysis for {source_info}")
-        print(f"  Sample size: {len(sample_values)}")
-        print(f"  Min: {min_sample:.2f}, Max: {max_sample:.2f}, Avg: {avg_sample:.2f}")
-        print(f"  Interval: {interval_seconds} seconds")
+        logger.debug("Enhanced analysis for %s", source_info)
+        logger.debug("  Sample size: %s", len(sample_values))
+        logger.debug("  Min: %.2f, Max: %.2f, Avg: %.2f", min_sample, max_sample, avg_sample)
+        logger.debug("  Interval: %s seconds", interval_seconds)
         
         # Check for percentage data first (vCenter sometimes returns ready %)
         if avg_sample <= 100 and max_sample <= 100 and min_sample >= 0:
             # Check if values are reasonable percentages
             realistic_check = len(sample_values[sample_values <= 50]) / len(sample_values)
             if realistic_check > 0.8:  # 80% of values are <= 50%
-                print(f"  Format detected: Already in percentage")
+                logger.debug("  Format detected: Already in percentage")
                 subset['CPU_Ready_Percent'] = subset['CPU_Ready_Sum']
                 return subset
         
         # Calculate expected maximum CPU Ready in milliseconds for this interval
         max_possible_ms = interval_seconds * 1000
         
-        print(f"  Max possible CPU Ready for {interval_seconds}s interval: {max_possible_ms}ms")
+        logger.debug("  Max possible CPU Ready for %ss interval: %sms", interval_seconds, max_possible_ms)
         
         # Detect data format based on magnitude and interval
         if avg_sample > max_possible_ms * 10:
             # Data is likely in microseconds
             conversion_factor = max_possible_ms * 10  # Conservative estimate
             subset['CPU_Ready_Percent'] = (subset['CPU_Ready_Sum'] / conversion_factor) * 100
-            print(f"  Format detected: Microseconds, using factor {conversion_factor}")
+            logger.debug("  Format detected: Microseconds, using factor %s", conversion_factor)
             
         elif avg_sample > max_possible_ms:
             # Data might be cumulative or in wrong units
@@ -3013,16 +3297,16 @@ class ModernCPUAnalyzer:
                 # For daily data, values might be cumulative seconds
                 conversion_factor = interval_seconds * 100  # Assume centiseconds
                 subset['CPU_Ready_Percent'] = (subset['CPU_Ready_Sum'] / conversion_factor) * 100
-                print(f"  Format detected: Daily cumulative, using factor {conversion_factor}")
+                logger.debug("  Format detected: Daily cumulative, using factor %s", conversion_factor)
             else:
                 # Standard millisecond conversion but with safety check
                 subset['CPU_Ready_Percent'] = (subset['CPU_Ready_Sum'] / max_possible_ms) * 100
-                print(f"  Format detected: Milliseconds (high values)")
+                logger.debug("  Format detected: Milliseconds (high values)")
         
         elif avg_sample > 1000:
             # Likely milliseconds (standard vCenter format)
             subset['CPU_Ready_Percent'] = (subset['CPU_Ready_Sum'] / max_possible_ms) * 100
-            print(f"  Format detected: Milliseconds (standard)")
+            logger.debug("  Format detected: Milliseconds (standard)")
             
         elif avg_sample > 100:
             # Could be centipercent or permille
@@ -3032,39 +3316,39 @@ class ModernCPUAnalyzer:
             else:
                 # Likely centipercent
                 subset['CPU_Ready_Percent'] = subset['CPU_Ready_Sum'] / 100
-            print(f"  Format detected: Centipercent/Centiseconds")
+            logger.debug("  Format detected: Centipercent/Centiseconds")
             
         elif avg_sample > 10:
             # Could be permille or deciseconds
             subset['CPU_Ready_Percent'] = subset['CPU_Ready_Sum'] / 10
-            print(f"  Format detected: Permille/Deciseconds")
+            logger.debug("  Format detected: Permille/Deciseconds")
             
         else:
             # Likely already in reasonable percentage range
             subset['CPU_Ready_Percent'] = subset['CPU_Ready_Sum']
-            print(f"  Format detected: Direct percentage")
+            logger.debug("  Format detected: Direct percentage")
         
         # Post-conversion validation
         final_avg = subset['CPU_Ready_Percent'].mean()
         final_max = subset['CPU_Ready_Percent'].max()
         
-        print(f"  After conversion: Avg={final_avg:.3f}%, Max={final_max:.3f}%")
+        logger.debug("  After conversion: Avg=%.3f%%, Max=%.3f%%", final_avg, final_max)
         
         # Sanity check - if still way too high, try alternative conversion
         if final_avg > 50:  # 50% avg is unrealistic for most environments
-            print(f"  WARNING: Still high values, trying alternative conversion")
+            logger.warning("Still high values, trying alternative conversion")
             
             # Try treating as centiseconds instead of milliseconds
             subset['CPU_Ready_Percent'] = (subset['CPU_Ready_Sum'] / (interval_seconds * 100)) * 100
             alt_avg = subset['CPU_Ready_Percent'].mean()
             
             if alt_avg < final_avg and alt_avg > 0:
-                print(f"  Alternative conversion better: {alt_avg:.3f}%")
+                logger.debug("  Alternative conversion better: %.3f%%", alt_avg)
                 final_avg = alt_avg
             else:
                 # If still bad, just cap at reasonable values
                 subset.loc[subset['CPU_Ready_Percent'] > 100, 'CPU_Ready_Percent'] = 100
-                print(f"  Capped extreme values at 100%")
+                logger.debug("  Capped extreme values at 100%")
         
         return subset
 
@@ -3078,11 +3362,11 @@ class ModernCPUAnalyzer:
         vcenter_format = self.detect_vcenter_data_format(df, filename)
         
         if vcenter_format == 'vcenter_summation':
-            print(f"DEBUG: vCenter summation data detected")
+            logger.debug("vCenter summation data detected")
             # Summation data often needs different handling
             
         elif vcenter_format == 'vcenter_average':
-            print(f"DEBUG: vCenter average data detected")
+            logger.debug("vCenter average data detected")
             # Average data is often already processed
             
         return base_interval
@@ -3332,21 +3616,12 @@ class ModernCPUAnalyzer:
     """
         
         # Overall impact assessment
-        total_hosts = len(self.processed_data['Hostname'].unique())
+        total_hosts = len(self.get_sorted_hostnames())
         removal_percentage = (len(recommendations) / total_hosts) * 100
         
-        # Calculate workload redistribution
-        total_workload = 0
-        recommended_workload = 0
-        
-        for hostname in self.processed_data['Hostname'].unique():
-            host_workload = self.processed_data[self.processed_data['Hostname'] == hostname]['CPU_Ready_Sum'].sum()
-            total_workload += host_workload
-            
-            if any(rec['hostname'] == hostname for rec in recommendations):
-                recommended_workload += host_workload
-        
-        workload_redistribution = (recommended_workload / total_workload) * 100 if total_workload > 0 else 0
+        # Calculate workload redistribution from the cached per-host sums
+        recommended_hosts = list({rec['hostname'] for rec in recommendations})
+        recommended_workload, workload_redistribution = self.impact_for(recommended_hosts)
         
         report += f"""
     📊 IMPACT ASSESSMENT:
@@ -3406,27 +3681,29 @@ class ModernCPUAnalyzer:
 
     def update_host_list(self):
         """Update host selection listbox with performance indicators"""
-        print(f"DEBUG: update_host_list called")
+        logger.debug("update_host_list called")
         if self.processed_data is None:
-            print(f"DEBUG: No processed data available")
+            logger.debug("No processed data available")
             return
         
-        unique_hosts = self.processed_data['Hostname'].unique()
-        print(f"DEBUG: Found {len(unique_hosts)} unique hosts: {list(unique_hosts)}")
+        unique_hosts = self.get_sorted_hostnames()
+        logger.debug("Found %s unique hosts: %s", len(unique_hosts), list(unique_hosts))
         
         # ADD THESE DEBUG LINES:
-        print(f"DEBUG: Listbox exists: {hasattr(self, 'hosts_listbox')}")
+        logger.debug("Listbox exists: %s", hasattr(self, 'hosts_listbox'))
         if hasattr(self, 'hosts_listbox'):
-            print(f"DEBUG: Listbox size before clear: {self.hosts_listbox.size()}")
-            print(f"DEBUG: Listbox widget info: {self.hosts_listbox.winfo_exists()}")
+            logger.debug("Listbox size before clear: %s", self.hosts_listbox.size())
+            logger.debug("Listbox widget info: %s", self.hosts_listbox.winfo_exists())
         
         self.hosts_listbox.delete(0, tk.END)
-        print(f"DEBUG: Listbox cleared")
+        logger.debug("Listbox cleared")
         
         # Calculate metrics for each host for display
+        warning_level = self.warning_threshold.get()
+        critical_level = self.critical_threshold.get()
         host_metrics = {}
-        for hostname in sorted(self.processed_data['Hostname'].unique()):
-            host_data = self.processed_data[self.processed_data['Hostname'] == hostname]
+        for hostname in self.get_sorted_hostnames():
+            host_data = self.get_host_groups()[hostname]
             avg_cpu = host_data['CPU_Ready_Percent'].mean()
             health_score = self.calculate_health_score(
                 avg_cpu, 
@@ -3435,9 +3712,9 @@ class ModernCPUAnalyzer:
             )
             
             # Performance indicator
-            if avg_cpu >= self.critical_threshold.get():
+            if avg_cpu >= critical_level:
                 indicator = "🔴"
-            elif avg_cpu >= self.warning_threshold.get():
+            elif avg_cpu >= warning_level:
                 indicator = "🟡"
             else:
                 indicator = "🟢"
@@ -3481,10 +3758,10 @@ class ModernCPUAnalyzer:
             
             self.hosts_listbox.insert(tk.END, display_text)
             
-        print(f"DEBUG: Final listbox size: {self.hosts_listbox.size()}")
-        print(f"DEBUG: Listbox contents:")
+        logger.debug("Final listbox size: %s", self.hosts_listbox.size())
+        logger.debug("Listbox contents:")
         for i in range(self.hosts_listbox.size()):
-            print(f"  {i}: {self.hosts_listbox.get(i)}")
+            logger.debug("  %s: %s", i, self.hosts_listbox.get(i))
 
     def show_consolidation_welcome_message(self):
         """Show welcome message in the consolidation results area"""
@@ -3585,354 +3862,6 @@ class ModernCPUAnalyzer:
         self.impact_text.delete(1.0, tk.END)
         self.impact_text.insert(1.0, welcome_msg)
 
-    def analyze_multiple_removal_impact(self):
-        """Enhanced removal impact analysis with comprehensive metrics"""
-        if self.processed_data is None:
-            messagebox.showwarning("No Data", "Please calculate CPU Ready % first")
-            return
-        
-        selected_hosts = self.get_selected_hosts()
-        
-        if not selected_hosts:
-            messagebox.showwarning("No Selection", "Please select at least one host or use AI recommendations")
-            return
-        
-        self.show_progress("Analyzing comprehensive removal impact...")
-        
-        try:
-            # Extract hostnames from display text
-            clean_hostnames = []
-            for host_display in selected_hosts:
-                # Extract just the hostname (first word before any indicators)
-                hostname = host_display.split()[0]
-                clean_hostnames.append(hostname)
-            
-            total_hosts = len(self.processed_data['Hostname'].unique())
-            
-            if len(clean_hostnames) >= total_hosts:
-                self.impact_text.delete(1.0, tk.END)
-                self.impact_text.insert(1.0, """❌ CONSOLIDATION ERROR
-    ═══════════════════════════════════════════════════════════════════════════════════
-
-    Cannot remove all hosts - no remaining infrastructure!
-
-    Please select fewer hosts to maintain operational capability.
-    Recommended: Keep at least 2-3 hosts for redundancy and load distribution.""")
-                return
-            
-            # Perform comprehensive analysis
-            impact_analysis = self.perform_comprehensive_impact_analysis(clean_hostnames)
-            
-            # Display detailed results
-            self.display_comprehensive_impact_results(impact_analysis)
-            
-        except Exception as e:
-            messagebox.showerror("Analysis Error", f"Error analyzing removal impact:\n{str(e)}")
-        finally:
-            self.hide_progress()
-
-    def perform_comprehensive_impact_analysis(self, hostnames_to_remove):
-        """Perform detailed impact analysis for host removal"""
-        
-        # Basic metrics
-        total_hosts = len(self.processed_data['Hostname'].unique())
-        remaining_hosts = total_hosts - len(hostnames_to_remove)
-        
-        # Workload analysis
-        total_workload = self.processed_data['CPU_Ready_Sum'].sum()
-        selected_workload = self.processed_data[
-            self.processed_data['Hostname'].isin(hostnames_to_remove)
-        ]['CPU_Ready_Sum'].sum()
-        
-        workload_percentage = (selected_workload / total_workload) * 100 if total_workload > 0 else 0
-        
-        # Performance analysis
-        current_avg = self.processed_data['CPU_Ready_Percent'].mean()
-        remaining_data = self.processed_data[~self.processed_data['Hostname'].isin(hostnames_to_remove)]
-        
-        if len(remaining_data) > 0:
-            post_removal_avg = remaining_data['CPU_Ready_Percent'].mean()
-            # Estimate additional load per remaining host
-            additional_load_per_host = workload_percentage / remaining_hosts
-            estimated_new_avg = post_removal_avg + additional_load_per_host
-        else:
-            post_removal_avg = 0
-            estimated_new_avg = 0
-            additional_load_per_host = 0
-        
-        # Risk assessment
-        risk_level = "LOW"
-        risk_factors = []
-        
-        if workload_percentage > 30:
-            risk_level = "HIGH"
-            risk_factors.append("Very high workload redistribution required")
-        elif workload_percentage > 15:
-            risk_level = "MEDIUM"
-            risk_factors.append("Significant workload redistribution")
-        
-        if estimated_new_avg > self.critical_threshold.get():
-            risk_level = "HIGH"
-            risk_factors.append(f"Estimated post-consolidation performance exceeds critical threshold")
-        elif estimated_new_avg > self.warning_threshold.get():
-            if risk_level == "LOW":
-                risk_level = "MEDIUM"
-            risk_factors.append("Estimated performance may approach warning levels")
-        
-        if remaining_hosts < 2:
-            risk_level = "HIGH"
-            risk_factors.append("Insufficient redundancy (less than 2 hosts remaining)")
-        elif remaining_hosts < 3:
-            if risk_level == "LOW":
-                risk_level = "MEDIUM"
-            risk_factors.append("Limited redundancy for maintenance and failures")
-        
-        # Detailed host analysis
-        removed_hosts_analysis = []
-        remaining_hosts_analysis = []
-        
-        for hostname in hostnames_to_remove:
-            host_data = self.processed_data[self.processed_data['Hostname'] == hostname]
-            if len(host_data) > 0:
-                removed_hosts_analysis.append({
-                    'hostname': hostname,
-                    'avg_cpu': host_data['CPU_Ready_Percent'].mean(),
-                    'max_cpu': host_data['CPU_Ready_Percent'].max(),
-                    'workload_share': (host_data['CPU_Ready_Sum'].sum() / total_workload * 100) if total_workload > 0 else 0,
-                    'health_score': self.calculate_health_score(
-                        host_data['CPU_Ready_Percent'].mean(),
-                        host_data['CPU_Ready_Percent'].max(),
-                        host_data['CPU_Ready_Percent'].std()
-                    )
-                })
-        
-        for hostname in self.processed_data['Hostname'].unique():
-            if hostname not in hostnames_to_remove:
-                host_data = self.processed_data[self.processed_data['Hostname'] == hostname]
-                remaining_hosts_analysis.append({
-                    'hostname': hostname,
-                    'current_avg_cpu': host_data['CPU_Ready_Percent'].mean(),
-                    'current_max_cpu': host_data['CPU_Ready_Percent'].max(),
-                    'estimated_new_avg': host_data['CPU_Ready_Percent'].mean() + additional_load_per_host,
-                    'capacity_utilization': ((host_data['CPU_Ready_Percent'].mean() + additional_load_per_host) / 20) * 100  # Assume 20% is full capacity
-                })
-        
-        # Calculate financial impact
-        cost_savings = self.calculate_cost_savings(len(hostnames_to_remove), total_hosts)
-        
-        return {
-            'removed_hosts': hostnames_to_remove,
-            'removed_count': len(hostnames_to_remove),
-            'remaining_count': remaining_hosts,
-            'workload_percentage': workload_percentage,
-            'current_avg_cpu': current_avg,
-            'estimated_new_avg': estimated_new_avg,
-            'additional_load_per_host': additional_load_per_host,
-            'risk_level': risk_level,
-            'risk_factors': risk_factors,
-            'removed_hosts_analysis': removed_hosts_analysis,
-            'remaining_hosts_analysis': remaining_hosts_analysis,
-            'cost_savings': cost_savings,
-            'infrastructure_reduction': (len(hostnames_to_remove) / total_hosts) * 100
-        }
-
-    def calculate_cost_savings(self, removed_hosts, total_hosts):
-        """Calculate estimated cost savings from consolidation"""
-        reduction_percentage = (removed_hosts / total_hosts) * 100
-        
-        # Rough estimates - you can customize these based on your environment
-        annual_host_cost = 15000  # Average annual cost per host (hardware, power, licensing)
-        power_savings_per_host = 2000  # Annual power/cooling savings per host
-        
-        hardware_savings = removed_hosts * annual_host_cost
-        power_savings = removed_hosts * power_savings_per_host
-        license_savings = removed_hosts * 3000  # Rough vSphere license cost
-        
-        total_annual_savings = hardware_savings + power_savings + license_savings
-        
-        return {
-            'hardware_savings': hardware_savings,
-            'power_savings': power_savings,
-            'license_savings': license_savings,
-            'total_annual_savings': total_annual_savings,
-            'reduction_percentage': reduction_percentage
-        }
-
-    def display_comprehensive_impact_results(self, analysis):
-        """Display comprehensive consolidation impact analysis"""
-        
-        risk_colors = {
-            'LOW': '🟢',
-            'MEDIUM': '🟡', 
-            'HIGH': '🔴'
-        }
-        
-        risk_indicator = risk_colors.get(analysis['risk_level'], '⚪')
-        
-        report = f"""🔍 COMPREHENSIVE CONSOLIDATION IMPACT ANALYSIS
-    ═══════════════════════════════════════════════════════════════════════════════════
-
-    Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-    Selected Hosts: {analysis['removed_count']} of {analysis['removed_count'] + analysis['remaining_count']} total
-
-    📊 INFRASTRUCTURE IMPACT:
-    ═══════════════════════════════════════════════════════════════════════════════════
-
-    Infrastructure Reduction: {analysis['infrastructure_reduction']:.1f}%
-    Hosts to Remove: {analysis['removed_count']}
-    Remaining Hosts: {analysis['remaining_count']}
-    Workload to Redistribute: {analysis['workload_percentage']:.1f}%
-
-    ⚡ PERFORMANCE IMPACT:
-    ═══════════════════════════════════════════════════════════════════════════════════
-
-    Current Average CPU Ready: {analysis['current_avg_cpu']:.2f}%
-    Estimated Post-Consolidation: {analysis['estimated_new_avg']:.2f}%
-    Additional Load per Host: +{analysis['additional_load_per_host']:.1f}%
-
-    🎯 RISK ASSESSMENT: {risk_indicator} {analysis['risk_level']} RISK
-    ═══════════════════════════════════════════════════════════════════════════════════
-    """
-        
-        if analysis['risk_factors']:
-            report += "\n⚠️ Risk Factors:\n"
-            for factor in analysis['risk_factors']:
-                report += f"   • {factor}\n"
-        else:
-            report += "\n✅ No significant risk factors identified\n"
-        
-        report += f"""
-    🗑️ HOSTS SELECTED FOR REMOVAL:
-    ═══════════════════════════════════════════════════════════════════════════════════
-    """
-        
-        for host in analysis['removed_hosts_analysis']:
-            status = "✅ Good candidate" if host['avg_cpu'] < 5.0 else "⚠️ Review carefully"
-            report += f"""
-    {host['hostname']} - {status}
-    • Average CPU Ready: {host['avg_cpu']:.2f}%
-    • Peak CPU Ready: {host['max_cpu']:.2f}%
-    • Workload Share: {host['workload_share']:.1f}%
-    • Health Score: {host['health_score']:.0f}/100
-    """
-        
-        report += f"""
-    🖥️ REMAINING HOSTS (Post-Consolidation):
-    ═══════════════════════════════════════════════════════════════════════════════════
-    """
-        
-        for host in analysis['remaining_hosts_analysis']:
-            if host['estimated_new_avg'] > 15:
-                capacity_status = "🔴 HIGH LOAD"
-            elif host['estimated_new_avg'] > 8:
-                capacity_status = "🟡 MODERATE LOAD"
-            else:
-                capacity_status = "🟢 ACCEPTABLE"
-            
-            report += f"""
-    {host['hostname']} - {capacity_status}
-    • Current CPU Ready: {host['current_avg_cpu']:.2f}%
-    • Estimated New Load: {host['estimated_new_avg']:.2f}%
-    • Capacity Utilization: {host['capacity_utilization']:.0f}%
-    """
-        
-        cost_savings = analysis['cost_savings']
-        report += f"""
-    💰 ESTIMATED COST SAVINGS (Annual):
-    ═══════════════════════════════════════════════════════════════════════════════════
-
-    Hardware/Depreciation: ${cost_savings['hardware_savings']:,.0f}
-    Power & Cooling: ${cost_savings['power_savings']:,.0f}
-    Software Licensing: ${cost_savings['license_savings']:,.0f}
-    ─────────────────────────────────────────────
-    TOTAL ANNUAL SAVINGS: ${cost_savings['total_annual_savings']:,.0f}
-
-    3-Year Projected Savings: ${cost_savings['total_annual_savings'] * 3:,.0f}
-    ROI: {cost_savings['reduction_percentage']:.0f}% infrastructure reduction
-
-    📋 IMPLEMENTATION RECOMMENDATIONS:
-    ═══════════════════════════════════════════════════════════════════════════════════
-    """
-        
-        if analysis['risk_level'] == 'LOW':
-            report += """
-    ✅ LOW RISK - Proceed with confidence:
-    • Good consolidation candidates selected
-    • Minimal performance impact expected
-    • Standard implementation process recommended
-    
-    🚀 Next Steps:
-    1. Schedule maintenance window
-    2. Migrate workloads during off-peak hours
-    3. Monitor performance for 48 hours post-migration
-    4. Update DRS/HA settings
-    """
-        
-        elif analysis['risk_level'] == 'MEDIUM':
-            report += """
-    🟡 MEDIUM RISK - Proceed with caution:
-    • Some performance impact expected
-    • Enhanced monitoring recommended
-    • Consider phased implementation
-    
-    ⚠️ Recommended Precautions:
-    1. Test in non-production environment first
-    2. Implement during lowest usage period
-    3. Have immediate rollback plan ready
-    4. Monitor closely for 1 week post-consolidation
-    5. Consider temporary performance threshold adjustments
-    """
-        
-        else:  # HIGH RISK
-            report += """
-    🔴 HIGH RISK - Review selection carefully:
-    • Significant performance impact likely
-    • High chance of resource contention
-    • Consider reducing scope
-    
-    ⛔ Strong Recommendations:
-    1. Remove fewer hosts from selection
-    2. Focus on lowest-utilization hosts only
-    3. Extensive testing in lab environment
-    4. Staged implementation over multiple maintenance windows
-    5. 24/7 monitoring for 2+ weeks
-    6. Ensure adequate emergency resources available
-    """
-        
-        report += f"""
-    
-    📊 MONITORING CHECKLIST:
-    ═══════════════════════════════════════════════════════════════════════════════════
-
-    Before Consolidation:
-    □ Document current performance baselines
-    □ Verify backup and recovery procedures
-    □ Test workload migration procedures
-    □ Prepare monitoring dashboards
-    □ Brief on-call team on changes
-
-    During Implementation:
-    □ Monitor CPU Ready metrics in real-time
-    □ Watch for memory/storage bottlenecks
-    □ Verify application performance
-    □ Check cluster health status
-    □ Document any issues encountered
-
-    After Consolidation:
-    □ Monitor for {7 if analysis['risk_level'] == 'LOW' else 14} days minimum
-    □ Compare performance to baselines
-    □ Adjust DRS aggressiveness if needed
-    □ Update capacity planning models
-    □ Document lessons learned
-
-    ═══════════════════════════════════════════════════════════════════════════════════
-
-    Analysis complete! Review recommendations above before proceeding with consolidation.
-    """
-        
-        self.impact_text.delete(1.0, tk.END)
-        self.impact_text.insert(1.0, report)
-       
     def create_advanced_tab(self):
         """Create advanced analysis tab using full available space"""
         tab_frame = tk.Frame(self.notebook, bg=self.colors['bg_primary'])
@@ -4211,20 +4140,150 @@ class ModernCPUAnalyzer:
             has_time = bool(time_cols)
             has_ready = bool(ready_cols)
             
-            print(f"DEBUG: Validation - Time columns: {time_cols}")
-            print(f"DEBUG: Validation - Ready columns: {ready_cols}")
-            print(f"DEBUG: Validation result: Time={has_time}, Ready={has_ready}")
+            logger.debug("Validation - Time columns: %s", time_cols)
+            logger.debug("Validation - Ready columns: %s", ready_cols)
+            logger.debug("Validation result: Time=%s, Ready=%s", has_time, has_ready)
             
             return has_time and has_ready
             
         except Exception as e:
-            print(f"DEBUG: Validation error: {e}")
+            logger.warning("Validation error: %s", e)
             return False
     
+    def invalidate_processed_data_cache(self):
+        """Drop values derived from processed_data so they are rebuilt on next use"""
+        self._sorted_hosts = None
+        self._sorted_by_host = None
+        self._total_workload = None
+        self._overall_avg_pct = None
+        self._per_host_workload = None
+        self._host_groups = None
+        self._host_stats = None
+        self._host_codes = None
+        self._host_categories = None
+        self._ready_sum_arr = None
+        self._ready_pct_arr = None
+        self._processed_data_id = None
+    
+    def check_processed_data_cache(self):
+        """Invalidate derived values if processed_data has been replaced"""
+        if self._processed_data_id != id(self.processed_data):
+            self.invalidate_processed_data_cache()
+            self._processed_data_id = id(self.processed_data)
+    
+    def get_sorted_hostnames(self):
+        """Return sorted unique hostnames in processed_data, cached until the data changes"""
+        if self.processed_data is None:
+            return []
+        self.check_processed_data_cache()
+        if self._sorted_hosts is None:
+            hostnames = self.processed_data['Hostname']
+            if isinstance(hostnames.dtype, pd.CategoricalDtype):
+                # Categories are already the sorted unique names - no O(N) scan needed
+                self._sorted_hosts = list(hostnames.cat.categories)
+            else:
+                self._sorted_hosts = sorted(hostnames.unique())
+        return self._sorted_hosts
+    
+    def ensure_column_arrays(self):
+        """Cache host codes and the CPU Ready columns as plain contiguous arrays once per processed_data"""
+        self.check_processed_data_cache()
+        if self._host_codes is None:
+            hostnames = self.processed_data['Hostname']
+            if isinstance(hostnames.dtype, pd.CategoricalDtype):
+                # Category codes are ready-made group ids - no factorization needed
+                codes, categories = hostnames.cat.codes.to_numpy(), hostnames.cat.categories
+            else:
+                codes, categories = pd.factorize(hostnames, sort=True)
+            self._host_categories = categories
+            self._ready_sum_arr = np.ascontiguousarray(self.processed_data['CPU_Ready_Sum'].to_numpy(dtype=np.float64))
+            self._ready_pct_arr = np.ascontiguousarray(self.processed_data['CPU_Ready_Percent'].to_numpy(dtype=np.float32))
+            self._host_codes = np.ascontiguousarray(codes)
+    
+    def ensure_workload_totals(self):
+        """Compute overall and per-host workload totals once per processed_data"""
+        self.check_processed_data_cache()
+        if self._total_workload is None:
+            # One kernel pass over the cached code/value arrays, no groupby
+            self.ensure_column_arrays()
+            categories = self._host_categories
+            sums, counts = host_sum_count(self._host_codes, self._ready_sum_arr, len(categories))
+            observed = counts > 0
+            self._per_host_workload = pd.Series(sums[observed], index=categories[observed].rename('Hostname'),
+                                                name='CPU_Ready_Sum')
+            # The grand total is the sum of the per-host sums - no second pass over the column
+            self._total_workload = float(self._per_host_workload.sum())
+            self._overall_avg_pct = float(nan_mean(self._ready_pct_arr))
+    
+    def impact_for(self, hosts):
+        """Return (CPU Ready workload, % of total workload) carried by the given hosts"""
+        self.ensure_workload_totals()
+        workload = float(self._per_host_workload.reindex(list(hosts)).sum())
+        percentage = (workload / self._total_workload) * 100 if self._total_workload > 0 else 0
+        return workload, percentage
+    
+    def workload_shares(self):
+        """Return every host's % of total workload in one vectorised divide"""
+        self.ensure_workload_totals()
+        if self._total_workload <= 0:
+            return self._per_host_workload * 0.0
+        return self._per_host_workload / self._total_workload * 100
+    
+    def get_host_groups(self):
+        """Return {hostname: time-ordered rows} for processed_data, cached until the data changes"""
+        self.check_processed_data_cache()
+        if self._host_groups is None:
+            data = self.get_sorted_by_host()
+            self.ensure_column_arrays()
+            codes = self._host_codes
+            if codes.size == 0 or codes[-1] >= 0:
+                # Rows are sorted by host code, so each host is one contiguous run -
+                # binary-search the run boundaries and hand out iloc slices instead of copying groups
+                categories = self._host_categories
+                bounds = np.searchsorted(codes, np.arange(len(categories) + 1), side='left')
+                self._host_groups = {categories[i]: data.iloc[bounds[i]:bounds[i + 1]]
+                                     for i in range(len(categories)) if bounds[i + 1] > bounds[i]}
+            else:
+                self._host_groups = dict(tuple(data.groupby('Hostname', observed=True, sort=False)))
+        return self._host_groups
+    
+    def get_host_stats(self):
+        """Return per-host CPU Ready statistics, threshold counts and health scores, cached until the data or thresholds change"""
+        self.check_processed_data_cache()
+        warning_level = self.warning_threshold.get()
+        critical_level = self.critical_threshold.get()
+        if self._host_stats is None:
+            # Threshold-independent statistics - computed once per processed_data
+            self._host_stats = self.processed_data.groupby('Hostname', observed=True)['CPU_Ready_Percent'].agg(
+                ['mean', 'max', 'min', 'std', 'count'])
+        if self._host_stats.attrs.get('thresholds') != (warning_level, critical_level):
+            # A threshold change only needs the counts and scores - one fused kernel pass, no regroup
+            stats = self._host_stats
+            self.ensure_column_arrays()
+            warning_counts, critical_counts = threshold_counts(self._host_codes, self._ready_pct_arr, warning_level,
+                                                               critical_level, len(self._host_categories))
+            positions = self._host_categories.get_indexer(stats.index)
+            stats = stats.assign(warning_count=warning_counts[positions],
+                                 critical_count=critical_counts[positions],
+                                 health_score=health_score_array(stats['mean'], stats['max'], stats['std'],
+                                                                 warning_level, critical_level))
+            stats.attrs['thresholds'] = (warning_level, critical_level)
+            self._host_stats = stats
+        return self._host_stats
+    
+    def get_sorted_by_host(self):
+        """Return processed_data sorted by host then time, cached until the data changes"""
+        self.check_processed_data_cache()
+        if self._sorted_by_host is None:
+            # calculate_cpu_ready already stores the data in this order
+            self._sorted_by_host = self.processed_data
+        return self._sorted_by_host
+    
     def clear_files(self):
         """Clear all imported data"""
         self.data_frames = []
         self.processed_data = None
+        self.invalidate_processed_data_cache()
         self.update_file_status()
         self.update_data_preview()
         self.clear_results()
@@ -4260,17 +4319,15 @@ class ModernCPUAnalyzer:
                     break
             
             if not time_col:
-                print(f"DEBUG: No time column found for interval detection")
+                logger.debug("No time column found for interval detection")
                 return "Last Day"  # Default fallback
             
-            # Convert to datetime and sort
-            df_copy = df.copy()
-            df_copy[time_col] = pd.to_datetime(df_copy[time_col])
-            df_copy = df_copy.sort_values(time_col)
+            # Convert to datetime (only the span is needed, so no copy or sort of the frame)
+            times = pd.to_datetime(df[time_col])
             
             # Calculate time span and interval
-            time_span = df_copy[time_col].max() - df_copy[time_col].min()
-            num_records = len(df_copy)
+            time_span = times.max() - times.min()
+            num_records = len(times)
             
             # Calculate average interval between samples
             if num_records > 1:
@@ -4279,10 +4336,10 @@ class ModernCPUAnalyzer:
             else:
                 avg_interval_seconds = 300  # Default 5 minutes
             
-            print(f"DEBUG: Interval detection for {filename}")
-            print(f"  Time span: {time_span}")
-            print(f"  Records: {num_records}")
-            print(f"  Average interval: {avg_interval_seconds:.1f} seconds")
+            logger.debug("Interval detection for %s", filename)
+            logger.debug("  Time span: %s", time_span)
+            logger.debug("  Records: %s", num_records)
+            logger.debug("  Average interval: %.1f seconds", avg_interval_seconds)
             
             # Method 1: ENHANCED - Daily data detection (PRIORITY)
             # Check for daily data patterns (most common for yearly exports)
@@ -4293,46 +4350,46 @@ class ModernCPUAnalyzer:
             if (360 <= num_records <= 370 and days >= 360) or \
             (23 <= hours_between_records <= 25):  # ~24 hours between records
                 detected_interval = "Last Year"
-                print(f"  DAILY DATA DETECTED: {num_records} records over {days} days")
-                print(f"  Hours between records: {hours_between_records:.1f}")
+                logger.debug("  DAILY DATA DETECTED: %s records over %s days", num_records, days)
+                logger.debug("  Hours between records: %.1f", hours_between_records)
                 return detected_interval
             
             # Method 2: Filename-based detection (high priority)
             filename_lower = filename.lower()
             if any(keyword in filename_lower for keyword in ['real', 'realtime', 'real-time', 'live']):
                 detected_interval = "Real-Time"
-                print(f"  Filename suggests: Real-Time")
+                logger.debug("  Filename suggests: Real-Time")
             elif any(keyword in filename_lower for keyword in ['day', 'daily', '24h', '1day']):
                 detected_interval = "Last Day"
-                print(f"  Filename suggests: Last Day")
+                logger.debug("  Filename suggests: Last Day")
             elif any(keyword in filename_lower for keyword in ['week', 'weekly', '7day', '1week']):
                 detected_interval = "Last Week"
-                print(f"  Filename suggests: Last Week")
+                logger.debug("  Filename suggests: Last Week")
             elif any(keyword in filename_lower for keyword in ['month', 'monthly', '30day', '1month']):
                 detected_interval = "Last Month"
-                print(f"  Filename suggests: Last Month")
+                logger.debug("  Filename suggests: Last Month")
             elif any(keyword in filename_lower for keyword in ['year', 'yearly', 'annual', '365day', '1year']):
                 detected_interval = "Last Year"
-                print(f"  Filename suggests: Last Year")
+                logger.debug("  Filename suggests: Last Year")
             else:
                 # Method 3: Time span analysis (fallback)
                 hours = time_span.total_seconds() / 3600
                 
                 if hours <= 1.5:
                     detected_interval = "Real-Time"
-                    print(f"  Time span suggests: Real-Time ({hours:.1f} hours)")
+                    logger.debug("  Time span suggests: Real-Time (%.1f hours)", hours)
                 elif days <= 1.5:
                     detected_interval = "Last Day"
-                    print(f"  Time span suggests: Last Day ({days:.1f} days)")
+                    logger.debug("  Time span suggests: Last Day (%.1f days)", days)
                 elif days <= 8:
                     detected_interval = "Last Week"
-                    print(f"  Time span suggests: Last Week ({days:.1f} days)")
+                    logger.debug("  Time span suggests: Last Week (%.1f days)", days)
                 elif days <= 35:
                     detected_interval = "Last Month"
-                    print(f"  Time span suggests: Last Month ({days:.1f} days)")
+                    logger.debug("  Time span suggests: Last Month (%.1f days)", days)
                 else:
                     detected_interval = "Last Year"
-                    print(f"  Time span suggests: Last Year ({days:.1f} days)")
+                    logger.debug("  Time span suggests: Last Year (%.1f days)", days)
             
             # Method 4: Validation against expected intervals with ENHANCED daily check
             expected_intervals = {
@@ -4347,33 +4404,33 @@ class ModernCPUAnalyzer:
             expected_seconds = expected_intervals.get(detected_interval, 300)
             interval_ratio = avg_interval_seconds / expected_seconds
             
-            print(f"  Expected interval for {detected_interval}: {expected_seconds}s")
-            print(f"  Actual vs Expected ratio: {interval_ratio:.2f}")
+            logger.debug("  Expected interval for %s: %ss", detected_interval, expected_seconds)
+            logger.debug("  Actual vs Expected ratio: %.2f", interval_ratio)
             
             # ENHANCED: Special validation for daily data
             # If we have ~daily intervals but detected something else, correct it
             if 23 <= hours_between_records <= 25 and detected_interval != "Last Year":
-                print(f"  CORRECTION: Daily intervals detected ({hours_between_records:.1f}h), overriding to Last Year")
+                logger.debug("  CORRECTION: Daily intervals detected (%.1fh), overriding to Last Year", hours_between_records)
                 detected_interval = "Last Year"
                 interval_ratio = avg_interval_seconds / 86400
             
             # If ratio is way off, try to find a better match
             elif interval_ratio > 3 or interval_ratio < 0.3:
-                print(f"  Interval mismatch detected, searching for better match...")
+                logger.debug("  Interval mismatch detected, searching for better match...")
                 
                 best_match = "Last Day"
                 best_ratio = float('inf')
                 
                 for interval_name, expected_sec in expected_intervals.items():
                     ratio = abs(1 - (avg_interval_seconds / expected_sec))
-                    print(f"    {interval_name}: ratio {ratio:.2f}")
+                    logger.debug("    %s: ratio %.2f", interval_name, ratio)
                     if ratio < best_ratio:
                         best_ratio = ratio
                         best_match = interval_name
                 
                 if best_ratio < 2:  # Accept if within reasonable range
                     detected_interval = best_match
-                    print(f"  Auto-corrected to: {detected_interval} (ratio: {best_ratio:.2f})")
+                    logger.debug("  Auto-corrected to: %s (ratio: %.2f)", detected_interval, best_ratio)
             
             # Method 5: Enhanced special case handling
             special_cases = [
@@ -4397,9 +4454,9 @@ class ModernCPUAnalyzer:
                 if (min_records <= num_records <= max_records and 
                     min_interval <= avg_interval_seconds <= max_interval):
                     
-                    print(f"  Special case match: {suggested_interval}")
-                    print(f"    Records: {num_records} (expected {min_records}-{max_records})")
-                    print(f"    Interval: {avg_interval_seconds:.0f}s (expected {min_interval}-{max_interval}s)")
+                    logger.debug("  Special case match: %s", suggested_interval)
+                    logger.debug("    Records: %s (expected %s-%s)", num_records, min_records, max_records)
+                    logger.debug("    Interval: %.0fs (expected %s-%ss)", avg_interval_seconds, min_interval, max_interval)
                     
                     detected_interval = suggested_interval
                     break
@@ -4423,22 +4480,22 @@ class ModernCPUAnalyzer:
             
             for (keyword, (min_rec, max_rec)), suggested in filename_record_patterns.items():
                 if (keyword in filename_lower and min_rec <= num_records <= max_rec):
-                    print(f"  Filename+Records pattern match: {suggested}")
-                    print(f"    Keyword: '{keyword}', Records: {num_records}")
+                    logger.debug("  Filename+Records pattern match: %s", suggested)
+                    logger.debug("    Keyword: '%s', Records: %s", keyword, num_records)
                     detected_interval = suggested
                     break
             
-            print(f"  FINAL DETECTION: {detected_interval}")
+            logger.debug("  FINAL DETECTION: %s", detected_interval)
             
             # Final validation log
             final_expected = expected_intervals[detected_interval]
             final_ratio = avg_interval_seconds / final_expected
-            print(f"  Final validation: {avg_interval_seconds:.0f}s actual vs {final_expected}s expected (ratio: {final_ratio:.2f})")
+            logger.debug("  Final validation: %.0fs actual vs %ss expected (ratio: %.2f)", avg_interval_seconds, final_expected, final_ratio)
             
             return detected_interval
             
         except Exception as e:
-            print(f"DEBUG: Error in interval detection: {e}")
+            logger.warning("Error in interval detection: %s", e)
             import traceback
             traceback.print_exc()
             return "Last Day"  # Safe fallback
@@ -4460,21 +4517,62 @@ class ModernCPUAnalyzer:
             return
         
         self.show_progress(f"Importing {len(file_paths)} files...")
+        import_queue = queue.Queue()
+        
+        def read_data_file(file_path):
+            """Read one file, returning (df, error) so a bad file doesn't abort the batch"""
+            try:
+                # Determine file type and read accordingly
+                if file_path.lower().endswith('.csv'):
+                    if ARROW_AVAILABLE:
+                        # Multithreaded columnar Arrow parser; fall back to the C parser on anything it rejects
+                        try:
+                            return pd.read_csv(file_path, engine='pyarrow'), None
+                        except Exception as arrow_error:
+                            logger.debug("pyarrow CSV engine failed for %s (%s), using default parser", file_path, arrow_error)
+                    return pd.read_csv(file_path), None
+                try:
+                    # calamine (Rust) reads xlsx/xls far faster than openpyxl/xlrd when installed
+                    return pd.read_excel(file_path, engine='calamine'), None
+                except (ImportError, ValueError):
+                    return pd.read_excel(file_path), None
+            except Exception as e:
+                return None, e
+        
+        def read_files_thread():
+            # Parse files concurrently - the pandas C parser releases the GIL while reading.
+            # Runs off the Tk thread so the window keeps repainting during large imports
+            try:
+                with ThreadPoolExecutor(max_workers=min(8, len(file_paths))) as executor:
+                    import_queue.put(list(executor.map(read_data_file, file_paths)))
+            except Exception as e:
+                import_queue.put([(None, e)] * len(file_paths))
+        
+        def drain_import_queue():
+            try:
+                read_results = import_queue.get_nowait()
+            except queue.Empty:
+                self.root.after(100, drain_import_queue)
+                return
+            self.finish_file_import(file_paths, read_results)
+        
+        threading.Thread(target=read_files_thread, daemon=True).start()
+        self.root.after(100, drain_import_queue)
+    
+    def finish_file_import(self, file_paths, read_results):
+        """Validate parsed import files on the Tk thread and update the UI"""
         successful_imports = 0
         failed_imports = []
         detected_intervals = []
         
         try:
-            for file_path in file_paths:
+            for file_path, (df, read_error) in zip(file_paths, read_results):
                 try:
                     filename = Path(file_path).name
-                    print(f"DEBUG: Processing file: {filename}")
+                    logger.debug("Processing file: %s", filename)
                     
-                    # Determine file type and read accordingly
-                    if file_path.lower().endswith('.csv'):
-                        df = pd.read_csv(file_path)
-                    else:
-                        df = pd.read_excel(file_path)
+                    if read_error is not None:
+                        raise read_error
                     
                     # Validate the dataframe structure
                     if not self.validate_dataframe(df):
@@ -4492,12 +4590,12 @@ class ModernCPUAnalyzer:
                     self.data_frames.append(df)
                     successful_imports += 1
                     
-                    print(f"DEBUG: Successfully imported {filename} with interval: {detected_interval}")
+                    logger.debug("Successfully imported %s with interval: %s", filename, detected_interval)
                     
                 except Exception as e:
                     error_msg = f"{Path(file_path).name} - {str(e)}"
                     failed_imports.append(error_msg)
-                    print(f"DEBUG: Import error: {error_msg}")
+                    logger.warning("Import error: %s", error_msg)
                     continue
             
             # Update UI components
@@ -4515,8 +4613,8 @@ class ModernCPUAnalyzer:
                     # Choose most frequent interval
                     most_common_interval = max(interval_counts, key=interval_counts.get)
                     
-                    print(f"DEBUG: Detected intervals: {detected_intervals}")
-                    print(f"DEBUG: Auto-setting interval to: {most_common_interval}")
+                    logger.debug("Detected intervals: %s", detected_intervals)
+                    logger.debug("Auto-setting interval to: %s", most_common_interval)
                     
                     # Update the interval dropdown
                     self.interval_var.set(most_common_interval)
@@ -4566,8 +4664,9 @@ class ModernCPUAnalyzer:
     def update_data_preview(self):
         """Update data preview table with interval detection info"""
         # Clear existing items
-        for item in self.preview_tree.get_children():
-            self.preview_tree.delete(item)
+        children = self.preview_tree.get_children()
+        if children:
+            self.preview_tree.delete(*children)
         
         if not self.data_frames:
             return
@@ -4647,7 +4746,10 @@ class ModernCPUAnalyzer:
                 context.check_hostname = False
                 context.verify_mode = ssl.CERT_NONE
                 
-                # Attempt connection
+                # Attempt connection - counter IDs are per vCenter, so forget any cached one
+                self.cpu_ready_counter_key = None
+                self.failing_perf_hosts = set()
+                self.host_container = None
                 self.vcenter_connection = SmartConnect(
                     host=vcenter_host,
                     user=username,
@@ -4656,6 +4758,8 @@ class ModernCPUAnalyzer:
                 )
                 
                 if self.vcenter_connection:
+                    self._vcenter_finalizer = weakref.finalize(
+                        self, disconnect_vcenter_quietly, self.vcenter_connection)
                     # Success - update UI on main thread
                     self.root.after(0, self.on_vcenter_connected, vcenter_host)
                 else:
@@ -4682,7 +4786,7 @@ class ModernCPUAnalyzer:
         # Update real-time dashboard connection
         if hasattr(self, 'realtime_dashboard'):
             self.realtime_dashboard.set_vcenter_connection(self.vcenter_connection)
-            print("DEBUG: Real-time dashboard vCenter connection updated")
+            logger.debug("Real-time dashboard vCenter connection updated")
         
         messagebox.showinfo("Success", f"Connected to vCenter: {vcenter_host}\n\nReal-time monitoring is now available!")
 
@@ -4705,14 +4809,25 @@ class ModernCPUAnalyzer:
             try:
                 self.realtime_dashboard.stop_monitoring()
                 self.realtime_dashboard.set_vcenter_connection(None)
-                print("DEBUG: Real-time monitoring stopped and connection cleared")
+                logger.debug("Real-time monitoring stopped and connection cleared")
             except Exception as e:
-                print(f"DEBUG: Error stopping real-time monitoring: {e}")
+                logger.warning("Error stopping real-time monitoring: %s", e)
         
         try:
             if self.vcenter_connection:
+                if self.host_container is not None:
+                    try:
+                        self.host_container.Destroy()
+                    except Exception as e:
+                        logger.warning("Error destroying host container view: %s", e)
+                    self.host_container = None
+                if self._vcenter_finalizer is not None:
+                    self._vcenter_finalizer.detach()
+                    self._vcenter_finalizer = None
                 Disconnect(self.vcenter_connection)
                 self.vcenter_connection = None
+                self.cpu_ready_counter_key = None
+                self.failing_perf_hosts = set()
             
             self.vcenter_status.config(text="⚫ Disconnected", fg=self.colors['error'])
             self.connection_status.config(text="⚫ Disconnected", fg=self.colors['error'])
@@ -4728,20 +4843,37 @@ class ModernCPUAnalyzer:
     def get_all_hosts(self, content):
         """Get all ESXi hosts from vCenter"""
         hosts = []
-        container = content.viewManager.CreateContainerView(
-            content.rootFolder, [vim.HostSystem], True)
-        
-        for host in container.view:
-            if host.runtime.connectionState == vim.HostSystemConnectionState.connected:
+        if self.host_container is None:
+            # Creating the view is a SOAP call of its own - keep one for the whole session
+            self.host_container = content.viewManager.CreateContainerView(
+                content.rootFolder, [vim.HostSystem], True)
+        
+        # Fetch name and connection state for every host in a single PropertyCollector
+        # round-trip instead of two lazy property reads per host
+        traversal_spec = vim.PropertyCollector.TraversalSpec(
+            name='traverseEntities', path='view', skip=False, type=vim.view.ContainerView)
+        obj_spec = vim.PropertyCollector.ObjectSpec(obj=self.host_container, skip=True, selectSet=[traversal_spec])
+        prop_spec = vim.PropertyCollector.PropertySpec(
+            type=vim.HostSystem, pathSet=['name', 'runtime.connectionState'])
+        filter_spec = vim.PropertyCollector.FilterSpec(objectSet=[obj_spec], propSet=[prop_spec])
+        try:
+            results = content.propertyCollector.RetrieveContents([filter_spec])
+        except Exception:
+            # A stale view (e.g. expired session) is dropped so the next fetch creates a new one
+            self.host_container = None
+            raise
+        
+        for obj_content in results:
+            props = {prop.name: prop.val for prop in obj_content.propSet}
+            if props.get('runtime.connectionState') == vim.HostSystemConnectionState.connected:
                 hosts.append({
-                    'name': host.name,
-                    'object': host
+                    'name': props.get('name'),
+                    'object': obj_content.obj
                 })
             else:
-                print(f"DEBUG: Skipping disconnected host: {host.name}")
+                logger.debug("Skipping disconnected host: %s", props.get('name'))
         
-        container.Destroy()
-        print(f"DEBUG: Found {len(hosts)} connected hosts")
+        logger.debug("Found %d connected hosts", len(hosts))
         return hosts
 
     def show_analysis_summary_dialog(self, processed_hosts, total_records, warnings):
@@ -4788,14 +4920,12 @@ class ModernCPUAnalyzer:
             warning_hosts = 0
             healthy_hosts = 0
             
-            for hostname in self.processed_data['Hostname'].unique():
-                avg_cpu = self.processed_data[self.processed_data['Hostname'] == hostname]['CPU_Ready_Percent'].mean()
-                if avg_cpu >= self.critical_threshold.get():
-                    critical_hosts += 1
-                elif avg_cpu >= self.warning_threshold.get():
-                    warning_hosts += 1
-                else:
-                    healthy_hosts += 1
+            host_means = self.processed_data.groupby('Hostname', observed=True)['CPU_Ready_Percent'].mean()
+            critical_level = self.critical_threshold.get()
+            warning_level = self.warning_threshold.get()
+            critical_hosts = int((host_means >= critical_level).sum())
+            warning_hosts = int(((host_means >= warning_level) & (host_means < critical_level)).sum())
+            healthy_hosts = len(host_means) - critical_hosts - warning_hosts
             
             host_summary = f"""🔴 Critical hosts: {critical_hosts}
     🟡 Warning hosts: {warning_hosts}
@@ -4918,29 +5048,21 @@ class ModernCPUAnalyzer:
         
         try:
             combined_data = []
+            seen_hosts = set()  # Hostnames already in combined_data
             processed_hosts = 0
             total_records = 0
             processing_warnings = []
             
-            print(f"DEBUG: Starting analysis with {len(self.data_frames)} dataframes")
+            logger.debug("Starting analysis with %d dataframes", len(self.data_frames))
             
-            # Standard divisors for each interval based on provided formula
-            interval_divisors = {
-                "Real-Time": 200,
-                "Last Day": 3000,
-                "Last Week": 18000,
-                "Last Month": 72000,
-                "Last Year": 864000
-            }
-            
-            # Get the appropriate divisor for the current interval
-            current_divisor = interval_divisors.get(self.current_interval, 3000)  # Default to Last Day if unknown
-            print(f"DEBUG: Using interval: {self.current_interval} with divisor {current_divisor}")
+            # Get the appropriate divisor for the current interval (precomputed from self.intervals)
+            current_divisor = self.denominators.get(self.current_interval, 3000.0)  # Default to Last Day if unknown
+            logger.debug("Using interval: %s with divisor %s", self.current_interval, current_divisor)
             
             # Process each dataframe
             for df_index, df in enumerate(self.data_frames):
-                print(f"DEBUG: Processing dataframe {df_index + 1}/{len(self.data_frames)} with {len(df)} rows")
-                print(f"DEBUG: Columns: {list(df.columns)}")
+                logger.debug("Processing dataframe %d/%d with %d rows", df_index + 1, len(self.data_frames), len(df))
+                logger.debug("Columns: %s", list(df.columns))
                 
                 # Find time and ready columns with improved detection
                 time_col = None
@@ -4954,19 +5076,19 @@ class ModernCPUAnalyzer:
                     if any(keyword in col.lower() for keyword in ['ready for', 'cpu ready', 'cpuready']):
                         ready_cols.append(col)
                 
-                print(f"DEBUG: Found time column: {time_col}")
-                print(f"DEBUG: Found ready columns: {ready_cols}")
+                logger.debug("Found time column: %s", time_col)
+                logger.debug("Found ready columns: %s", ready_cols)
                 
                 if not time_col:
                     warning_msg = f"No time column found in dataframe {df_index + 1}"
                     processing_warnings.append(warning_msg)
-                    print(f"DEBUG: {warning_msg}")
+                    logger.warning("%s", warning_msg)
                     continue
                     
                 if not ready_cols:
                     warning_msg = f"No CPU Ready columns found in dataframe {df_index + 1}"
                     processing_warnings.append(warning_msg)
-                    print(f"DEBUG: {warning_msg}")
+                    logger.warning("%s", warning_msg)
                     continue
                 
                 # Detect if data is from direct vCenter API or from CSV export
@@ -4989,22 +5111,21 @@ class ModernCPUAnalyzer:
                         avg_sample = sample_values.mean()
                         if avg_sample > 1000:  # vCenter API values for Real-Time are typically >1000
                             is_vcenter_direct = True
-                            print(f"DEBUG: Detected vCenter API data based on value range (avg: {avg_sample:.2f})")
+                            logger.debug("Detected vCenter API data based on value range (avg: %.2f)", avg_sample)
                 
-                print(f"DEBUG: Is direct vCenter API data: {is_vcenter_direct}")
+                logger.debug("Is direct vCenter API data: %s", is_vcenter_direct)
                 
                 # Process each ready column (each represents a different host)
                 for ready_col in ready_cols:
-                    print(f"DEBUG: Processing ready column: {ready_col}")
+                    logger.debug("Processing ready column: %s", ready_col)
                     
                     # Extract hostname with enhanced logic
                     hostname = self.extract_hostname_from_column(ready_col)
-                    print(f"DEBUG: Extracted hostname: {hostname}")
+                    logger.debug("Extracted hostname: %s", hostname)
                     
                     # Check for duplicates across all dataframes
-                    existing_hostnames = [data['Hostname'].iloc[0] for data in combined_data if len(data) > 0]
-                    if hostname in existing_hostnames:
-                        print(f"DEBUG: Hostname {hostname} already processed, skipping duplicate")
+                    if hostname in seen_hosts:
+                        logger.debug("Hostname %s already processed, skipping duplicate", hostname)
                         continue
                     
                     # Process data for this host
@@ -5033,13 +5154,13 @@ class ModernCPUAnalyzer:
                         subset = subset[subset['CPU_Ready_Sum'] >= 0]
                         valid_rows = len(subset)
 
-                        print(f"DEBUG: Host {hostname}: {initial_rows} initial → {after_dropna} after dropna → {valid_rows} valid rows")
+                        logger.debug("Host %s: %d initial → %d after dropna → %d valid rows", hostname, initial_rows, after_dropna, valid_rows)
 
                         # Update the warning logic to be more specific
                         if valid_rows == 0:
                             warning_msg = f"No valid CPU Ready data for host {hostname}"
                             processing_warnings.append(warning_msg)
-                            print(f"DEBUG: {warning_msg}")
+                            logger.warning("%s", warning_msg)
                             continue
 
                         # Only warn if we lose a significant amount of data due to invalid values
@@ -5047,17 +5168,23 @@ class ModernCPUAnalyzer:
                         if lost_rows > 0 and lost_rows > initial_rows * 0.1:  # Only warn if >10% lost
                             warning_msg = f"Host {hostname}: Removed {lost_rows} invalid data points ({(lost_rows/initial_rows)*100:.1f}%)"
                             processing_warnings.append(warning_msg)
-                            print(f"DEBUG: {warning_msg}")
+                            logger.warning("%s", warning_msg)
                         else:
-                            print(f"DEBUG: Host {hostname}: Kept all {valid_rows} valid data points (including {initial_rows - after_dropna} zeros)")
+                            logger.debug("Host %s: Kept all %d valid data points (including %d zeros)", hostname, valid_rows, initial_rows - after_dropna)
                         
                         # Enhanced timestamp processing
                         try:
                             subset['Time'] = self.clean_timestamps(subset['Time'])
+                            bad_times = int(subset['Time'].isna().sum())
+                            if bad_times:
+                                logger.debug("Host %s: Dropped %d rows with unparseable timestamps", hostname, bad_times)
+                                subset = subset.dropna(subset=['Time'])
+                                if subset.empty:
+                                    continue
                         except Exception as time_error:
                             warning_msg = f"Timestamp processing error for {hostname}: {time_error}"
                             processing_warnings.append(warning_msg)
-                            print(f"DEBUG: {warning_msg}")
+                            logger.warning("%s", warning_msg)
                             continue
                         
                         # CPU READY CALCULATION with data source detection
@@ -5065,15 +5192,15 @@ class ModernCPUAnalyzer:
                             # Use a different divisor for real-time data pulled directly from vCenter
                             # Based on your logs, vCenter direct values need a higher divisor
                             vcenter_realtime_divisor = 3000  # Adjusted divisor for vCenter direct API values
-                            print(f"DEBUG: Applying vCenter direct Real-Time formula (divisor: {vcenter_realtime_divisor})")
-                            subset['CPU_Ready_Percent'] = subset['CPU_Ready_Sum'] / vcenter_realtime_divisor
+                            logger.debug("Applying vCenter direct Real-Time formula (divisor: %s)", vcenter_realtime_divisor)
+                            divisor = vcenter_realtime_divisor
                         else:
                             # Use standard formula for CSV files and other intervals
-                            print(f"DEBUG: Applying standard {self.current_interval} formula (divisor: {current_divisor})")
-                            subset['CPU_Ready_Percent'] = subset['CPU_Ready_Sum'] / current_divisor
+                            logger.debug("Applying standard %s formula (divisor: %s)", self.current_interval, current_divisor)
+                            divisor = current_divisor
                         
-                        # Cap at 100% (sanity check)
-                        subset.loc[subset['CPU_Ready_Percent'] > 100, 'CPU_Ready_Percent'] = 100
+                        # Divide and cap at 100% (sanity check) in a single pass
+                        subset['CPU_Ready_Percent'] = ready_sum_to_percent(subset['CPU_Ready_Sum'].to_numpy(), divisor)
                         
                         # Final statistics
                         final_avg = subset['CPU_Ready_Percent'].mean()
@@ -5081,9 +5208,8 @@ class ModernCPUAnalyzer:
                         final_min = subset['CPU_Ready_Percent'].min()
                         final_std = subset['CPU_Ready_Percent'].std()
                         
-                        print(f"DEBUG: Host {hostname} - FINAL stats:")
-                        print(f"  Min: {final_min:.2f}%, Max: {final_max:.2f}%, Avg: {final_avg:.2f}%, Std: {final_std:.2f}%")
-                        print(f"  Sample final values: {subset['CPU_Ready_Percent'].head(5).tolist()}")
+                        logger.debug("Host %s - FINAL stats: Min: %.2f%%, Max: %.2f%%, Avg: %.2f%%, Std: %.2f%%",
+                                     hostname, final_min, final_max, final_avg, final_std)
         
                         # Quality warnings
                         if final_avg > 30:
@@ -5097,13 +5223,14 @@ class ModernCPUAnalyzer:
                             processing_warnings.append(warning_msg)
                         
                         combined_data.append(subset)
+                        seen_hosts.add(hostname)
                         processed_hosts += 1
                         total_records += valid_rows
                         
                     except Exception as host_error:
                         error_msg = f"Error processing host {hostname}: {str(host_error)}"
                         processing_warnings.append(error_msg)
-                        print(f"DEBUG: {error_msg}")
+                        logger.warning("%s", error_msg)
                         import traceback
                         traceback.print_exc()
                         continue
@@ -5121,24 +5248,36 @@ class ModernCPUAnalyzer:
                     messagebox.showerror("Processing Error", detailed_msg)
                 return False
             
-            # Combine all processed data
-            self.processed_data = pd.concat(combined_data, ignore_index=True)
+            # Combine all processed data - only the columns the analysis uses, so the
+            # unused Source_File strings never get copied into the combined buffer
+            analysis_cols = ['Time', 'Hostname', 'CPU_Ready_Sum', 'CPU_Ready_Percent']
+            self.processed_data = pd.concat([data[analysis_cols] for data in combined_data], ignore_index=True)
+            # Categorical hostnames turn masks, isin and groupby into integer code operations;
+            # the derived percentages don't need double precision, but the raw ms sums stay float64
+            self.processed_data = self.processed_data.astype({'Hostname': 'category',
+                                                              'CPU_Ready_Sum': 'float64',
+                                                              'CPU_Ready_Percent': 'float32'})
+            # Sort once (stable) so every per-host groupby yields time-ordered blocks without re-sorting
+            self.processed_data = self.processed_data.sort_values(['Hostname', 'Time'], kind='mergesort',
+                                                                  ignore_index=True)
+            self.invalidate_processed_data_cache()
+            self.ensure_workload_totals()
+            self.get_sorted_hostnames()
             
             # Final data summary
-            unique_hosts = self.processed_data['Hostname'].unique()
+            unique_hosts = self.get_sorted_hostnames()
             date_range_start = self.processed_data['Time'].min()
             date_range_end = self.processed_data['Time'].max()
             
-            print(f"DEBUG: FINAL ANALYSIS SUMMARY:")
-            print(f"  Total records: {len(self.processed_data):,}")
-            print(f"  Unique hosts: {len(unique_hosts)}")
-            print(f"  Date range: {date_range_start} to {date_range_end}")
-            print(f"  Processing warnings: {len(processing_warnings)}")
+            logger.debug("FINAL ANALYSIS SUMMARY: %s records, %d hosts, %s to %s, %d processing warnings",
+                         f"{len(self.processed_data):,}", len(unique_hosts),
+                         date_range_start, date_range_end, len(processing_warnings))
             
-            # Per-host final summary
-            for hostname in sorted(unique_hosts):
-                host_final = self.processed_data[self.processed_data['Hostname'] == hostname]
-                print(f"  {hostname}: {len(host_final)} records, avg {host_final['CPU_Ready_Percent'].mean():.2f}% CPU Ready")
+            # Per-host final summary - one grouped pass serves the log and the health counts below
+            host_summary = self.processed_data.groupby('Hostname', observed=True)['CPU_Ready_Percent'].agg(['count', 'mean'])
+            if logger.isEnabledFor(logging.DEBUG):
+                for hostname, records, avg_pct in zip(host_summary.index, host_summary['count'], host_summary['mean']):
+                    logger.debug("  %s: %d records, avg %.2f%% CPU Ready", hostname, records, avg_pct)
             
             # Mark analysis complete in workflow
             if hasattr(self, 'workflow_state'):
@@ -5160,7 +5299,7 @@ class ModernCPUAnalyzer:
                 if hasattr(self, 'update_workflow_indicator'):
                     self.update_workflow_indicator('visualize', 'complete')
             except Exception as display_error:
-                print(f"DEBUG: Error updating displays: {display_error}")
+                logger.warning("Error updating displays: %s", display_error)
                 # Continue anyway, data processing was successful
             
             # Enhanced user feedback with summary
@@ -5169,10 +5308,11 @@ class ModernCPUAnalyzer:
                 summary_msg = f"✅ Analysis complete! {processed_hosts} hosts, {total_records:,} records"
                 
                 # Add health insights to notification
-                critical_hosts = len([h for h in unique_hosts 
-                                    if self.processed_data[self.processed_data['Hostname'] == h]['CPU_Ready_Percent'].mean() >= self.critical_threshold.get()])
-                warning_hosts = len([h for h in unique_hosts 
-                                if self.warning_threshold.get() <= self.processed_data[self.processed_data['Hostname'] == h]['CPU_Ready_Percent'].mean() < self.critical_threshold.get()])
+                host_means = host_summary['mean']
+                critical_level = self.critical_threshold.get()
+                warning_level = self.warning_threshold.get()
+                critical_hosts = int((host_means >= critical_level).sum())
+                warning_hosts = int(((host_means >= warning_level) & (host_means < critical_level)).sum())
                 
                 if critical_hosts > 0:
                     summary_msg += f" | ⚠️ {critical_hosts} critical hosts"
@@ -5215,9 +5355,7 @@ class ModernCPUAnalyzer:
             return True  # Indicate successful analysis
             
         except Exception as e:
-            print(f"DEBUG: Full error details: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Full error details: %s", e)
             
             # Mark analysis as failed
             if hasattr(self, 'update_workflow_indicator'):
@@ -5239,55 +5377,48 @@ class ModernCPUAnalyzer:
         try:
             if '$' in ready_col:
                 # Format: "Ready for $hostname"
-                hostname_match = re.search(r'\$(\w+)', ready_col)
+                hostname_match = _DOLLAR_HOST_RE.search(ready_col)
                 hostname = hostname_match.group(1) if hostname_match else "Unknown"
             else:
                 # Format: "Ready for full.hostname.domain" or "Ready for IP"
-                hostname_match = re.search(r'Ready for (.+)', ready_col)
+                hostname_match = _READY_FOR_RE.search(ready_col)
                 if hostname_match:
                     full_hostname = hostname_match.group(1).strip()
                     
                     # Check if it's an IP address - if so, keep it intact
-                    if re.match(r'^\d+\.\d+\.\d+\.\d+$', full_hostname):
+                    if _IPV4_RE.match(full_hostname):
                         hostname = full_hostname  # Keep full IP address
-                        print(f"DEBUG: IP address detected, keeping full: {hostname}")
+                        logger.debug("IP address detected, keeping full: %s", hostname)
                     else:
                         # Extract just the first part of the hostname for cleaner display
                         hostname = full_hostname.split('.')[0]
-                        print(f"DEBUG: Extracted hostname '{hostname}' from '{full_hostname}'")
+                        logger.debug("Extracted hostname '%s' from '%s'", hostname, full_hostname)
                 else:
                     hostname = "Unknown-Host"
-                    print("DEBUG: Could not extract hostname, using 'Unknown-Host'")
+                    logger.debug("Could not extract hostname, using 'Unknown-Host'")
             
             return hostname
             
         except Exception as e:
-            print(f"DEBUG: Error extracting hostname from '{ready_col}': {e}")
+            logger.warning("Error extracting hostname from '%s': %s", ready_col, e)
             return "Error-Host"
 
     def clean_timestamps(self, timestamp_series):
-        """Clean and standardize timestamps with enhanced error handling"""
-        def clean_single_timestamp(ts):
-            try:
-                if isinstance(ts, str):
-                    # Remove trailing Z if there's already timezone info
-                    if '+' in ts and ts.endswith('Z'):
-                        ts = ts[:-1]
-                    # Handle various vCenter timestamp formats
-                    try:
-                        return pd.to_datetime(ts, utc=True)
-                    except:
-                        # Try removing timezone info and adding Z
-                        if '+' in ts:
-                            ts = ts.split('+')[0] + 'Z'
-                        return pd.to_datetime(ts, utc=True)
-                return pd.to_datetime(ts, utc=True)
-            except Exception as e:
-                print(f"DEBUG: Timestamp parsing error for '{ts}': {e}")
-                # Return current time as fallback
-                return pd.to_datetime(datetime.now(), utc=True)
-        
-        return timestamp_series.apply(clean_single_timestamp)
+        """Clean and standardize timestamps in one vectorized parse; unparseable values become NaT"""
+        if pd.api.types.is_string_dtype(timestamp_series) or timestamp_series.dtype == object:
+            # Remove trailing Z if there's already timezone info - only on the string elements,
+            # Excel imports can hand us datetime objects (alone or mixed in) that to_datetime parses as-is
+            is_str = timestamp_series.map(type) == str
+            if is_str.any():
+                timestamp_series = timestamp_series.where(
+                    ~is_str, timestamp_series[is_str].str.replace(r'(\+\d{2}:?\d{2})Z$', r'\1', regex=True))
+        parsed = pd.to_datetime(timestamp_series, utc=True, errors='coerce', format='ISO8601')
+        
+        # Fall back to per-element format inference only for the values the ISO parser rejected
+        failed = parsed.isna() & timestamp_series.notna()
+        if failed.any():
+            parsed[failed] = pd.to_datetime(timestamp_series[failed], utc=True, errors='coerce', format='mixed')
+        return parsed
 
     def generate_analysis_summary(self):
         """Generate comprehensive analysis summary"""
@@ -5295,7 +5426,7 @@ class ModernCPUAnalyzer:
             return {}
         
         try:
-            unique_hosts = self.processed_data['Hostname'].unique()
+            unique_hosts = self.get_sorted_hostnames()
             total_hosts = len(unique_hosts)
             total_records = len(self.processed_data)
             
@@ -5306,15 +5437,17 @@ class ModernCPUAnalyzer:
             
             host_stats = []
             
+            warning_level = self.warning_threshold.get()
+            critical_level = self.critical_threshold.get()
             for hostname in unique_hosts:
-                host_data = self.processed_data[self.processed_data['Hostname'] == hostname]
+                host_data = self.get_host_groups()[hostname]
                 avg_cpu = host_data['CPU_Ready_Percent'].mean()
                 max_cpu = host_data['CPU_Ready_Percent'].max()
                 
-                if avg_cpu >= self.critical_threshold.get():
+                if avg_cpu >= critical_level:
                     critical_count += 1
                     status = 'critical'
-                elif avg_cpu >= self.warning_threshold.get():
+                elif avg_cpu >= warning_level:
                     warning_count += 1
                     status = 'warning'
                 else:
@@ -5330,7 +5463,8 @@ class ModernCPUAnalyzer:
                 })
             
             # Overall statistics
-            overall_avg = self.processed_data['CPU_Ready_Percent'].mean()
+            self.ensure_workload_totals()
+            overall_avg = self._overall_avg_pct
             overall_max = self.processed_data['CPU_Ready_Percent'].max()
             
             # Time range
@@ -5356,7 +5490,7 @@ class ModernCPUAnalyzer:
             return summary
             
         except Exception as e:
-            print(f"DEBUG: Error generating analysis summary: {e}")
+            logger.warning("Error generating analysis summary: %s", e)
             return {}
 
     def show_analysis_ready_prompt(self, summary):
@@ -5443,28 +5577,25 @@ class ModernCPUAnalyzer:
     def update_results_display(self):
         """Update analysis results table"""
         # Clear existing results
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
+        children = self.results_tree.get_children()
+        if children:
+            self.results_tree.delete(*children)
         
         if self.processed_data is None:
             return
         
-        # Calculate statistics for each host
-        for hostname in sorted(self.processed_data['Hostname'].unique()):
-            host_data = self.processed_data[self.processed_data['Hostname'] == hostname]
-            
-            avg_cpu = host_data['CPU_Ready_Percent'].mean()
-            max_cpu = host_data['CPU_Ready_Percent'].max()
-            std_cpu = host_data['CPU_Ready_Percent'].std()
-            record_count = len(host_data)
-            
-            # Calculate health score
-            health_score = self.calculate_health_score(avg_cpu, max_cpu, std_cpu)
-            
+        # Per-host statistics come from the shared cache
+        host_stats = self.get_host_stats()
+        health_scores = host_stats['health_score']
+        critical_level = self.critical_threshold.get()
+        warning_level = self.warning_threshold.get()
+        
+        for hostname, avg_cpu, max_cpu, record_count, health_score in zip(
+                host_stats.index, host_stats['mean'], host_stats['max'], host_stats['count'], health_scores):
             # Determine status
-            if avg_cpu >= self.critical_threshold.get():
+            if avg_cpu >= critical_level:
                 status = "🔴 Critical"
-            elif avg_cpu >= self.warning_threshold.get():
+            elif avg_cpu >= warning_level:
                 status = "🟡 Warning"
             else:
                 status = "🟢 Healthy"
@@ -5514,25 +5645,43 @@ class ModernCPUAnalyzer:
         # Modern dark color palette for lines
         colors = ['#00d4ff', '#ff6b6b', '#4ecdc4', '#45b7d1', '#96ceb4', '#feca57', '#ff9ff3', '#54a0ff']
         
-        hostnames = sorted(self.processed_data['Hostname'].unique())
+        # Host groups come out already sorted by host and time from the cached frame
+        host_groups = self.get_host_groups()
         
-        for i, hostname in enumerate(hostnames):
-            host_data = self.processed_data[self.processed_data['Hostname'] == hostname].copy()
-            host_data = host_data.sort_values('Time')
-            
+        # No point sending more than ~2 points per horizontal pixel to matplotlib
+        max_points = 2 * max(self.canvas.get_tk_widget().winfo_width(), 800)
+        
+        # All host lines go into a single LineCollection (one artist, one draw call);
+        # proxy Line2D handles stand in for them in the legend
+        segments = []
+        segment_colors = []
+        legend_handles = []
+        for i, (hostname, host_data) in enumerate(host_groups.items()):
             color = colors[i % len(colors)]
-            self.ax.plot(host_data['Time'], host_data['CPU_Ready_Percent'],
-                        marker='o', markersize=3, linewidth=2.5, label=hostname,
-                        color=color, alpha=0.9)
+            times, values = minmax_downsample(host_data['Time'].values,
+                                              host_data['CPU_Ready_Percent'].values, max_points)
+            segments.append(np.column_stack([mdates.date2num(times), values]))
+            segment_colors.append(color)
+            legend_handles.append(Line2D([0], [0], color=color, linewidth=2.5, marker='o', markersize=3,
+                                         label=hostname))
+        
+        if segments:
+            self.ax.add_collection(LineCollection(segments, colors=segment_colors, linewidths=2.5, alpha=0.9))
+            # Per-point markers for every host as one scatter artist (s is area: markersize 3 -> 9)
+            points = np.concatenate(segments)
+            point_colors = np.repeat(segment_colors, [len(segment) for segment in segments])
+            self.ax.scatter(points[:, 0], points[:, 1], s=9, c=point_colors, alpha=0.9, zorder=2.5)
+            self.ax.xaxis_date()
+            self.ax.autoscale_view()
         
         # Add threshold lines with dark theme colors
         warning_line = self.warning_threshold.get()
         critical_line = self.critical_threshold.get()
         
-        self.ax.axhline(y=warning_line, color='#ff8c00', linestyle='--', 
-                    alpha=0.8, linewidth=2, label=f'Warning ({warning_line}%)')
-        self.ax.axhline(y=critical_line, color='#ff4757', linestyle='--', 
-                    alpha=0.8, linewidth=2, label=f'Critical ({critical_line}%)')
+        legend_handles.append(self.ax.axhline(y=warning_line, color='#ff8c00', linestyle='--', 
+                    alpha=0.8, linewidth=2, label=f'Warning ({warning_line}%)'))
+        legend_handles.append(self.ax.axhline(y=critical_line, color='#ff4757', linestyle='--', 
+                    alpha=0.8, linewidth=2, label=f'Critical ({critical_line}%)'))
         
         # Dark theme styling
         self.ax.set_facecolor(self.colors['bg_secondary'])
@@ -5542,7 +5691,7 @@ class ModernCPUAnalyzer:
         self.ax.set_ylabel('CPU Ready %', fontsize=12, color=self.colors['text_primary'])
         
         # Legend with dark styling
-        legend = self.ax.legend(loc='upper left', bbox_to_anchor=(1.02, 1),
+        legend = self.ax.legend(handles=legend_handles, loc='upper left', bbox_to_anchor=(1.02, 1),
                             frameon=True, fancybox=True, shadow=False,
                             facecolor=self.colors['bg_tertiary'],
                             edgecolor=self.colors['border'],
@@ -5558,22 +5707,31 @@ class ModernCPUAnalyzer:
         self.ax.spines['left'].set_color(self.colors['border'])
         self.ax.spines['right'].set_color(self.colors['border'])
         
-        # Format dates on x-axis
-        self.fig.autofmt_xdate()
+        # Rotate date labels through the tick defaults rather than autofmt_xdate, which walks every
+        # label and re-adjusts the subplot margins on each update (tight_layout owns the margins)
+        self.ax.tick_params(axis='x', labelrotation=30)
         self.fig.patch.set_facecolor(self.colors['bg_primary'])
-        self.fig.tight_layout()
-        self.canvas.draw()
+        
+        # tight_layout measures every artist - only redo it when size, legend or y-label width changed
+        layout_signature = (tuple(self.fig.get_size_inches()), tuple(host_groups),
+                            len(f"{self.ax.get_ylim()[1]:.0f}"))
+        if layout_signature != self._chart_layout_signature:
+            self.fig.tight_layout()
+            self._chart_layout_signature = layout_signature
+        # Let Tk coalesce back-to-back redraws (threshold spinbox, repeated clicks) into one render
+        self.canvas.draw_idle()
   
     def clear_results(self):
         """Clear all results displays"""
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
+        children = self.results_tree.get_children()
+        if children:
+            self.results_tree.delete(*children)
         
         if hasattr(self, 'impact_text'):
             self.impact_text.delete(1.0, tk.END)
         
         self.ax.clear()
-        self.canvas.draw()
+        self.canvas.draw_idle()
     
     # Host Management Methods   
     def select_all_hosts(self):
@@ -5604,29 +5762,30 @@ class ModernCPUAnalyzer:
         self.show_progress("Analyzing removal impact...")
         
         try:
-            # Perform analysis (simplified version)
-            total_hosts = len(self.processed_data['Hostname'].unique())
+            # Dataset-wide totals are cached per calculation, not recomputed on every click
+            self.ensure_workload_totals()
+            
+            # Perform analysis (simplified version) - host membership is checked once against
+            # the per-host index rather than masking every row of processed_data
+            host_index = self._per_host_workload.index
+            selected_mask = host_index.isin(frozenset(selected_hosts))
+            total_hosts = len(host_index)
             if len(selected_hosts) >= total_hosts:
                 self.impact_text.delete(1.0, tk.END)
                 self.impact_text.insert(1.0, "❌ Cannot remove all hosts - no remaining infrastructure!")
                 return
             
             # Calculate impact metrics
-            selected_data = self.processed_data[self.processed_data['Hostname'].isin(selected_hosts)]
-            remaining_data = self.processed_data[~self.processed_data['Hostname'].isin(selected_hosts)]
+            workload_to_redistribute, workload_percentage = self.impact_for(selected_hosts)
             
-            workload_to_redistribute = selected_data['CPU_Ready_Sum'].sum()
-            total_workload = self.processed_data['CPU_Ready_Sum'].sum()
-            workload_percentage = (workload_to_redistribute / total_workload) * 100
-            
-            current_avg = self.processed_data['CPU_Ready_Percent'].mean()
+            current_avg = self._overall_avg_pct
             
             # Simple redistribution calculation
-            remaining_hosts = len(remaining_data['Hostname'].unique())
+            remaining_hosts = total_hosts - int(selected_mask.sum())
             additional_per_host = workload_to_redistribute / remaining_hosts
             
             # Create analysis report
-            report = f"""📊 HOST REMOVAL IMPACT ANALYSIS
+            parts = [f"""📊 HOST REMOVAL IMPACT ANALYSIS
 {'='*50}
 
 🗑️  Hosts to Remove: {len(selected_hosts)}
@@ -5642,17 +5801,17 @@ class ModernCPUAnalyzer:
    • Infrastructure reduction: {(len(selected_hosts)/total_hosts*100):.1f}%
 
 💡 Recommendations:
-"""
+"""]
             
             if workload_percentage > 20:
-                report += "   🔴 HIGH RISK: Significant workload redistribution required\n"
+                parts.append("   🔴 HIGH RISK: Significant workload redistribution required\n")
             elif workload_percentage > 10:
-                report += "   🟡 MODERATE RISK: Monitor performance after consolidation\n"
+                parts.append("   🟡 MODERATE RISK: Monitor performance after consolidation\n")
             else:
-                report += "   🟢 LOW RISK: Safe for consolidation\n"
+                parts.append("   🟢 LOW RISK: Safe for consolidation\n")
             
             self.impact_text.delete(1.0, tk.END)
-            self.impact_text.insert(1.0, report)
+            self.impact_text.insert(1.0, ''.join(parts))
             
         except Exception as e:
             messagebox.showerror("Analysis Error", f"Error analyzing removal impact:\n{str(e)}")
@@ -5669,23 +5828,23 @@ class ModernCPUAnalyzer:
         critical_level = self.critical_threshold.get()
         
         # Generate health report
-        report = f"""🏥 HOST HEALTH ANALYSIS
+        parts = [f"""🏥 HOST HEALTH ANALYSIS
 {'='*50}
 
 Thresholds: Warning {warning_level}% | Critical {critical_level}%
 
-"""
+"""]
+        
+        # All per-host statistics and threshold counts come from the shared cache
+        host_stats = self.get_host_stats()
+        warning_times = host_stats['warning_count']
+        critical_times = host_stats['critical_count']
+        health_scores = host_stats['health_score']
         
         hosts_summary = []
-        for hostname in sorted(self.processed_data['Hostname'].unique()):
-            host_data = self.processed_data[self.processed_data['Hostname'] == hostname]
-            
-            avg_cpu = host_data['CPU_Ready_Percent'].mean()
-            max_cpu = host_data['CPU_Ready_Percent'].max()
-            std_cpu = host_data['CPU_Ready_Percent'].std()
-            
-            health_score = self.calculate_health_score(avg_cpu, max_cpu, std_cpu)
-            
+        for hostname, health_score, avg_cpu, max_cpu, total_time, warning_time, critical_time in zip(
+                host_stats.index, health_scores, host_stats['mean'], host_stats['max'],
+                host_stats['count'], warning_times, critical_times):
             if avg_cpu >= critical_level:
                 status = "🔴 CRITICAL"
             elif avg_cpu >= warning_level:
@@ -5693,11 +5852,6 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
             else:
                 status = "🟢 HEALTHY"
             
-            # Time above thresholds
-            warning_time = len(host_data[host_data['CPU_Ready_Percent'] >= warning_level])
-            critical_time = len(host_data[host_data['CPU_Ready_Percent'] >= critical_level])
-            total_time = len(host_data)
-            
             hosts_summary.append({
                 'hostname': hostname,
                 'health_score': health_score,
@@ -5712,24 +5866,24 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
         hosts_summary.sort(key=lambda x: x['health_score'])
         
         for i, host in enumerate(hosts_summary, 1):
-            report += f"{i}. {host['hostname']} - {host['status']}\n"
-            report += f"   Health Score: {host['health_score']:.0f}/100\n"
-            report += f"   Avg: {host['avg_cpu']:.2f}% | Max: {host['max_cpu']:.2f}%\n"
-            report += f"   Time > Warning: {host['warning_pct']:.1f}%\n"
-            report += f"   Time > Critical: {host['critical_pct']:.1f}%\n\n"
+            parts.append(f"{i}. {host['hostname']} - {host['status']}\n"
+                         f"   Health Score: {host['health_score']:.0f}/100\n"
+                         f"   Avg: {host['avg_cpu']:.2f}% | Max: {host['max_cpu']:.2f}%\n"
+                         f"   Time > Warning: {host['warning_pct']:.1f}%\n"
+                         f"   Time > Critical: {host['critical_pct']:.1f}%\n\n")
         
         # Summary
         critical_hosts = [h for h in hosts_summary if h['avg_cpu'] >= critical_level]
         warning_hosts = [h for h in hosts_summary if warning_level <= h['avg_cpu'] < critical_level]
         healthy_hosts = [h for h in hosts_summary if h['avg_cpu'] < warning_level]
         
-        report += f"📊 SUMMARY:\n"
-        report += f"🔴 Critical: {len(critical_hosts)} hosts\n"
-        report += f"🟡 Warning: {len(warning_hosts)} hosts\n"
-        report += f"🟢 Healthy: {len(healthy_hosts)} hosts\n"
+        parts.append(f"📊 SUMMARY:\n"
+                     f"🔴 Critical: {len(critical_hosts)} hosts\n"
+                     f"🟡 Warning: {len(warning_hosts)} hosts\n"
+                     f"🟢 Healthy: {len(healthy_hosts)} hosts\n")
         
         self.health_text.delete(1.0, tk.END)
-        self.health_text.insert(1.0, report)
+        self.health_text.insert(1.0, ''.join(parts))
     
     def show_heatmap_calendar(self):
         """Display CPU Ready data as a heat map calendar with consistent styling"""
@@ -5745,9 +5899,10 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
         main_container.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # Create matplotlib figure with modern styling
-        num_hosts = len(self.processed_data['Hostname'].unique())
+        num_hosts = len(self.get_sorted_hostnames())
         fig_height = max(8, num_hosts * 2)
         fig, axes = plt.subplots(nrows=num_hosts, ncols=1, figsize=(14, fig_height))
+        self.close_figure_on_destroy(heatmap_window, fig)
         
         # Set dark theme for the figure
         fig.patch.set_facecolor(self.colors['bg_primary'])
@@ -5763,35 +5918,24 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
         colors = ['#10b981', '#84cc16', '#eab308', '#f59e0b', '#ef4444', '#dc2626']
         custom_cmap = LinearSegmentedColormap.from_list('modern_cpu_ready', colors, N=256)
         
-        for idx, hostname in enumerate(sorted(self.processed_data['Hostname'].unique())):
+        # Calendar days shared by every host; the grid is padded so column 0 is always Monday
+        calendar_days = pd.date_range(start=start_date, end=end_date, freq='D').date
+        lead_pad = start_date.weekday()
+        trail_pad = (-(lead_pad + len(calendar_days))) % 7
+        
+        for idx, hostname in enumerate(self.get_sorted_hostnames()):
             ax = axes[idx] if num_hosts > 1 else axes[0]
             ax.set_facecolor(self.colors['bg_secondary'])
             
-            host_data = self.processed_data[self.processed_data['Hostname'] == hostname].copy()
-            
-            # Group by date and calculate daily average
-            host_data['Date'] = host_data['Time'].dt.date
-            daily_avg = host_data.groupby('Date')['CPU_Ready_Percent'].mean().reset_index()
+            host_data = self.get_host_groups()[hostname]
             
-            # Create calendar grid
-            date_range = pd.date_range(start=start_date, end=end_date, freq='D')
-            weeks = []
-            current_week = []
+            # Daily averages aligned to the full date range in one reindex (missing days -> 0)
+            daily_avg = host_data.groupby(host_data['Time'].dt.date)['CPU_Ready_Percent'].mean()
+            daily_values = daily_avg.reindex(calendar_days, fill_value=0).to_numpy(dtype=np.float32)
             
-            for single_date in date_range:
-                date_val = single_date.date()
-                cpu_ready_val = daily_avg[daily_avg['Date'] == date_val]['CPU_Ready_Percent']
-                
-                value = cpu_ready_val.iloc[0] if len(cpu_ready_val) > 0 else 0
-                current_week.append(value)
-                
-                if date_val.weekday() == 6 or single_date == date_range[-1]:
-                    while len(current_week) < 7:
-                        current_week.append(0)
-                    weeks.append(current_week)
-                    current_week = []
-            
-            calendar_array = np.array(weeks)
+            # Create calendar grid - one row per Monday-Sunday week. np.pad returns a fresh
+            # C-contiguous float32 buffer, which imshow can use without another conversion copy
+            calendar_array = np.pad(daily_values, (lead_pad, trail_pad)).reshape(-1, 7)
             max_val = max(20, calendar_array.max())
             
             # Create heatmap
@@ -5818,14 +5962,15 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
             ax.set_xticklabels(days)
             
             # Add values for significant readings
+            # Only cells at or above the warning threshold get a label, located in one numpy pass
             warning_threshold = self.warning_threshold.get()
-            for week_idx, week in enumerate(weeks):
-                for day_idx, value in enumerate(week):
-                    if value >= warning_threshold:
-                        text_color = 'white' if value > max_val * 0.6 else 'black'
-                        ax.text(day_idx, week_idx, f'{value:.1f}', 
-                            ha='center', va='center', fontsize=8, 
-                            color=text_color, fontweight='bold')
+            week_rows, day_cols = np.nonzero(calendar_array >= warning_threshold)
+            label_values = calendar_array[week_rows, day_cols]
+            text_colors = np.where(label_values > max_val * 0.6, 'white', 'black')
+            for day_idx, week_idx, value, text_color in zip(day_cols, week_rows, label_values, text_colors):
+                ax.text(day_idx, week_idx, f'{value:.1f}', 
+                    ha='center', va='center', fontsize=8, 
+                    color=text_color, fontweight='bold')
             
             # Colorbar with dark styling
             cbar = plt.colorbar(im, ax=ax, shrink=0.8)
@@ -5840,7 +5985,7 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
         canvas_frame.pack(fill=tk.BOTH, expand=True)
         
         canvas = FigureCanvasTkAgg(fig, master=canvas_frame)
-        canvas.draw()
+        canvas.draw_idle()
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         canvas.get_tk_widget().configure(bg=self.colors['bg_primary'])
         
@@ -5870,49 +6015,58 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
         main_container = tk.Frame(trends_window, bg=self.colors['bg_primary'])
         main_container.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Create figure with subplots and dark theme
-        fig = plt.figure(figsize=(16, 12))
+        # Create figure with subplots and dark theme (no eager pyplot draws while it is populated)
+        with plt.ioff():
+            fig = plt.figure(figsize=(16, 12))
+        self.close_figure_on_destroy(trends_window, fig)
         fig.patch.set_facecolor(self.colors['bg_primary'])
         gs = fig.add_gridspec(3, 2, hspace=0.3, wspace=0.3)
         
+        warning_level = self.warning_threshold.get()
+        critical_level = self.critical_threshold.get()
+        
         # Color palette
-        colors = plt.cm.Set3(np.linspace(0, 1, len(self.processed_data['Hostname'].unique())))
+        colors = plt.cm.Set3(np.linspace(0, 1, len(self.get_sorted_hostnames())))
         
         # 1. Moving Average Trends
         ax1 = fig.add_subplot(gs[0, :])
         ax1.set_facecolor(self.colors['bg_secondary'])
         
-        for i, hostname in enumerate(sorted(self.processed_data['Hostname'].unique())):
-            host_data = self.processed_data[self.processed_data['Hostname'] == hostname].copy()
-            host_data = host_data.sort_values('Time')
-            
-            # Calculate moving averages with minimum window check
-            window_size = min(5, len(host_data))
-            if window_size >= 3:
-                host_data['MA_5'] = host_data['CPU_Ready_Percent'].rolling(window=window_size, center=True, min_periods=1).mean()
-            
-            window_size_10 = min(10, len(host_data))
-            if window_size_10 >= 3:
-                host_data['MA_10'] = host_data['CPU_Ready_Percent'].rolling(window=window_size_10, center=True, min_periods=1).mean()
-            
+        # Faint raw-data lines for every host are drawn as one collection
+        raw_segments = []
+        raw_colors = []
+        
+        # 10-point centred moving average for every host in one grouped rolling pass
+        # (rows are already host/time ordered, so each group is a time series)
+        moving_avg = (self.get_sorted_by_host()
+                      .groupby('Hostname', observed=True, sort=False)['CPU_Ready_Percent']
+                      .rolling(window=10, center=True, min_periods=1).mean()
+                      .reset_index(level=0, drop=True))
+        
+        for i, (hostname, host_data) in enumerate(self.get_host_groups().items()):
             color = colors[i]
             
-            # Plot raw data with transparency
-            ax1.plot(host_data['Time'], host_data['CPU_Ready_Percent'], 
-                    alpha=0.3, color=color, linewidth=1)
+            # Collect raw data segment (drawn with transparency after the loop)
+            raw_segments.append(np.column_stack([mdates.date2num(host_data['Time'].values),
+                                                 host_data['CPU_Ready_Percent'].values]))
+            raw_colors.append(color)
             
-            # Plot moving average if available
-            if 'MA_10' in host_data.columns:
-                ax1.plot(host_data['Time'], host_data['MA_10'], 
+            # Plot moving average when there are enough points for it to mean anything
+            if len(host_data) >= 3:
+                ax1.plot(host_data['Time'].values, moving_avg.loc[host_data.index].values, 
                         linewidth=2.5, label=f'{hostname}', color=color)
             else:
-                ax1.plot(host_data['Time'], host_data['CPU_Ready_Percent'], 
+                ax1.plot(host_data['Time'].values, host_data['CPU_Ready_Percent'].values, 
                         linewidth=2.5, label=f'{hostname}', color=color)
         
+        if raw_segments:
+            ax1.add_collection(LineCollection(raw_segments, colors=raw_colors, linewidths=1, alpha=0.3))
+            ax1.autoscale_view()
+        
         # Add threshold lines
-        ax1.axhline(y=self.warning_threshold.get(), color='#f59e0b', 
+        ax1.axhline(y=warning_level, color='#f59e0b', 
                 linestyle='--', alpha=0.8, label='Warning', linewidth=2)
-        ax1.axhline(y=self.critical_threshold.get(), color='#ef4444', 
+        ax1.axhline(y=critical_level, color='#ef4444', 
                 linestyle='--', alpha=0.8, label='Critical', linewidth=2)
         
         # Style ax1
@@ -5943,8 +6097,8 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
         all_values = []
         labels = []
         
-        for hostname in sorted(self.processed_data['Hostname'].unique()):
-            host_data = self.processed_data[self.processed_data['Hostname'] == hostname]
+        for hostname in self.get_sorted_hostnames():
+            host_data = self.get_host_groups()[hostname]
             all_values.append(host_data['CPU_Ready_Percent'].values)
             labels.append(hostname[:10])  # Truncate long hostnames for display
         
@@ -5953,11 +6107,7 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
             bp = ax2.boxplot(all_values, tick_labels=labels, patch_artist=True)
         except TypeError:
             # Fallback for older matplotlib versions
-            try:
-                bp = ax2.boxplot(all_values, tick_labels=labels, patch_artist=True)
-            except TypeError:
-                # Fallback for older matplotlib versions
-                bp = ax2.boxplot(all_values, labels=labels, patch_artist=True)
+            bp = ax2.boxplot(all_values, labels=labels, patch_artist=True)
 
         # Color the boxes
         for patch, color in zip(bp['boxes'], colors):
@@ -5975,9 +6125,9 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
                         item.set_linewidth(2)
         
         # Add threshold lines
-        ax2.axhline(y=self.warning_threshold.get(), color='#f59e0b', 
+        ax2.axhline(y=warning_level, color='#f59e0b', 
                 linestyle='--', alpha=0.8, linewidth=2)
-        ax2.axhline(y=self.critical_threshold.get(), color='#ef4444', 
+        ax2.axhline(y=critical_level, color='#ef4444', 
                 linestyle='--', alpha=0.8, linewidth=2)
         
         ax2.set_title('CPU Ready % Distribution by Host', 
@@ -5994,33 +6144,25 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
         ax3 = fig.add_subplot(gs[1, 1])
         ax3.set_facecolor(self.colors['bg_secondary'])
         
-        peak_data = []
-        peak_hosts = []
-        peak_times = []
-        
-        for hostname in sorted(self.processed_data['Hostname'].unique()):
-            host_data = self.processed_data[self.processed_data['Hostname'] == hostname]
-            # Get top 3 peaks for each host
-            top_peaks = host_data.nlargest(3, 'CPU_Ready_Percent')
-            
-            for _, peak_row in top_peaks.iterrows():
-                peak_data.append(peak_row['CPU_Ready_Percent'])
-                peak_hosts.append(hostname)
-                peak_times.append(peak_row['Time'])
+        # Top 3 peaks for every host from a single grouped nlargest (hosts in sorted order)
+        top_peaks = self.processed_data.groupby('Hostname', observed=True)['CPU_Ready_Percent'].nlargest(3)
+        peak_data = top_peaks.to_numpy()
         
         # Create scatter plot
-        if peak_data:
-            scatter_colors = [colors[list(sorted(self.processed_data['Hostname'].unique())).index(host)] 
-                            for host in peak_hosts]
+        if len(peak_data):
+            # One RGBA array for every point, indexed by each peak's host position
+            host_positions = pd.Index(self.get_sorted_hostnames()).get_indexer(
+                top_peaks.index.get_level_values('Hostname'))
+            scatter_colors = colors[host_positions]
             
             scatter = ax3.scatter(range(len(peak_data)), peak_data, 
                                 c=scatter_colors, s=80, alpha=0.7, 
                                 edgecolors=self.colors['border'], linewidth=1)
             
             # Add threshold lines
-            ax3.axhline(y=self.warning_threshold.get(), color='#f59e0b', 
+            ax3.axhline(y=warning_level, color='#f59e0b', 
                     linestyle='--', alpha=0.8, label='Warning', linewidth=2)
-            ax3.axhline(y=self.critical_threshold.get(), color='#ef4444', 
+            ax3.axhline(y=critical_level, color='#ef4444', 
                     linestyle='--', alpha=0.8, label='Critical', linewidth=2)
             
             ax3.set_title('Performance Peaks Analysis (Top 3 per Host)', 
@@ -6048,34 +6190,36 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
         ax4 = fig.add_subplot(gs[2, :])
         ax4.set_facecolor(self.colors['bg_secondary'])
         
+        # Shared box style for the fallback messages below
+        message_bbox = dict(boxstyle='round', facecolor=self.colors['bg_tertiary'],
+                            edgecolor=self.colors['border'], alpha=0.8)
+        
         # Check if we have enough data for hourly analysis
         if len(self.processed_data) > 24:
             try:
-                # Add hour column
-                self.processed_data['Hour'] = self.processed_data['Time'].dt.hour
-                
-                # Group by hour and hostname
-                hourly_stats = self.processed_data.groupby(['Hour', 'Hostname'])['CPU_Ready_Percent'].agg(['mean', 'std']).reset_index()
+                # Hour-of-day x host mean/std matrices in one pivot (processed_data itself is left untouched)
+                hours = self.processed_data['Time'].dt.hour.to_numpy(dtype=np.int8)
+                hourly_stats = self.processed_data.pivot_table(index=hours, columns='Hostname',
+                                                               values='CPU_Ready_Percent',
+                                                               aggfunc=['mean', 'std'], observed=True)
+                hourly_mean = hourly_stats['mean']
+                hourly_std = hourly_stats['std'].fillna(0)
                 
-                # Plot for each hostname
-                for i, hostname in enumerate(sorted(self.processed_data['Hostname'].unique())):
-                    host_hourly = hourly_stats[hourly_stats['Hostname'] == hostname]
+                # Plot every host's mean line in one call, then colour and label the returned lines
+                host_positions = {hostname: i for i, hostname in enumerate(self.get_sorted_hostnames())}
+                hour_values = hourly_mean.index.to_numpy()
+                mean_lines = ax4.plot(hour_values, hourly_mean.to_numpy(), 
+                                      marker='o', linewidth=2.5, markersize=4)
+                for line, hostname in zip(mean_lines, hourly_mean.columns):
+                    color = colors[host_positions[hostname]]
+                    line.set_color(color)
+                    line.set_label(hostname)
                     
-                    if len(host_hourly) > 0:
-                        color = colors[i]
-                        
-                        # Plot mean line
-                        ax4.plot(host_hourly['Hour'], host_hourly['mean'], 
-                                marker='o', linewidth=2.5, markersize=4,
-                                label=hostname, color=color)
-                        
-                        # Add standard deviation as fill_between (if std exists and is not NaN)
-                        if 'std' in host_hourly.columns and not host_hourly['std'].isna().all():
-                            std_values = host_hourly['std'].fillna(0)
-                            ax4.fill_between(host_hourly['Hour'], 
-                                            host_hourly['mean'] - std_values,
-                                            host_hourly['mean'] + std_values,
-                                            alpha=0.2, color=color)
+                    # Add standard deviation band
+                    mean_values = hourly_mean[hostname].to_numpy()
+                    std_values = hourly_std[hostname].to_numpy()
+                    ax4.fill_between(hour_values, mean_values - std_values, mean_values + std_values,
+                                     alpha=0.2, color=color)
                 
                 ax4.set_title('Average CPU Ready % by Hour of Day (with Standard Deviation)', 
                             fontsize=12, fontweight='bold', color=self.colors['text_primary'], pad=15)
@@ -6087,9 +6231,9 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
                 ax4.set_xlim(-0.5, 23.5)
                 
                 # Add threshold reference lines
-                ax4.axhline(y=self.warning_threshold.get(), color='#f59e0b', 
+                ax4.axhline(y=warning_level, color='#f59e0b', 
                         linestyle='--', alpha=0.6, linewidth=1)
-                ax4.axhline(y=self.critical_threshold.get(), color='#ef4444', 
+                ax4.axhline(y=critical_level, color='#ef4444', 
                         linestyle='--', alpha=0.6, linewidth=1)
                 
                 legend4 = ax4.legend(loc='upper left',
@@ -6099,35 +6243,33 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
                                     labelcolor=self.colors['text_primary'])
                 
             except Exception as e:
-                print(f"DEBUG: Error in hourly analysis: {e}")
+                logger.warning("Error in hourly analysis: %s", e)
                 ax4.text(0.5, 0.5, f'Error creating hourly analysis:\n{str(e)}', 
                         ha='center', va='center', transform=ax4.transAxes,
                         color=self.colors['text_primary'], fontsize=12,
-                        bbox=dict(boxstyle='round', facecolor=self.colors['bg_tertiary'], 
-                                edgecolor=self.colors['border'], alpha=0.8))
+                        bbox=message_bbox)
         else:
             ax4.text(0.5, 0.5, '📊 Insufficient data for hourly pattern analysis\n\n'
                             f'Current data points: {len(self.processed_data)}\n'
                             'Need at least 24 data points to show hourly patterns', 
                     ha='center', va='center', transform=ax4.transAxes, 
                     fontsize=12, color=self.colors['text_primary'],
-                    bbox=dict(boxstyle='round', facecolor=self.colors['bg_tertiary'], 
-                            edgecolor=self.colors['border'], alpha=0.8))
+                    bbox=message_bbox)
             ax4.set_title('Hourly Pattern Analysis', 
                         fontsize=12, fontweight='bold', color=self.colors['text_primary'], pad=15)
         
         for spine in ax4.spines.values():
             spine.set_color(self.colors['border'])
         
-        # Adjust layout to prevent overlapping
-        plt.tight_layout(pad=2.0)
+        # Adjust layout to prevent overlapping - once, after every subplot is populated
+        fig.tight_layout(pad=2.0)
         
         # Embed in window with scrollable canvas if needed
         canvas_frame = tk.Frame(main_container, bg=self.colors['bg_primary'])
         canvas_frame.pack(fill=tk.BOTH, expand=True)
         
         canvas = FigureCanvasTkAgg(fig, master=canvas_frame)
-        canvas.draw()
+        canvas.draw_idle()
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         canvas.get_tk_widget().configure(bg=self.colors['bg_primary'])
         
@@ -6159,7 +6301,7 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
             summary_label.pack(pady=5)
             
         except Exception as e:
-            print(f"DEBUG: Error calculating summary stats: {e}")
+            logger.warning("Error calculating summary stats: %s", e)
 
     def show_host_comparison(self):
         """Show detailed host-by-host comparison with consistent styling"""
@@ -6207,33 +6349,21 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
         for col in columns:
             tree.heading(col, text=col)
         
-        # Calculate comprehensive stats
-        comparison_data = []
-        for hostname in sorted(self.processed_data['Hostname'].unique()):
-            host_data = self.processed_data[self.processed_data['Hostname'] == hostname]
-            
-            avg_cpu = host_data['CPU_Ready_Percent'].mean()
-            max_cpu = host_data['CPU_Ready_Percent'].max()
-            min_cpu = host_data['CPU_Ready_Percent'].min()
-            std_cpu = host_data['CPU_Ready_Percent'].std()
-            
-            health_score = self.calculate_health_score(avg_cpu, max_cpu, std_cpu)
-            
-            # Determine status and recommendation
-            if avg_cpu >= self.critical_threshold.get():
-                status = "🔴 Critical"
-                recommendation = "Immediate attention needed"
-            elif avg_cpu >= self.warning_threshold.get():
-                status = "🟡 Warning"
-                recommendation = "Monitor and investigate"
-            elif avg_cpu < 2:
-                status = "🟢 Excellent"
-                recommendation = "Great consolidation candidate"
-            else:
-                status = "🟢 Good"
-                recommendation = "Performing well"
-            
-            comparison_data.append({
+        # Comprehensive stats come from the shared per-host cache
+        warning_level = self.warning_threshold.get()
+        critical_level = self.critical_threshold.get()
+        stats = self.get_host_stats()
+        avg_values = stats['mean'].to_numpy(dtype=np.float64)
+        health_scores = stats['health_score']
+        
+        # Determine status and recommendation
+        conditions = [avg_values >= critical_level, avg_values >= warning_level, avg_values < 2]
+        statuses = np.select(conditions, ["🔴 Critical", "🟡 Warning", "🟢 Excellent"], "🟢 Good")
+        recommendations = np.select(conditions, ["Immediate attention needed", "Monitor and investigate",
+                                                 "Great consolidation candidate"], "Performing well")
+        
+        comparison_data = [
+            {
                 'hostname': hostname,
                 'avg': avg_cpu,
                 'max': max_cpu,
@@ -6242,7 +6372,11 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
                 'health': health_score,
                 'status': status,
                 'recommendation': recommendation
-            })
+            }
+            for hostname, avg_cpu, max_cpu, min_cpu, std_cpu, health_score, status, recommendation in zip(
+                stats.index, avg_values, stats['max'], stats['min'], stats['std'],
+                health_scores, statuses.tolist(), recommendations.tolist())
+        ]
         
         # Sort by health score (best first for ranking)
         comparison_data.sort(key=lambda x: -x['health'])
@@ -6280,9 +6414,9 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
         summary_content = tk.Frame(summary_frame, bg=self.colors['bg_primary'])
         summary_content.pack(fill=tk.X, padx=10, pady=10)
         
-        critical_count = len([d for d in comparison_data if d['avg'] >= self.critical_threshold.get()])
-        warning_count = len([d for d in comparison_data if self.warning_threshold.get() <= d['avg'] < self.critical_threshold.get()])
-        healthy_count = len([d for d in comparison_data if d['avg'] < self.warning_threshold.get()])
+        critical_count = int((avg_values >= critical_level).sum())
+        warning_count = int(((avg_values >= warning_level) & (avg_values < critical_level)).sum())
+        healthy_count = int((avg_values < warning_level).sum())
         
         summary_text = (f"🔴 Critical Hosts: {critical_count} | "
                     f"🟡 Warning Hosts: {warning_count} | "
@@ -6314,28 +6448,41 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
         
         if filename:
             try:
-                df_data = []
-                for rank, data in enumerate(comparison_data, 1):
-                    df_data.append({
-                        'Rank': rank,
-                        'Hostname': data['hostname'],
-                        'Average_CPU_Ready_Percent': round(data['avg'], 3),
-                        'Maximum_CPU_Ready_Percent': round(data['max'], 3),
-                        'Minimum_CPU_Ready_Percent': round(data['min'], 3),
-                        'Standard_Deviation': round(data['std'], 3),
-                        'Health_Score': round(data['health'], 1),
-                        'Status': data['status'].replace('🔴 ', '').replace('🟡 ', '').replace('🟢 ', ''),
-                        'Recommendation': data['recommendation'],
-                        'Export_Date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    })
+                export_ts = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                 
-                df = pd.DataFrame(df_data)
-                df.to_csv(filename, index=False)
+                # Round and clean whole columns at once, then stream the rows straight to the writer
+                report = pd.DataFrame.from_records(comparison_data, columns=['hostname', 'avg', 'max', 'min', 'std',
+                                                                             'health', 'status', 'recommendation'])
+                stat_cols = ['avg', 'max', 'min', 'std']
+                stats = report[stat_cols].astype(float).round(3)
+                report[stat_cols] = stats.astype(object).where(stats.notna(), '')
+                report['health'] = report['health'].astype(float).round(1)
+                report['status'] = report['status'].str.replace(_STATUS_RE, '', regex=True)
+                report.insert(0, 'rank', np.arange(1, len(report) + 1))
+                report['export_ts'] = export_ts
+                
+                with open(filename, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.writer(f)
+                    writer.writerow(['Rank', 'Hostname', 'Average_CPU_Ready_Percent', 'Maximum_CPU_Ready_Percent',
+                                     'Minimum_CPU_Ready_Percent', 'Standard_Deviation', 'Health_Score',
+                                     'Status', 'Recommendation', 'Export_Date'])
+                    writer.writerows(report.itertuples(index=False, name=None))
                 messagebox.showinfo("Export Complete", f"Comparison report exported to:\n{filename}")
                 
             except Exception as e:
                 messagebox.showerror("Export Error", f"Failed to export report:\n{str(e)}")
     
+    def write_csv_export(self, df, filename):
+        """Write export DataFrame to CSV, using pyarrow's writer when available - round floats before calling"""
+        if ARROW_AVAILABLE:
+            try:
+                pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), filename,
+                                write_options=pacsv.WriteOptions(include_header=True))
+                return
+            except Exception as e:
+                logger.warning("pyarrow CSV write failed, falling back to pandas: %s", e)
+        df.to_csv(filename, index=False)
+
     def export_analysis_report(self):
         """Export analysis report"""
         if self.processed_data is None:
@@ -6350,33 +6497,28 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
         if filename:
             try:
                 # Create comprehensive report
-                report_data = []
+                analysis_ts = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                warn_thr = self.warning_threshold.get()
+                crit_thr = self.critical_threshold.get()
                 
-                for hostname in sorted(self.processed_data['Hostname'].unique()):
-                    host_data = self.processed_data[self.processed_data['Hostname'] == hostname]
-                    
-                    avg_cpu = host_data['CPU_Ready_Percent'].mean()
-                    max_cpu = host_data['CPU_Ready_Percent'].max()
-                    min_cpu = host_data['CPU_Ready_Percent'].min()
-                    std_cpu = host_data['CPU_Ready_Percent'].std()
-                    
-                    health_score = self.calculate_health_score(avg_cpu, max_cpu, std_cpu)
-                    
-                    report_data.append({
-                        'Hostname': hostname,
-                        'Average_CPU_Ready_Percent': round(avg_cpu, 2),
-                        'Maximum_CPU_Ready_Percent': round(max_cpu, 2),
-                        'Minimum_CPU_Ready_Percent': round(min_cpu, 2),
-                        'Standard_Deviation': round(std_cpu, 2),
-                        'Health_Score': round(health_score, 0),
-                        'Total_Records': len(host_data),
-                        'Analysis_Date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                        'Warning_Threshold': self.warning_threshold.get(),
-                        'Critical_Threshold': self.critical_threshold.get()
-                    })
+                stats = self.get_host_stats()
                 
-                df = pd.DataFrame(report_data)
-                df.to_csv(filename, index=False)
+                # Columns straight from the cached stats, rounded to 2dp here so the writer needs no
+                # float_format and can take the Arrow path (float64 first so float32 noise isn't written)
+                df = pd.DataFrame({
+                    'Hostname': stats.index,
+                    'Average_CPU_Ready_Percent': stats['mean'].to_numpy(dtype=np.float64).round(2),
+                    'Maximum_CPU_Ready_Percent': stats['max'].to_numpy(dtype=np.float64).round(2),
+                    'Minimum_CPU_Ready_Percent': stats['min'].to_numpy(dtype=np.float64).round(2),
+                    'Standard_Deviation': stats['std'].to_numpy(dtype=np.float64).round(2),
+                    'Health_Score': np.rint(stats['health_score'].values).astype(np.int64),
+                    'Total_Records': stats['count'].values,
+                    'Analysis_Date': analysis_ts,
+                    'Warning_Threshold': warn_thr,
+                    'Critical_Threshold': crit_thr
+                })
+                
+                self.write_csv_export(df, filename)
                 
                 messagebox.showinfo("Export Complete", f"Report exported to:\n{filename}")
                 
@@ -6385,65 +6527,72 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
 
     def on_threshold_change(self):
         """Called when thresholds are updated - Updated for real-time integration"""
+        # get_host_stats notices the new thresholds and refreshes only its counts and scores
         if hasattr(self, 'realtime_dashboard'):
-            self.realtime_dashboard.update_thresholds(
-                self.warning_threshold.get(),
-                self.critical_threshold.get()
-            )
-            print(f"DEBUG: Thresholds updated - Warning: {self.warning_threshold.get()}%, Critical: {self.critical_threshold.get()}%")
+            warn_thr = self.warning_threshold.get()
+            crit_thr = self.critical_threshold.get()
+            self.realtime_dashboard.update_thresholds(warn_thr, crit_thr)
+            logger.debug("Thresholds updated - Warning: %s%%, Critical: %s%%", warn_thr, crit_thr)
     
     def on_closing(self):
         """Handle application closing with proper cleanup"""
         try:
-            print("DEBUG: Application closing...")
+            logger.debug("Application closing...")
+            # Network/collector shutdown can block for seconds - run it on daemon
+            # threads with a short wait so the window closes promptly; anything
+            # still running is torn down by the os._exit at the end of main(),
+            # after the log listener has been stopped
+            cleanup_threads = []
             if hasattr(self, 'realtime_dashboard'):
-                self.realtime_dashboard.cleanup()
-            # Disconnect vCenter if connected
-            if hasattr(self, 'vcenter_connection') and self.vcenter_connection:
-                try:
-                    from pyVmomi.VmomiSupport import Disconnect
-                    Disconnect(self.vcenter_connection)
-                    print("DEBUG: vCenter disconnected")
-                except Exception as e:
-                    print(f"DEBUG: Error disconnecting vCenter: {e}")
+                cleanup_threads.append(threading.Thread(target=self.realtime_dashboard.cleanup, daemon=True))
             
-            # Close matplotlib figures
-            if hasattr(self, 'fig'):
-                try:
-                    plt.close(self.fig)
-                    print("DEBUG: Main figure closed")
-                except Exception as e:
-                    print(f"DEBUG: Error closing main figure: {e}")
+            # Disconnect vCenter if connected - the finalizer runs at most once
+            if self._vcenter_finalizer is not None and self._vcenter_finalizer.alive:
+                cleanup_threads.append(threading.Thread(target=self._vcenter_finalizer, daemon=True))
             
-            # Close all matplotlib figures
+            for thread in cleanup_threads:
+                thread.start()
+            for thread in cleanup_threads:
+                thread.join(timeout=1.0)
+            
+            # Close the figures this window owns - popup figures are closed with their windows
             try:
-                plt.close('all')
-                print("DEBUG: All matplotlib figures closed")
+                self._figure_finalizer()
+                if hasattr(self, 'realtime_dashboard'):
+                    plt.close(self.realtime_dashboard.realtime_fig)
+                logger.debug("Chart figures closed")
             except Exception as e:
-                print(f"DEBUG: Error closing all figures: {e}")
+                logger.warning("Error closing chart figures: %s", e)
             
             # Destroy the root window
             try:
                 self.root.quit()  # Stops the mainloop
                 self.root.destroy()  # Destroys the window
-                print("DEBUG: Tkinter window destroyed")
+                logger.debug("Tkinter window destroyed")
             except Exception as e:
-                print(f"DEBUG: Error destroying window: {e}")
+                logger.warning("Error destroying window: %s", e)
                 
         except Exception as e:
-            print(f"DEBUG: Error during cleanup: {e}")
-        finally:
-            # Force exit if needed
-            import sys
-            import os
-            print("DEBUG: Forcing application exit")
-            os._exit(0)  # This will force quit the application
+            logger.warning("Error during cleanup: %s", e)
 
     def create_about_tab(self):
-        """Create scrollable about tab with application and developer information - UPDATED"""
-        tab_frame = tk.Frame(self.notebook, bg=self.colors['bg_primary'])
-        self.notebook.add(tab_frame, text="ℹ️ About")
+        """Add the About tab placeholder - contents are built the first time it is selected"""
+        self.about_tab = tk.Frame(self.notebook, bg=self.colors['bg_primary'])
+        self.notebook.add(self.about_tab, text="ℹ️ About")
+        self.about_tab_built = False
         
+        self.notebook.bind('<<NotebookTabChanged>>', self.on_notebook_tab_changed, add='+')
+    
+    def on_notebook_tab_changed(self, event=None):
+        """Build the About tab contents on first selection"""
+        if self.about_tab_built:
+            return
+        if self.notebook.select() == str(self.about_tab):
+            self.about_tab_built = True
+            self.build_about_tab_contents(self.about_tab)
+    
+    def build_about_tab_contents(self, tab_frame):
+        """Create scrollable about tab with application and developer information - UPDATED"""
         # Configure the main frame to expand properly
         tab_frame.columnconfigure(0, weight=1)
         tab_frame.rowconfigure(0, weight=1)
@@ -6480,36 +6629,25 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
                             text="🖥️ vCenter CPU Ready Analyzer",
                             bg=self.colors['bg_primary'],
                             fg=self.colors['text_primary'],
-                            font=('Segoe UI', 20, 'bold'))
+                            font=_FONT_H1)
         title_label.pack(pady=(0, 5))
         
         version_label = tk.Label(header_frame,
                                 text="Version 2.1 - Real-Time Edition",
                                 bg=self.colors['bg_primary'],
                                 fg=self.colors['accent_blue'],
-                                font=('Segoe UI', 12, 'bold'))
+                                font=_FONT_SECTION)
         version_label.pack(pady=(0, 10))
         
         description_label = tk.Label(header_frame,
                                     text="Advanced CPU Ready metrics analysis with real-time monitoring and AI-powered consolidation optimization",
                                     bg=self.colors['bg_primary'],
                                     fg=self.colors['text_secondary'],
-                                    font=('Segoe UI', 11),
+                                    font=_FONT_LEAD,
                                     wraplength=600)
         description_label.pack()
         
         # What's New Section (NEW)
-        whats_new_section = tk.LabelFrame(main_container, text="  🚀 What's New in Version 2.1  ",
-                                        bg=self.colors['bg_primary'],
-                                        fg=self.colors['success'],
-                                        font=('Segoe UI', 12, 'bold'),
-                                        borderwidth=1,
-                                        relief='solid')
-        whats_new_section.pack(fill=tk.X, pady=(0, 15))
-        
-        whats_new_content = tk.Frame(whats_new_section, bg=self.colors['bg_primary'])
-        whats_new_content.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
         new_features_text = """📡 REAL-TIME MONITORING
         • Live CPU Ready data collection from vCenter
         • Real-time dashboard with interactive charts
@@ -6546,19 +6684,14 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
         • Auto-switch between tabs
         • Intelligent interval detection"""
         
-        new_features_label = tk.Label(whats_new_content,
-                                    text=new_features_text,
-                                    bg=self.colors['bg_primary'],
-                                    fg=self.colors['text_primary'],
-                                    font=('Segoe UI', 10),
-                                    justify=tk.LEFT)
-        new_features_label.pack(anchor=tk.W)
+        self.create_about_section(main_container, "🚀 What's New in Version 2.1",
+                                  new_features_text, self.colors['success'])
         
         # Developer Information Card
         dev_section = tk.LabelFrame(main_container, text="  👨‍💻 Development Team  ",
                                     bg=self.colors['bg_primary'],
                                     fg=self.colors['accent_blue'],
-                                    font=('Segoe UI', 12, 'bold'),
+                                    font=_FONT_SECTION,
                                     borderwidth=1,
                                     relief='solid')
         dev_section.pack(fill=tk.X, pady=(0, 15))
@@ -6571,14 +6704,14 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
                             text="Chief Architect & Developer",
                             bg=self.colors['bg_primary'],
                             fg=self.colors['accent_blue'],
-                            font=('Segoe UI', 11, 'bold'))
+                            font=_FONT_LEAD_BOLD)
         chief_label.pack(anchor=tk.W, pady=(0, 5))
         
         name_label = tk.Label(dev_content,
                             text="Joshua Fourie",
                             bg=self.colors['bg_primary'],
                             fg=self.colors['text_primary'],
-                            font=('Segoe UI', 14, 'bold'))
+                            font=_FONT_H2)
         name_label.pack(anchor=tk.W, pady=(0, 10))
         
         # Contact info
@@ -6589,14 +6722,14 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
                             text="📧",
                             bg=self.colors['bg_primary'],
                             fg=self.colors['text_primary'],
-                            font=('Segoe UI', 12))
+                            font=_FONT_ICON)
         email_icon.pack(side=tk.LEFT, padx=(0, 8))
         
         email_label = tk.Label(contact_frame,
                             text="joshua.fourie@outlook.com",
                             bg=self.colors['bg_primary'],
                             fg=self.colors['accent_blue'],
-                            font=('Segoe UI', 11),
+                            font=_FONT_LEAD,
                             cursor='hand2')
         email_label.pack(side=tk.LEFT)
         
@@ -6614,7 +6747,7 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
                                 text="Expertise:",
                                 bg=self.colors['bg_primary'],
                                 fg=self.colors['text_secondary'],
-                                font=('Segoe UI', 10, 'bold'))
+                                font=_FONT_BODY_BOLD)
         expertise_label.pack(anchor=tk.W, pady=(10, 5))
         
         expertise_text = """• VMware vCenter & vSphere Infrastructure
@@ -6630,22 +6763,10 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
                                     text=expertise_text,
                                     bg=self.colors['bg_primary'],
                                     fg=self.colors['text_primary'],
-                                    font=('Segoe UI', 10),
+                                    font=_FONT_BODY,
                                     justify=tk.LEFT)
         expertise_content.pack(anchor=tk.W)
         
-        # Updated Application Features Card
-        features_section = tk.LabelFrame(main_container, text="  ⭐ Complete Feature Set  ",
-                                        bg=self.colors['bg_primary'],
-                                        fg=self.colors['accent_blue'],
-                                        font=('Segoe UI', 12, 'bold'),
-                                        borderwidth=1,
-                                        relief='solid')
-        features_section.pack(fill=tk.X, pady=(0, 15))
-        
-        features_content = tk.Frame(features_section, bg=self.colors['bg_primary'])
-        features_content.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
         features_text = """🔗 VCENTER INTEGRATION
         • Direct vCenter API connectivity
         • Live performance data fetching
@@ -6704,26 +6825,6 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
         • Intelligent data format detection
         • Timezone-aware data processing"""
         
-        features_label = tk.Label(features_content,
-                                text=features_text,
-                                bg=self.colors['bg_primary'],
-                                fg=self.colors['text_primary'],
-                                font=('Segoe UI', 10),
-                                justify=tk.LEFT)
-        features_label.pack(anchor=tk.W)
-        
-        # Updated Technology Stack Card
-        tech_section = tk.LabelFrame(main_container, text="  🛠️ Technology Stack  ",
-                                    bg=self.colors['bg_primary'],
-                                    fg=self.colors['accent_blue'],
-                                    font=('Segoe UI', 12, 'bold'),
-                                    borderwidth=1,
-                                    relief='solid')
-        tech_section.pack(fill=tk.X, pady=(0, 15))
-        
-        tech_content = tk.Frame(tech_section, bg=self.colors['bg_primary'])
-        tech_content.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
         tech_text = """🐍 Python 3.x
         📊 Pandas & NumPy (Advanced Data Analysis)
         📈 Matplotlib & Seaborn (Professional Visualizations)
@@ -6738,26 +6839,6 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
         🎨 Custom Dark Theme Implementation
         📦 PyInstaller (Executable Distribution)"""
         
-        tech_label = tk.Label(tech_content,
-                            text=tech_text,
-                            bg=self.colors['bg_primary'],
-                            fg=self.colors['text_primary'],
-                            font=('Segoe UI', 10),
-                            justify=tk.LEFT)
-        tech_label.pack(anchor=tk.W)
-        
-        # System Requirements Card (NEW)
-        requirements_section = tk.LabelFrame(main_container, text="  💻 System Requirements  ",
-                                            bg=self.colors['bg_primary'],
-                                            fg=self.colors['accent_blue'],
-                                            font=('Segoe UI', 12, 'bold'),
-                                            borderwidth=1,
-                                            relief='solid')
-        requirements_section.pack(fill=tk.X, pady=(0, 15))
-        
-        requirements_content = tk.Frame(requirements_section, bg=self.colors['bg_primary'])
-        requirements_content.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
         requirements_text = """🖥️ OPERATING SYSTEM
         • Windows 10/11 (Recommended)
         • Windows Server 2016/2019/2022
@@ -6780,26 +6861,6 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
         • vCenter Server 6.5+ (for live monitoring)
         • Modern web browser (for documentation)"""
         
-        requirements_label = tk.Label(requirements_content,
-                                    text=requirements_text,
-                                    bg=self.colors['bg_primary'],
-                                    fg=self.colors['text_primary'],
-                                    font=('Segoe UI', 10),
-                                    justify=tk.LEFT)
-        requirements_label.pack(anchor=tk.W)
-        
-        # License & Copyright Card
-        license_section = tk.LabelFrame(main_container, text="  📄 License & Copyright  ",
-                                    bg=self.colors['bg_primary'],
-                                    fg=self.colors['accent_blue'],
-                                    font=('Segoe UI', 12, 'bold'),
-                                    borderwidth=1,
-                                    relief='solid')
-        license_section.pack(fill=tk.X, pady=(0, 15))
-        
-        license_content = tk.Frame(license_section, bg=self.colors['bg_primary'])
-        license_content.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
         copyright_text = f"""© {datetime.now().year} Joshua Fourie
         All Rights Reserved
 
@@ -6813,13 +6874,16 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
 
         Built with ❤️ for the VMware community"""
         
-        copyright_label = tk.Label(license_content,
-                                text=copyright_text,
-                                bg=self.colors['bg_primary'],
-                                fg=self.colors['text_primary'],
-                                font=('Segoe UI', 10),
-                                justify=tk.CENTER)
-        copyright_label.pack(expand=True)
+        # Remaining cards: (title, body, justify)
+        about_sections = [
+            ("⭐ Complete Feature Set", features_text, tk.LEFT),
+            ("🛠️ Technology Stack", tech_text, tk.LEFT),
+            ("💻 System Requirements", requirements_text, tk.LEFT),
+            ("📄 License & Copyright", copyright_text, tk.CENTER),
+        ]
+        for title, body, justify in about_sections:
+            self.create_about_section(main_container, title, body,
+                                      self.colors['accent_blue'], justify=justify)
         
         # Updated Footer
         footer_frame = tk.Frame(main_container, bg=self.colors['bg_primary'])
@@ -6829,22 +6893,27 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
                             text="🚀 Empowering infrastructure teams with intelligent real-time performance insights and AI-driven optimization",
                             bg=self.colors['bg_primary'],
                             fg=self.colors['text_secondary'],
-                            font=('Segoe UI', 11, 'italic'),
+                            font=_FONT_LEAD_ITALIC,
                             wraplength=600)
         footer_label.pack()
         
         # Mouse wheel scrolling support
         def _on_mousewheel(event):
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+            return "break"
+        
+        # Route the wheel to the canvas only while the pointer is over it,
+        # instead of binding every child label individually
+        def _bind_mousewheel(event):
+            canvas.bind_all("<MouseWheel>", _on_mousewheel)
         
-        # Bind mouse wheel to canvas and all child widgets
-        def bind_to_mousewheel(widget):
-            widget.bind("<MouseWheel>", _on_mousewheel)
-            for child in widget.winfo_children():
-                bind_to_mousewheel(child)
+        def _unbind_mousewheel(event):
+            widget = canvas.winfo_containing(event.x_root, event.y_root)
+            if widget is None or not str(widget).startswith(str(canvas)):
+                canvas.unbind_all("<MouseWheel>")
         
-        bind_to_mousewheel(scrollable_frame)
-        canvas.bind("<MouseWheel>", _on_mousewheel)
+        canvas.bind("<Enter>", _bind_mousewheel)
+        canvas.bind("<Leave>", _unbind_mousewheel)
         
         # Update scroll region when window is resized
         def configure_scroll_region(event=None):
@@ -6855,8 +6924,49 @@ Thresholds: Warning {warning_level}% | Critical {critical_level}%
         
         canvas.bind('<Configure>', configure_scroll_region)
 
+    def create_about_section(self, parent, title, body, title_fg, justify=tk.LEFT):
+        """Create a titled About tab card holding a single block of text"""
+        section = tk.LabelFrame(parent, text=f"  {title}  ",
+                                bg=self.colors['bg_primary'],
+                                fg=title_fg,
+                                font=_FONT_SECTION,
+                                borderwidth=1,
+                                relief='solid')
+        section.pack(fill=tk.X, pady=(0, 15))
+        
+        content = tk.Frame(section, bg=self.colors['bg_primary'])
+        content.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        label = tk.Label(content,
+                         text=body,
+                         bg=self.colors['bg_primary'],
+                         fg=self.colors['text_primary'],
+                         font=_FONT_BODY,
+                         justify=justify)
+        if justify == tk.CENTER:
+            label.pack(expand=True)
+        else:
+            label.pack(anchor=tk.W)
+        return section
+
+def setup_logging():
+    """Route module logging through a background QueueListener and return it"""
+    log_queue = queue.Queue(-1)
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, console_handler)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    level = logging.DEBUG if os.environ.get('CPU_READY_DEBUG') else logging.WARNING
+    for module_logger in (logger, logging.getLogger('realtime_dashboard')):
+        module_logger.addHandler(queue_handler)
+        module_logger.setLevel(level)
+        module_logger.propagate = False
+    listener.start()
+    return listener
+
 def main():
     """Main application entry point"""
+    log_listener = setup_logging()
     try:
         root = tk.Tk()
         app = ModernCPUAnalyzer(root)
@@ -6867,10 +6977,16 @@ def main():
         print(f"Application error: {e}")
     finally:
         try:
-            plt.close('all')
+            # Every figure is closed by its owner - only sweep the registry if something leaked
+            if plt.get_fignums():
+                plt.close('all')
         except:
             pass
+        log_listener.stop()
         print("Application closed successfully")
+        # Background fetch/collector threads may still be blocked on the network;
+        # nothing is left to flush, so don't wait for them
+        os._exit(0)
 
 
 if __name__ == "__main__":